@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import shutil
 import sqlite3
 import subprocess
@@ -14,6 +15,36 @@ from typing import Dict, Optional
 
 from telegram_bridge.structured_logging import emit_event
 
+_POSITIVE_FEEDBACK_MARKERS = (
+    "thanks",
+    "thank you",
+    "good job",
+    "great job",
+    "nice",
+    "perfect",
+    "excellent",
+    "all good",
+    "love this",
+)
+_NEGATIVE_FEEDBACK_MARKERS = (
+    "wrong",
+    "bad",
+    "not working",
+    "broken",
+    "failed",
+    "failure",
+    "hate",
+    "terrible",
+    "useless",
+)
+# One pass over the message instead of a substring scan per marker; the
+# lookahead also reports markers that overlap each other ("brokenice").
+_FEEDBACK_MARKER_PATTERN = re.compile(
+    "(?=("
+    + "|".join(re.escape(marker) for marker in _POSITIVE_FEEDBACK_MARKERS + _NEGATIVE_FEEDBACK_MARKERS)
+    + "))"
+)
+
 @dataclass
 class AffectiveState:
     valence: float = 0.0
@@ -133,35 +164,13 @@ def _extract_user_feedback(text: str) -> float:
     if not lowered:
         return 0.0
 
-    positive_markers = (
-        "thanks",
-        "thank you",
-        "good job",
-        "great job",
-        "nice",
-        "perfect",
-        "excellent",
-        "all good",
-        "love this",
-    )
-    negative_markers = (
-        "wrong",
-        "bad",
-        "not working",
-        "broken",
-        "failed",
-        "failure",
-        "hate",
-        "terrible",
-        "useless",
-    )
-
+    found = set(_FEEDBACK_MARKER_PATTERN.findall(lowered))
     score = 0.0
-    for marker in positive_markers:
-        if marker in lowered:
+    for marker in _POSITIVE_FEEDBACK_MARKERS:
+        if marker in found:
             score += 0.35
-    for marker in negative_markers:
-        if marker in lowered:
+    for marker in _NEGATIVE_FEEDBACK_MARKERS:
+        if marker in found:
             score -= 0.45
     if "!" in lowered and score > 0:
         score += 0.05
@@ -2,6 +2,8 @@ import logging
 import os
 import re
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from enum import Enum
@@ -12,6 +14,7 @@ from telegram_bridge.handler_models import DocumentPayload
 from telegram_bridge.media import TelegramFileDownloadSpec, download_telegram_file_to_temp
 from telegram_bridge.runtime_profile import is_whatsapp_channel
 from telegram_bridge.state_store import State
+from telegram_bridge.stream_buffer import output_tail
 from telegram_bridge.structured_logging import emit_event
 
 class AttachmentResolutionStatus(str, Enum):
@@ -30,6 +33,7 @@ def download_photo_to_temp(
     client: ChannelAdapter,
     config,
     photo_file_id: str,
+    temp_dir: Optional[str] = None,
 ) -> str:
     spec = TelegramFileDownloadSpec(
         file_id=photo_file_id,
@@ -38,6 +42,7 @@ def download_photo_to_temp(
         temp_prefix="telegram-bridge-photo-",
         default_suffix=".jpg",
         too_large_label="Image",
+        temp_dir=temp_dir,
     )
     tmp_path, _ = download_telegram_file_to_temp(client, spec)
     return tmp_path
@@ -46,6 +51,7 @@ def download_voice_to_temp(
     client: ChannelAdapter,
     config,
     voice_file_id: str,
+    temp_dir: Optional[str] = None,
 ) -> str:
     spec = TelegramFileDownloadSpec(
         file_id=voice_file_id,
@@ -54,6 +60,7 @@ def download_voice_to_temp(
         temp_prefix="telegram-bridge-voice-",
         default_suffix=".ogg",
         too_large_label="Voice file",
+        temp_dir=temp_dir,
     )
     tmp_path, _ = download_telegram_file_to_temp(client, spec)
     return tmp_path
@@ -62,6 +69,7 @@ def download_document_to_temp(
     client: ChannelAdapter,
     config,
     document: DocumentPayload,
+    temp_dir: Optional[str] = None,
 ) -> tuple[str, int]:
     spec = TelegramFileDownloadSpec(
         file_id=document.file_id,
@@ -71,6 +79,7 @@ def download_document_to_temp(
         default_suffix=".bin",
         too_large_label="File",
         suffix_hint=document.file_name,
+        temp_dir=temp_dir,
     )
     return download_telegram_file_to_temp(client, spec)
 
@@ -276,21 +285,21 @@ def resolve_voice_attachment_for_prompt(
         size_bytes=size_bytes,
     )
 
+VOICE_FILE_PLACEHOLDER = "{file}"
+VOICE_CONFIDENCE_RE = re.compile(r"VOICE_CONFIDENCE=([0-9]*\.?[0-9]+)")
+VOICE_TRANSCRIBE_CANCEL_POLL_SECONDS = 0.5
+
+class VoiceTranscriptionCancelledError(RuntimeError):
+    """Raised when a running transcription is killed because its request was canceled."""
+
 def build_voice_transcribe_command(cmd_template: List[str], voice_path: str) -> List[str]:
-    cmd: List[str] = []
-    used_placeholder = False
-    for arg in cmd_template:
-        if "{file}" in arg:
-            cmd.append(arg.replace("{file}", voice_path))
-            used_placeholder = True
-        else:
-            cmd.append(arg)
-    if not used_placeholder:
+    cmd = [arg.replace(VOICE_FILE_PLACEHOLDER, voice_path) for arg in cmd_template]
+    if not any(VOICE_FILE_PLACEHOLDER in arg for arg in cmd_template):
         cmd.append(voice_path)
     return cmd
 
 def parse_voice_confidence(stderr_text: str) -> Optional[float]:
-    matches = re.findall(r"VOICE_CONFIDENCE=([0-9]*\.?[0-9]+)", stderr_text or "")
+    matches = VOICE_CONFIDENCE_RE.findall(stderr_text or "")
     if not matches:
         return None
     try:
@@ -474,24 +483,61 @@ def maybe_suggest_voice_prefix_alias(
             reply_to_message_id=message_id,
         )
 
-def transcribe_voice(config, voice_path: str) -> Tuple[str, Optional[float]]:
+def _run_cancellable_transcription(
+    cmd: List[str],
+    timeout_seconds: float,
+    cancel_event: threading.Event,
+) -> subprocess.CompletedProcess:
+    # communicate() may be resumed after TimeoutExpired, so the same pipes are
+    # drained in short slices with a cancel check in between.
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            stdout, stderr = process.communicate(
+                timeout=max(0.0, min(VOICE_TRANSCRIBE_CANCEL_POLL_SECONDS, remaining))
+            )
+            return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+        except subprocess.TimeoutExpired:
+            cancelled = cancel_event.is_set()
+            if not cancelled and time.monotonic() < deadline:
+                continue
+            # Like the executor abort path: do not wait for grandchildren that
+            # inherited the pipes to reach EOF.
+            process.kill()
+            process.wait(timeout=5)
+            process.stdout.close()
+            process.stderr.close()
+            if cancelled:
+                raise VoiceTranscriptionCancelledError("Voice transcription canceled.")
+            raise subprocess.TimeoutExpired(cmd, timeout_seconds)
+
+def transcribe_voice(
+    config,
+    voice_path: str,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[str, Optional[float]]:
     if not config.voice_transcribe_cmd:
         raise RuntimeError("Voice transcription is not configured")
 
     cmd = build_voice_transcribe_command(config.voice_transcribe_cmd, voice_path)
     logging.info("Running voice transcription command: %s", cmd)
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=config.voice_transcribe_timeout_seconds,
-        check=False,
-    )
+    if cancel_event is not None:
+        result = _run_cancellable_transcription(cmd, config.voice_transcribe_timeout_seconds, cancel_event)
+    else:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=config.voice_transcribe_timeout_seconds,
+            check=False,
+        )
     if result.returncode != 0:
         logging.error(
             "Voice transcription failed returncode=%s stderr=%r",
             result.returncode,
-            (result.stderr or "")[-1000:],
+            output_tail(result.stderr, 1000),
         )
         raise RuntimeError("Voice transcription failed")
 
@@ -6,6 +6,7 @@ import shutil
 import sqlite3
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -165,7 +166,7 @@ class AttachmentStore:
             ).fetchall()
 
             total_bytes = 0
-            live_rows = []
+            live_rows: deque = deque()
             for row in rows:
                 local_path = str(row["local_path"] or "")
                 expires_at = float(row["expires_at"] or 0)
@@ -186,7 +187,7 @@ class AttachmentStore:
 
             if self.max_total_bytes > 0:
                 while total_bytes > self.max_total_bytes and live_rows:
-                    victim = live_rows.pop(0)
+                    victim = live_rows.popleft()
                     file_size = int(victim["file_size"] or 0)
                     total_bytes -= max(0, file_size)
                     self._expire_binary(
@@ -167,9 +167,9 @@ def clear_runtime_thread_state(state: State) -> Dict[str, int]:
         cleared_thread_count = 0
         cleared_worker_session_count = 0
         cleared_canonical_session_count = 0
+        emptied_scope_keys = []
         with state.lock:
-            for scope_key in list(state.chat_sessions):
-                session = state.chat_sessions[scope_key]
+            for scope_key, session in state.chat_sessions.items():
                 changed = False
                 if session.thread_id.strip():
                     session.thread_id = ""
@@ -188,7 +188,9 @@ def clear_runtime_thread_state(state: State) -> Dict[str, int]:
                 if changed:
                     cleared_canonical_session_count += 1
                 if canonical_session_is_empty(session):
-                    del state.chat_sessions[scope_key]
+                    emptied_scope_keys.append(scope_key)
+            for scope_key in emptied_scope_keys:
+                del state.chat_sessions[scope_key]
         persist_canonical_sessions(state)
         return {
             "threads": cleared_thread_count,
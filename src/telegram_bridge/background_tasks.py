@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import logging
+import queue
 import threading
+import time
+from concurrent.futures import Future
 from typing import Callable
 
 def start_daemon_thread(
@@ -16,3 +20,265 @@ def start_daemon_thread(
     )
     worker.start()
     return worker
+
+class DaemonWorkerPool:
+    """Run submitted tasks on at most max_workers daemon threads, FIFO.
+
+    concurrent.futures joins its non-daemon workers at interpreter exit with
+    no timeout, so one stuck request would hold up shutdown; these workers
+    are started with start_daemon_thread and never block exit.
+    """
+
+    def __init__(self, max_workers: int, name: str = "bridge-worker") -> None:
+        self._max_workers = max(1, max_workers)
+        self._name = name
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._workers: list[threading.Thread] = []
+        self._shutdown = False
+
+    def submit(self, target: Callable[..., object], *args: object) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            self._queue.put((future, target, args))
+            if len(self._workers) < self._max_workers:
+                self._workers.append(
+                    start_daemon_thread(self._work, name=f"{self._name}-{len(self._workers)}")
+                )
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            worker_count = len(self._workers)
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        for _ in range(worker_count):
+            self._queue.put(None)
+        if wait:
+            self.join(None)
+
+    def join(self, timeout_seconds: float | None) -> bool:
+        """Wait for shut-down workers to exit; False if any outlived the timeout."""
+        deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            worker.join(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return not any(worker.is_alive() for worker in workers)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, target, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = target(*args)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+def build_worker_pool(max_workers: int) -> DaemonWorkerPool:
+    return DaemonWorkerPool(max_workers)
+
+def _log_pooled_task_failure(future: Future) -> None:
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logging.error("Background worker task failed", exc_info=exc)
+
+def submit_pooled_task(
+    pool: DaemonWorkerPool,
+    target: Callable[..., None],
+    *args: object,
+) -> Future:
+    future = pool.submit(target, *args)
+    future.add_done_callback(_log_pooled_task_failure)
+    return future
+
+# Replies that pile up for the same chat are merged into one send while the
+# merged text stays safely under Telegram's 4096-character message limit.
+OUTBOUND_COALESCE_MAX_CHARS = 4080
+
+class OutboundMessageQueue:
+    """Deliver fire-and-forget replies from one sender thread, in FIFO order."""
+
+    _STOP = object()
+
+    def __init__(self, name: str = "bridge-outbound") -> None:
+        self._name = name
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+
+    def send_message(
+        self,
+        client: object,
+        chat_id: int,
+        text: str,
+        *,
+        reply_to_message_id: int | None = None,
+        message_thread_id: int | None = None,
+    ) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("outbound message queue is closed")
+            if self._worker is None:
+                self._worker = start_daemon_thread(self._drain, name=self._name)
+            self._queue.put((client, chat_id, text, reply_to_message_id, message_thread_id))
+
+    def _drain(self) -> None:
+        item = None
+        while True:
+            if item is None:
+                item = self._queue.get()
+            if item is self._STOP:
+                return
+            (client, chat_id, text, reply_to_message_id, message_thread_id), item = self._coalesce(item)
+            try:
+                client.send_message(
+                    chat_id,
+                    text,
+                    reply_to_message_id=reply_to_message_id,
+                    message_thread_id=message_thread_id,
+                )
+            except Exception:
+                logging.exception("Failed to deliver queued reply to chat_id=%s", chat_id)
+
+    def _coalesce(self, item: tuple) -> tuple[tuple, object]:
+        """Fold already-queued replies to the same chat and reply target into item.
+
+        Returns the merged item and the first queued entry that could not be
+        merged (None when the queue ran dry).
+        """
+        client, chat_id, text, reply_to_message_id, message_thread_id = item
+        while True:
+            try:
+                following = self._queue.get_nowait()
+            except queue.Empty:
+                following = None
+            if (
+                following is None
+                or following is self._STOP
+                or following[0] is not client
+                or following[1] != chat_id
+                or following[3:] != (reply_to_message_id, message_thread_id)
+                or len(text) + 1 + len(following[2]) > OUTBOUND_COALESCE_MAX_CHARS
+            ):
+                return (client, chat_id, text, reply_to_message_id, message_thread_id), following
+            text = f"{text}\n{following[2]}"
+
+    def close(self, timeout_seconds: float = 5.0) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+        if worker is None:
+            return
+        self._queue.put(self._STOP)
+        worker.join(timeout=timeout_seconds)
+
+def send_polling_reply(
+    state: object,
+    client: object,
+    chat_id: int,
+    text: str,
+    *,
+    reply_to_message_id: int | None = None,
+    message_thread_id: int | None = None,
+) -> None:
+    """Reply from the polling thread without waiting on the send round-trip.
+
+    Uses the state's outbound sender when one is configured and still open;
+    otherwise sends inline.
+    """
+    outbound_messages = getattr(state, "outbound_messages", None)
+    if outbound_messages is not None:
+        try:
+            outbound_messages.send_message(
+                client,
+                chat_id,
+                text,
+                reply_to_message_id=reply_to_message_id,
+                message_thread_id=message_thread_id,
+            )
+            return
+        except RuntimeError:
+            pass
+    client.send_message(
+        chat_id,
+        text,
+        reply_to_message_id=reply_to_message_id,
+        message_thread_id=message_thread_id,
+    )
+
+class DebouncedFlusher:
+    """Coalesce bursts of mark_dirty() calls into one flush per delay window."""
+
+    def __init__(
+        self,
+        flush: Callable[[], None],
+        delay_seconds: float = 0.5,
+        name: str = "bridge-flusher",
+    ) -> None:
+        self._flush = flush
+        self._delay_seconds = delay_seconds
+        self._name = name
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+
+    def mark_dirty(self) -> bool:
+        """Schedule a flush; returns False once closed so callers flush inline."""
+        with self._lock:
+            if self._closed:
+                return False
+            if self._worker is None:
+                self._worker = start_daemon_thread(self._run, name=self._name)
+            self._dirty.set()
+        return True
+
+    def _run(self) -> None:
+        while True:
+            self._dirty.wait()
+            self._stop.wait(self._delay_seconds)
+            if self._stop.is_set():
+                return
+            self._dirty.clear()
+            self._flush_logged()
+
+    def _flush_logged(self) -> None:
+        try:
+            self._flush()
+        except Exception:
+            logging.exception("Debounced flush %s failed", self._name)
+
+    def close(self, timeout_seconds: float = 5.0) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+        if worker is None:
+            return
+        self._stop.set()
+        self._dirty.set()
+        worker.join(timeout=timeout_seconds)
+        self._flush_logged()
@@ -0,0 +1,20 @@
+import random
+from typing import Callable
+
+
+def compute_backoff_seconds(
+    base_seconds: float,
+    failure_count: int,
+    *,
+    cap_seconds: float,
+    jitter_ratio: float = 0.2,
+    uniform_fn: Callable[[float, float], float] = random.uniform,
+) -> float:
+    """Exponential delay for the Nth consecutive failure (0-based), with +/- jitter."""
+    base = max(0.0, float(base_seconds))
+    exponent = max(0, min(int(failure_count), 16))
+    delay = min(cap_seconds, base * (2**exponent))
+    if delay <= 0:
+        return 0.0
+    jitter = max(0.0, min(jitter_ratio, 1.0))
+    return max(0.0, min(cap_seconds, delay * (1.0 + uniform_fn(-jitter, jitter))))
@@ -29,7 +29,16 @@ def _identity_config(config: Config):
     return getattr(config, "identity", config)
 
 
-def drop_pending_updates(client: ChannelAdapter) -> int:
+def _max_next_offset(updates: List[Dict[str, object]], offset: int) -> int:
+    next_offset = offset
+    for update in updates:
+        update_id = update.get("update_id")
+        if isinstance(update_id, int):
+            next_offset = max(next_offset, update_id + 1)
+    return next_offset
+
+
+def _drain_pending_updates(client: ChannelAdapter) -> Tuple[int, int]:
     offset = 0
     dropped = 0
 
@@ -39,12 +48,7 @@ def drop_pending_updates(client: ChannelAdapter) -> int:
             break
 
         dropped += len(updates)
-        next_offset = offset
-        for update in updates:
-            update_id = update.get("update_id")
-            if isinstance(update_id, int):
-                next_offset = max(next_offset, update_id + 1)
-
+        next_offset = _max_next_offset(updates, offset)
         if next_offset == offset:
             logging.warning(
                 "Startup backlog discard could not advance offset; stopping discard loop."
@@ -53,8 +57,22 @@ def drop_pending_updates(client: ChannelAdapter) -> int:
 
         offset = next_offset
 
+    return offset, dropped
+
+
+def drop_pending_updates(client: ChannelAdapter) -> int:
+    # offset=-1 makes Telegram forget everything but the newest update in one
+    # round trip; acknowledging that update's id + 1 drops the whole backlog.
+    latest_updates = client.get_updates(-1, timeout_seconds=0)
+    offset = _max_next_offset(latest_updates, 0)
+    dropped = len(latest_updates)
+    discard_mode = "latest_offset"
+    if latest_updates and offset == 0:
+        offset, dropped = _drain_pending_updates(client)
+        discard_mode = "drain_loop"
+
     if dropped:
-        logging.info("Dropped %s queued Telegram update(s) at startup.", dropped)
+        logging.info("Dropped queued Telegram update backlog at startup (next_offset=%s).", offset)
     else:
         logging.info("No queued Telegram updates found at startup.")
     emit_event(
@@ -62,6 +80,7 @@ def drop_pending_updates(client: ChannelAdapter) -> int:
         fields={
             "dropped_updates": dropped,
             "next_offset": offset,
+            "discard_mode": discard_mode,
         },
     )
     return offset
@@ -107,7 +126,12 @@ def compute_initial_update_offset(
     identity = _identity_config(config)
     offset_state_path = build_update_offset_state_path(core.state_dir, identity.channel_plugin)
     saved_offset = load_saved_update_offset(offset_state_path)
-    queue_min_update_id, queue_max_update_id = inspect_channel_update_bounds(client)
+    queue_min_update_id: Optional[int] = None
+    queue_max_update_id: Optional[int] = None
+    # The queue bounds only validate a saved offset; with none saved there is
+    # nothing to check, so skip the extra full-queue getUpdates round trip.
+    if saved_offset > 0:
+        queue_min_update_id, queue_max_update_id = inspect_channel_update_bounds(client)
 
     offset = saved_offset
     offset_reset = False
@@ -1,6 +1,7 @@
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Optional
 
@@ -12,6 +13,11 @@ from telegram_bridge.auth_state import (
     compute_current_auth_fingerprint,
 )
 from telegram_bridge.attachment_store import AttachmentStore
+from telegram_bridge.background_tasks import (
+    DebouncedFlusher,
+    OutboundMessageQueue,
+    build_worker_pool,
+)
 from telegram_bridge.bridge_state_bootstrap import (
     build_bridge_state_paths,
     build_policy_fingerprint_state_path,
@@ -22,14 +28,18 @@ from telegram_bridge.bridge_state_bootstrap import (
 )
 from telegram_bridge.codex_app_server import live_codex_turn_is_active, try_steer_live_codex_turn
 from telegram_bridge.command_routing import handle_known_command
+from telegram_bridge.conversation_scope import parse_telegram_scope_key
 from telegram_bridge.diary_processing import queue_diary_capture
 from telegram_bridge.diary_store import diary_mode_enabled
+from telegram_bridge.executor import kill_active_executors
 from telegram_bridge.request_prompt_processing import emit_phase_timing
 from telegram_bridge.request_starts import start_message_worker, start_youtube_worker
 from telegram_bridge.runtime_config import Config
+from telegram_bridge.transport import close_idle_connections
 from telegram_bridge.session_manager import compute_policy_fingerprint, ensure_chat_worker_session, mark_busy
 from telegram_bridge.engine_controls import resolve_engine_for_scope
 from telegram_bridge.response_delivery import register_cancel_event, request_chat_cancel
+from telegram_bridge.scope_state_store import close_state_journals
 from telegram_bridge.state_store import (
     CanonicalSession,
     State,
@@ -44,6 +54,18 @@ from telegram_bridge.structured_logging import emit_event
 from telegram_bridge.update_flow import UpdateFlowDependencies
 from telegram_bridge.voice_alias_learning import VoiceAliasLearningStore
 
+INTERRUPTED_NOTICE_TEXT = (
+    "Your previous request was interrupted because the bridge restarted. "
+    "Please resend it."
+)
+INTERRUPTED_NOTICE_MAX_WORKERS = 8
+# Replies rebind thread ids in bursts; persist them at most this often.
+CHAT_THREAD_FLUSH_DELAY_SECONDS = 0.5
+# Running requests are cancelled on shutdown; this bounds the wait for their
+# workers to wind down before the stores they write to are closed.
+WORKER_POOL_SHUTDOWN_TIMEOUT_SECONDS = 10.0
+WORKER_SESSION_FLUSH_DELAY_SECONDS = 0.5
+
 
 def _core_config(config: Config):
     return getattr(config, "core", config)
@@ -89,9 +111,29 @@ def build_update_flow_dependencies() -> UpdateFlowDependencies:
     )
 
 
+def _cancel_running_requests(state: State) -> None:
+    with state.lock:
+        cancel_events = list(state.cancel_events.values())
+    for cancel_event in cancel_events:
+        cancel_event.set()
+
+
 def close_runtime_bootstrap(bootstrap: RuntimeBootstrap) -> None:
-    closed_ids = set()
     state = getattr(bootstrap, "state", None)
+    # Stop workers first: queued work is dropped and running requests are
+    # cancelled, so nothing is still writing when the stores close below.
+    worker_pool = getattr(state, "worker_pool", None)
+    if worker_pool is not None:
+        worker_pool.shutdown(wait=False, cancel_futures=True)
+    if state is not None:
+        _cancel_running_requests(state)
+    kill_active_executors()
+    if worker_pool is not None and not worker_pool.join(WORKER_POOL_SHUTDOWN_TIMEOUT_SECONDS):
+        logging.warning(
+            "Bridge workers still running %.0fs after shutdown was requested.",
+            WORKER_POOL_SHUTDOWN_TIMEOUT_SECONDS,
+        )
+    closed_ids = set()
     for resource in (
         getattr(state, "voice_alias_learning_store", None),
         getattr(state, "attachment_store", None),
@@ -108,6 +150,17 @@ def close_runtime_bootstrap(bootstrap: RuntimeBootstrap) -> None:
             close()
         except Exception:
             logging.exception("Failed to close runtime resource %r during bridge shutdown.", resource)
+    outbound_messages = getattr(state, "outbound_messages", None)
+    if outbound_messages is not None:
+        outbound_messages.close()
+    for flusher in (
+        getattr(state, "chat_thread_flusher", None),
+        getattr(state, "worker_session_flusher", None),
+    ):
+        if flusher is not None:
+            flusher.close()
+    close_state_journals()
+    close_idle_connections()
 
 
 def clear_thread_state_for_policy_change(
@@ -308,6 +361,9 @@ def build_runtime_bootstrap(config: Config) -> RuntimeBootstrap:
         worker_sessions_path=state_paths.get("worker_sessions", ""),
         in_flight_requests=loaded_in_flight if not session.canonical_sessions_enabled else {},
         in_flight_path=state_paths.get("in_flight_requests", ""),
+        persist_durable=bool(getattr(session, "state_persist_durable", False)),
+        worker_pool=build_worker_pool(getattr(session, "message_workers_max", 16)),
+        outbound_messages=OutboundMessageQueue(),
         canonical_sessions_enabled=session.canonical_sessions_enabled,
         canonical_legacy_mirror_enabled=session.canonical_legacy_mirror_enabled,
         canonical_sqlite_enabled=(
@@ -323,6 +379,16 @@ def build_runtime_bootstrap(config: Config) -> RuntimeBootstrap:
         auth_fingerprint_path=build_auth_fingerprint_state_path(core.state_dir),
         auth_fingerprint=current_auth_fingerprint,
     )
+    state.chat_thread_flusher = DebouncedFlusher(
+        lambda: persist_chat_threads(state),
+        delay_seconds=CHAT_THREAD_FLUSH_DELAY_SECONDS,
+        name="bridge-chat-threads",
+    )
+    state.worker_session_flusher = DebouncedFlusher(
+        lambda: persist_worker_sessions(state),
+        delay_seconds=WORKER_SESSION_FLUSH_DELAY_SECONDS,
+        name="bridge-worker-sessions",
+    )
     return RuntimeBootstrap(
         state=state,
         state_paths=state_paths,
@@ -349,3 +415,42 @@ def persist_bootstrap_state(config: Config, bootstrap: RuntimeBootstrap) -> None
                 bootstrap.loaded_in_flight,
             )
         persist_canonical_sessions(bootstrap.state)
+
+
+def notify_interrupted_requests(config: Config, client, interrupted) -> None:
+    allowed_chat_ids = _core_config(config).allowed_chat_ids
+    targets = []
+    for scope_key in sorted(interrupted):
+        try:
+            target = parse_telegram_scope_key(scope_key)
+        except ValueError:
+            continue
+        if target.chat_id not in allowed_chat_ids:
+            continue
+        targets.append((scope_key, target))
+    if not targets:
+        return
+
+    # The client's send throttle already paces these under Telegram's limits.
+    def send_notice(item) -> None:
+        scope_key, target = item
+        try:
+            client.send_message(
+                target.chat_id,
+                INTERRUPTED_NOTICE_TEXT,
+                message_thread_id=target.message_thread_id,
+            )
+        except Exception:
+            logging.exception(
+                "Failed to send restart-interruption notice for scope=%s",
+                scope_key,
+            )
+
+    if len(targets) == 1:
+        send_notice(targets[0])
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(INTERRUPTED_NOTICE_MAX_WORKERS, len(targets)),
+        thread_name_prefix="bridge-interrupted-notice",
+    ) as pool:
+        list(pool.map(send_notice, targets))
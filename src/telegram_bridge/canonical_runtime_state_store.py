@@ -9,9 +9,9 @@ from telegram_bridge.canonical_state_store import (
 )
 from telegram_bridge.request_runtime_state_store import (
     persist_in_flight_requests,
-    persist_worker_sessions,
+    request_worker_sessions_persist,
 )
-from telegram_bridge.scope_state_store import persist_chat_threads, persist_json_state_file
+from telegram_bridge.scope_state_store import persist_json_state_file, request_chat_threads_persist
 from telegram_bridge.state_models import ScopeKey, State, normalize_scope_key
 
 
@@ -23,9 +23,9 @@ def _persist_legacy_state(
     in_flight_requests: bool = False,
 ) -> None:
     if chat_threads:
-        persist_chat_threads(state)
+        request_chat_threads_persist(state)
     if worker_sessions:
-        persist_worker_sessions(state)
+        request_worker_sessions_persist(state)
     if in_flight_requests:
         persist_in_flight_requests(state)
 
@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional, Protocol
+from typing import BinaryIO, Dict, List, Optional, Protocol
 
+from telegram_bridge.media import DOWNLOAD_CHUNK_BYTES
 from telegram_bridge.transport import TelegramClient
 
 class ChannelAdapter(Protocol):
@@ -106,9 +107,20 @@ class ChannelAdapter(Protocol):
         target_path: str,
         max_bytes: int,
         size_label: str = "File",
+        chunk_size: int = DOWNLOAD_CHUNK_BYTES,
     ) -> None:
         ...
 
+    def download_file_to_handle(
+        self,
+        file_path: str,
+        handle: BinaryIO,
+        max_bytes: int,
+        size_label: str = "File",
+        chunk_size: int = DOWNLOAD_CHUNK_BYTES,
+    ) -> int:
+        ...
+
 class TelegramChannelAdapter:
     channel_name = "telegram"
     supports_message_edits = True
@@ -262,10 +274,28 @@ class TelegramChannelAdapter:
         target_path: str,
         max_bytes: int,
         size_label: str = "File",
+        chunk_size: int = DOWNLOAD_CHUNK_BYTES,
     ) -> None:
         self._client.download_file_to_path(
             file_path=file_path,
             target_path=target_path,
             max_bytes=max_bytes,
             size_label=size_label,
+            chunk_size=chunk_size,
+        )
+
+    def download_file_to_handle(
+        self,
+        file_path: str,
+        handle: BinaryIO,
+        max_bytes: int,
+        size_label: str = "File",
+        chunk_size: int = DOWNLOAD_CHUNK_BYTES,
+    ) -> int:
+        return self._client.download_file_to_handle(
+            file_path=file_path,
+            handle=handle,
+            max_bytes=max_bytes,
+            size_label=size_label,
+            chunk_size=chunk_size,
         )
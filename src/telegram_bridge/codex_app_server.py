@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import re
 import subprocess
 import threading
 import time
@@ -20,6 +21,19 @@ _SESSION_REGISTRY: Dict[str, "CodexAppServerSession"] = {}
 FOLLOW_UP_STEER_DEBOUNCE_SECONDS = 0.6
 FOLLOW_UP_STEER_IDLE_GRACE_SECONDS = 0.35
 FOLLOW_UP_STEER_MAX_WAIT_SECONDS = 2.0
+# Codex prints this advisory on every start when bwrap is not on PATH; it is
+# matched per stderr line without lowercasing a copy of each line.
+_BUNDLED_BUBBLEWRAP_NOTICE_PATTERNS = tuple(
+    re.compile(re.escape(marker), re.IGNORECASE)
+    for marker in (
+        "could not find bubblewrap on path",
+        "will use the bundled bubblewrap in the meantime",
+    )
+)
+
+
+def _is_bundled_bubblewrap_notice(line: str) -> bool:
+    return all(pattern.search(line) for pattern in _BUNDLED_BUBBLEWRAP_NOTICE_PATTERNS)
 
 
 def _engines_config(config):
@@ -224,13 +238,7 @@ class CodexAppServerSession:
         return self._sandbox_mode in {"off", "danger-full-access"}
 
     def _should_suppress_stderr_line(self, line: str) -> bool:
-        lower = line.lower()
-        if not self._sandbox_unrestricted():
-            return False
-        return (
-            "could not find bubblewrap on path" in lower
-            and "will use the bundled bubblewrap in the meantime" in lower
-        )
+        return self._sandbox_unrestricted() and _is_bundled_bubblewrap_notice(line)
 
     def run_turn(
         self,
@@ -496,6 +504,10 @@ class CodexAppServerSession:
         "unshare",
         "clone",
     ]
+    _SANDBOX_FAIL_OPEN_PATTERN = re.compile(
+        "|".join(map(re.escape, SANDBOX_FAIL_OPEN_KEYWORDS)),
+        re.IGNORECASE,
+    )
 
     def _start_process(self, *, fail_open_retry: bool = False) -> None:
         process = self.process
@@ -748,13 +760,9 @@ class CodexAppServerSession:
     def _check_fail_open_on_stderr(self, line: str) -> None:
         if self._fail_open_checked:
             return
-        lower = line.lower()
-        if (
-            "could not find bubblewrap on path" in lower
-            and "will use the bundled bubblewrap in the meantime" in lower
-        ):
+        if _is_bundled_bubblewrap_notice(line):
             return
-        if any(keyword.lower() in lower for keyword in self.SANDBOX_FAIL_OPEN_KEYWORDS):
+        if self._SANDBOX_FAIL_OPEN_PATTERN.search(line):
             self._maybe_fail_open_restart(
                 RuntimeError(f"Sandbox init failure detected on stderr: {line[:200]}")
             )
@@ -770,9 +778,9 @@ class CodexAppServerSession:
             return
         if rc == 0:
             return
-        recent_stderr = "\n".join(self._stderr_buffer[-30:])
-        lower_recent = recent_stderr.lower()
-        if any(keyword.lower() in lower_recent for keyword in self.SANDBOX_FAIL_OPEN_KEYWORDS):
+        # Keywords never span lines, so search the buffered lines in place
+        # instead of joining and lowercasing a combined copy.
+        if any(self._SANDBOX_FAIL_OPEN_PATTERN.search(line) for line in self._stderr_buffer[-30:]):
             self._maybe_fail_open_restart(
                 RuntimeError(f"Sandbox exit code={rc} with sandbox stderr")
             )
@@ -1,10 +1,24 @@
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Iterable, Optional
 
 from telegram_bridge.handler_models import KnownCommandContext
 
 KnownCommandFn = Callable[[KnownCommandContext], bool]
 
 
+def build_known_command_table(
+    known_command_handlers: Dict[str, KnownCommandFn],
+    *,
+    help_command_aliases: Iterable[str],
+    cancel_command_aliases: Iterable[str],
+    handle_help_known_command: KnownCommandFn,
+    handle_cancel_known_command: KnownCommandFn,
+) -> Dict[str, KnownCommandFn]:
+    table = dict(known_command_handlers)
+    table.update((alias, handle_cancel_known_command) for alias in cancel_command_aliases)
+    table.update((alias, handle_help_known_command) for alias in help_command_aliases)
+    return table
+
+
 def handle_known_command(
     state,
     config,
@@ -28,29 +42,28 @@ def handle_known_command(
     if command is None:
         return False
 
-    ctx = known_command_context_cls(
-        state=state,
-        config=config,
-        client=client,
-        scope_key=scope_key,
-        chat_id=chat_id,
-        message_thread_id=message_thread_id,
-        message_id=message_id,
-        raw_text=raw_text,
-    )
-
-    if command in help_command_aliases:
-        return handle_help_known_command(ctx)
-    if command in cancel_command_aliases:
-        return handle_cancel_known_command(ctx)
-
     handler = known_command_handlers.get(command)
-    if handler is not None:
-        return handler(ctx)
-
-    if diary_mode_enabled(config):
-        diary_handler = diary_command_handlers.get(command)
-        if diary_handler is not None:
-            return diary_handler(ctx)
+    if handler is None:
+        if command in help_command_aliases:
+            handler = handle_help_known_command
+        elif command in cancel_command_aliases:
+            handler = handle_cancel_known_command
+        elif diary_mode_enabled(config):
+            handler = diary_command_handlers.get(command)
+    if handler is None:
+        # Plain text that merely starts with "/" is the common miss; skip
+        # building a context for it.
+        return False
 
-    return False
+    return handler(
+        known_command_context_cls(
+            state=state,
+            config=config,
+            client=client,
+            scope_key=scope_key,
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+            message_id=message_id,
+            raw_text=raw_text,
+        )
+    )
@@ -229,6 +229,15 @@ KNOWN_COMMAND_HANDLERS: Dict[str, KnownCommandFn] = {
     "/voice-alias": _handle_voice_alias_known_command,
 }
 
+# Help/cancel aliases folded into the main table so routing is one dict lookup.
+ROUTED_COMMAND_HANDLERS: Dict[str, KnownCommandFn] = command_known_routing.build_known_command_table(
+    KNOWN_COMMAND_HANDLERS,
+    help_command_aliases=HELP_COMMAND_ALIASES,
+    cancel_command_aliases=CANCEL_COMMAND_ALIASES,
+    handle_help_known_command=_handle_help_known_command,
+    handle_cancel_known_command=_handle_cancel_known_command,
+)
+
 DIARY_COMMAND_HANDLERS: Dict[str, KnownCommandFn] = {
     "/today": _handle_diary_today_known_command,
     "/queue": _handle_diary_queue_known_command,
@@ -260,7 +269,7 @@ def handle_known_command(
         cancel_command_aliases=CANCEL_COMMAND_ALIASES,
         handle_help_known_command=_handle_help_known_command,
         handle_cancel_known_command=_handle_cancel_known_command,
-        known_command_handlers=KNOWN_COMMAND_HANDLERS,
+        known_command_handlers=ROUTED_COMMAND_HANDLERS,
         diary_mode_enabled=diary_mode_enabled,
         diary_command_handlers=DIARY_COMMAND_HANDLERS,
     )
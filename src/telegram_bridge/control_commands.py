@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 from zoneinfo import ZoneInfo
 
+from telegram_bridge.background_tasks import send_polling_reply
 from telegram_bridge.channel_adapter import ChannelAdapter
 from telegram_bridge.dream_loop_state import (
     LATEST_RUN_STATE,
@@ -52,8 +53,12 @@ def _send_command_reply(
     message_thread_id: Optional[int],
     message_id: Optional[int],
     text: str,
+    state: Optional[State] = None,
 ) -> None:
-    client.send_message(
+    # Control commands run on the polling thread; a slow send must not stall polling.
+    send_polling_reply(
+        state,
+        client,
         chat_id,
         text,
         reply_to_message_id=message_id,
@@ -90,6 +95,7 @@ def handle_reset_command(
             message_thread_id,
             message_id,
             "Context reset. Your next message starts a new conversation." + extra,
+            state=state,
         )
         return
     if handled_stale_warning:
@@ -99,6 +105,7 @@ def handle_reset_command(
             message_thread_id,
             message_id,
             "No saved context was found for this chat. Outstanding stale-context warning marked handled.",
+            state=state,
         )
         return
     _send_command_reply(
@@ -107,6 +114,7 @@ def handle_reset_command(
         message_thread_id,
         message_id,
         "No saved context was found for this chat.",
+        state=state,
     )
 
 
@@ -198,6 +206,7 @@ def handle_restart_command(
             message_thread_id,
             message_id,
             "Restart is already in progress.",
+            state=state,
         )
         return
     if status == "already_queued":
@@ -207,6 +216,7 @@ def handle_restart_command(
             message_thread_id,
             message_id,
             "Restart is already queued and will run after current work completes.",
+            state=state,
         )
         return
     if status == "queued":
@@ -216,6 +226,7 @@ def handle_restart_command(
             message_thread_id,
             message_id,
             f"Safe restart queued. Waiting for {busy_count} active request(s) to finish.",
+            state=state,
         )
         return
 
@@ -248,6 +259,7 @@ def handle_cancel_command(
             message_thread_id,
             message_id,
             CANCEL_REQUESTED_MESSAGE,
+            state=state,
         )
         return
     if status == "already_requested":
@@ -257,6 +269,7 @@ def handle_cancel_command(
             message_thread_id,
             message_id,
             CANCEL_ALREADY_REQUESTED_MESSAGE,
+            state=state,
         )
         return
     if status == "unavailable":
@@ -266,6 +279,7 @@ def handle_cancel_command(
             message_thread_id,
             message_id,
             "Active request cannot be canceled at this stage. Please wait a few seconds and retry.",
+            state=state,
         )
         return
     _send_command_reply(
@@ -274,4 +288,5 @@ def handle_cancel_command(
         message_thread_id,
         message_id,
         CANCEL_NO_ACTIVE_MESSAGE,
+        state=state,
     )
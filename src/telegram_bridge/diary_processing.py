@@ -1,12 +1,19 @@
 import copy
 import datetime as dt
+from collections import deque
 import logging
 import os
 import subprocess
+import threading
 import time
 from typing import Dict, List, Optional
 
-from telegram_bridge.attachment_processing import download_photo_to_temp, download_voice_to_temp, transcribe_voice
+from telegram_bridge.attachment_processing import (
+    VoiceTranscriptionCancelledError,
+    download_photo_to_temp,
+    download_voice_to_temp,
+    transcribe_voice,
+)
 from telegram_bridge.channel_adapter import ChannelAdapter
 from telegram_bridge.engine_controls import build_engine_runtime_config, configured_default_engine
 from telegram_bridge.diary_store import (
@@ -26,6 +33,7 @@ from telegram_bridge.request_processing import build_progress_reporter
 from telegram_bridge.response_delivery import (
     finalize_request_progress,
     register_cancel_event,
+    send_canceled_response,
     send_generic_worker_error_response,
     start_background_worker,
 )
@@ -109,16 +117,19 @@ def transcribe_voice_for_diary_batch(
     config,
     client: ChannelAdapter,
     voice_file_id: str,
+    cancel_event: Optional[threading.Event] = None,
 ) -> tuple[Optional[str], Optional[str]]:
     voice_path: Optional[str] = None
     try:
         voice_path = download_voice_to_temp(client, config, voice_file_id)
-        transcript, _ = transcribe_voice(config, voice_path)
+        transcript, _ = transcribe_voice(config, voice_path, cancel_event=cancel_event)
         return transcript, None
     except ValueError:
         return None, config.voice_transcribe_empty_message
     except subprocess.TimeoutExpired:
         return None, config.timeout_message
+    except VoiceTranscriptionCancelledError:
+        raise
     except Exception:
         return None, config.voice_transcribe_error_message
     finally:
@@ -216,6 +227,7 @@ def process_diary_batch(
                     config=config,
                     client=client,
                     voice_file_id=voice_file_id,
+                    cancel_event=cancel_event,
                 )
                 if transcript:
                     voice_transcripts.append(transcript)
@@ -282,6 +294,14 @@ def process_diary_batch(
                 "text_count": len(text_blocks),
             },
         )
+    except VoiceTranscriptionCancelledError:
+        progress.mark_failure("Execution canceled.")
+        send_canceled_response(
+            client,
+            pending.chat_id,
+            pending.latest_message_id,
+            pending.message_thread_id,
+        )
     except Exception:
         logging.exception("Diary batch save failed for chat_id=%s", pending.chat_id)
         progress.mark_failure("Diary save failed.")
@@ -338,7 +358,7 @@ def diary_capture_batch_worker(
         with state.lock:
             pending = state.pending_diary_batches.pop(scope_key, None)
             if pending is not None:
-                queue = state.queued_diary_batches.setdefault(scope_key, [])
+                queue = state.queued_diary_batches.setdefault(scope_key, deque())
                 queue.append(pending)
                 queue_depth = len(queue)
             else:
@@ -380,8 +400,8 @@ def diary_queue_worker(
                 time.sleep(0.5)
                 continue
             with state.lock:
-                queue = state.queued_diary_batches.get(scope_key, [])
-                pending = queue.pop(0) if queue else None
+                queue = state.queued_diary_batches.get(scope_key)
+                pending = queue.popleft() if queue else None
                 if not queue:
                     state.queued_diary_batches.pop(scope_key, None)
             if pending is None:
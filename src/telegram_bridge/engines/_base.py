@@ -45,32 +45,28 @@ def _communicate_process_with_cancel(
     cancel_message: str,
     input_text: Optional[str] = None,
 ) -> tuple[str, str]:
-    result: dict[str, object] = {}
-    done = threading.Event()
-
-    def _worker() -> None:
-        try:
-            stdout, stderr = process.communicate(input=input_text, timeout=timeout)
-            result["stdout"] = stdout
-            result["stderr"] = stderr
-        except BaseException as exc:
-            result["exception"] = exc
-        finally:
-            done.set()
-
-    start_daemon_thread(_worker)
-    while not done.wait(0.1):
-        if cancel_event is not None and cancel_event.is_set():
+    # Poll communicate() on the worker's own thread instead of parking a
+    # helper thread per engine call; partial I/O carries over between calls.
+    deadline = time.monotonic() + timeout
+    pending_input = input_text
+    while True:
+        cancelled = cancel_event is not None and cancel_event.is_set()
+        remaining = deadline - time.monotonic()
+        if cancelled or remaining <= 0:
             process.kill()
-            done.wait(5)
-            raise ExecutorCancelledError(cancel_message)
-
-    exc = result.get("exception")
-    if isinstance(exc, BaseException):
-        raise exc
-    stdout = result.get("stdout")
-    stderr = result.get("stderr")
-    return str(stdout or ""), str(stderr or "")
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+            if cancelled:
+                raise ExecutorCancelledError(cancel_message)
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        try:
+            stdout, stderr = process.communicate(input=pending_input, timeout=min(0.1, remaining))
+        except subprocess.TimeoutExpired:
+            pending_input = None
+            continue
+        return str(stdout or ""), str(stderr or "")
 
 def _run_blocking_with_cancel(
     func: Callable[[], str],
@@ -8,10 +8,23 @@ from typing import Optional
 
 from telegram_bridge.engines._base import ProgressCallback
 from telegram_bridge.engines.codex import CodexEngineAdapter
-from telegram_bridge.executor import ExecutorCancelledError, parse_executor_output
+from telegram_bridge.executor import (
+    ExecutorCancelledError,
+    cached_executor_result_output,
+    parse_executor_output,
+)
 from mavali_eth.service_runtime import extract_current_message_text
 
 
+def _executor_result_output(result: subprocess.CompletedProcess[str]) -> tuple[Optional[str], str]:
+    # Codex runs already parsed their stream incrementally; only fall back to
+    # re-parsing stdout for results that did not cache it.
+    cached_output = cached_executor_result_output(result)
+    if cached_output is not None:
+        return cached_output
+    return parse_executor_output(result.stdout or "")
+
+
 class MavaliEthEngineAdapter:
     engine_name = "mavali_eth"
     _CONFIRM_INVITE_RE = re.compile(r"reply\s+`?confirm`?\s+to\s+execute", re.IGNORECASE)
@@ -164,7 +177,7 @@ class MavaliEthEngineAdapter:
                     progress_callback=progress_callback,
                     cancel_event=cancel_event,
                 )
-                _, translation_output = parse_executor_output(translation_result.stdout or "")
+                _, translation_output = _executor_result_output(translation_result)
                 translated_command = self._extract_translated_command(translation_output)
                 if (
                     translated_command
@@ -192,7 +205,7 @@ class MavaliEthEngineAdapter:
                     progress_callback=progress_callback,
                     cancel_event=cancel_event,
                 )
-                fallback_thread_id, fallback_output = parse_executor_output(fallback_result.stdout or "")
+                fallback_thread_id, fallback_output = _executor_result_output(fallback_result)
                 if self._invites_confirmation(fallback_output) and not self._has_live_pending_action(
                     service,
                     resolved_session_key,
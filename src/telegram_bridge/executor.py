@@ -1,19 +1,50 @@
+import codecs
+import io
 import json
+import locale
 import logging
 import os
+import re
+import selectors
+import signal
 import subprocess
 import threading
 import time
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Set
 
+from telegram_bridge import json_codec
 from telegram_bridge.stream_buffer import BoundedTextBuffer
 from telegram_bridge.structured_logging import emit_event
 
 OUTPUT_BEGIN_MARKER = "OUTPUT_BEGIN"
+_OUTPUT_BEGIN_LINE_PATTERN = re.compile(
+    rf"^[^\S\n]*{re.escape(OUTPUT_BEGIN_MARKER)}[^\S\n]*$",
+    re.MULTILINE,
+)
+_EXECUTOR_EVENT_NEEDLES = ("THREAD_ID=", "thread.started", "item.completed")
 EXECUTOR_STREAM_BUFFER_MAX_CHARS = 2 * 1024 * 1024
 EXECUTOR_STREAM_BUFFER_HEAD_CHARS = 32 * 1024
 EXECUTOR_STREAM_TRUNCATION_MARKER = "\n...[executor stream truncated]...\n"
+STRUCTURED_OUTPUT_ENVELOPE_KEY = '"telegram_outbound"'
+EXECUTOR_STREAM_ENCODING = locale.getpreferredencoding(False)
+EXECUTOR_PIPE_READ_BYTES = 64 * 1024
+EXECUTOR_PIPE_DRAIN_GRACE_SECONDS = 1.5
+THREAD_RESET_MARKERS = (
+    "thread not found",
+    "unknown thread",
+    "invalid thread",
+    "thread id not found",
+    "conversation not found",
+    "session not found",
+    "no such thread",
+    "could not find thread",
+)
+THREAD_RESET_SCAN_WINDOW_CHARS = 16 * 1024
+_THREAD_RESET_MARKER_PATTERN = re.compile(
+    "|".join(re.escape(marker) for marker in THREAD_RESET_MARKERS),
+    re.IGNORECASE,
+)
 
 @dataclass
 class ExecutorProgressEvent:
@@ -27,6 +58,10 @@ class ExecutorCancelledError(Exception):
 _EXECUTOR_ENV_CACHE_ATTR = "_cached_executor_env"
 _EXECUTOR_RESULT_THREAD_ID_ATTR = "_executor_thread_id"
 _EXECUTOR_RESULT_OUTPUT_ATTR = "_executor_output"
+# Running executor subprocesses, so shutdown can stop the ones whose worker
+# does not notice its cancel event in time.
+_ACTIVE_PROCESSES: Set[subprocess.Popen] = set()
+_ACTIVE_PROCESSES_LOCK = threading.Lock()
 _EDITOR_HOST_ENV_PREFIXES = (
     "VSCODE_",
     "ELECTRON_",
@@ -101,7 +136,7 @@ def parse_stream_json_line(raw_line: str) -> Optional[Dict[str, object]]:
     if not line or not line.startswith("{"):
         return None
     try:
-        payload = json.loads(line)
+        payload = json_codec.loads(line)
     except json.JSONDecodeError:
         return None
     if not isinstance(payload, dict):
@@ -162,6 +197,105 @@ def extract_executor_phase_timing(payload: Dict[str, object]) -> Optional[Dict[s
         result["mode"] = payload_mode
     return result
 
+class _PipeLineDecoder:
+    def __init__(self, on_line: Callable[[str], None]) -> None:
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(EXECUTOR_STREAM_ENCODING)(errors="replace"),
+            translate=True,
+        )
+        # Pieces of an unterminated line, joined only once its newline arrives
+        # so a long line read in many chunks is not re-copied per chunk.
+        self._pending: List[str] = []
+        self._on_line = on_line
+
+    def feed(self, data: bytes, final: bool = False) -> None:
+        text = self._decoder.decode(data, final=final)
+        start = 0
+        end = text.find("\n")
+        if end >= 0 and self._pending:
+            self._pending.append(text[: end + 1])
+            line = "".join(self._pending)
+            self._pending = []
+            self._on_line(line)
+            start = end + 1
+            end = text.find("\n", start)
+        while end >= 0:
+            self._on_line(text[start : end + 1])
+            start = end + 1
+            end = text.find("\n", start)
+        if start < len(text):
+            self._pending.append(text[start:])
+        if final and self._pending:
+            line = "".join(self._pending)
+            self._pending = []
+            self._on_line(line)
+
+
+class _ExecutorPipes:
+    """Feed stdin and split stdout/stderr into lines from the calling thread."""
+
+    def __init__(
+        self,
+        process: subprocess.Popen,
+        stdin_payload: bytes,
+        *,
+        on_stdout_line: Callable[[str], None],
+        on_stderr_line: Callable[[str], None],
+    ) -> None:
+        self._process = process
+        self._stdin_payload = memoryview(stdin_payload)
+        self._stdin_offset = 0
+        self._selector = selectors.DefaultSelector()
+        for pipe in (process.stdin, process.stdout, process.stderr):
+            os.set_blocking(pipe.fileno(), False)
+        if stdin_payload:
+            self._selector.register(process.stdin, selectors.EVENT_WRITE)
+        else:
+            process.stdin.close()
+        self._selector.register(process.stdout, selectors.EVENT_READ, _PipeLineDecoder(on_stdout_line))
+        self._selector.register(process.stderr, selectors.EVENT_READ, _PipeLineDecoder(on_stderr_line))
+
+    @property
+    def active(self) -> bool:
+        return bool(self._selector.get_map())
+
+    def pump(self, timeout: float) -> None:
+        for key, _events in self._selector.select(timeout=timeout):
+            if key.data is None:
+                self._write_stdin()
+                continue
+            try:
+                data = os.read(key.fd, EXECUTOR_PIPE_READ_BYTES)
+            except BlockingIOError:
+                continue
+            if data:
+                key.data.feed(data)
+                continue
+            self._selector.unregister(key.fileobj)
+            key.data.feed(b"", final=True)
+
+    def _write_stdin(self) -> None:
+        stdin = self._process.stdin
+        try:
+            self._stdin_offset += os.write(stdin.fileno(), self._stdin_payload[self._stdin_offset :])
+        except BlockingIOError:
+            return
+        except BrokenPipeError:
+            # The executor stopped reading its prompt; like communicate(), let
+            # its exit status and output speak for it.
+            self._stdin_offset = len(self._stdin_payload)
+        if self._stdin_offset >= len(self._stdin_payload):
+            self._selector.unregister(stdin)
+            stdin.close()
+
+    def close(self) -> None:
+        for key in list(self._selector.get_map().values()):
+            self._selector.unregister(key.fileobj)
+            if key.data is not None:
+                key.data.feed(b"", final=True)
+        self._selector.close()
+
+
 def run_executor(
     config,
     prompt: str,
@@ -175,20 +309,16 @@ def run_executor(
     progress_callback: Optional[Callable[[ExecutorProgressEvent], None]] = None,
     cancel_event: Optional[threading.Event] = None,
 ) -> subprocess.CompletedProcess[str]:
-    cmd = list(config.executor_cmd)
     mode = "resume" if thread_id else "new"
-    if thread_id:
-        cmd.extend(["resume", thread_id])
-    else:
-        cmd.append("new")
-    normalized_image_paths: List[str] = []
-    for candidate in image_paths or []:
-        if candidate and candidate not in normalized_image_paths:
-            normalized_image_paths.append(candidate)
-    if image_path and image_path not in normalized_image_paths:
-        normalized_image_paths.append(image_path)
-    for candidate in normalized_image_paths:
-        cmd.extend(["--image", candidate])
+    # dict.fromkeys de-duplicates in first-seen order without a list scan per path.
+    normalized_image_paths: List[str] = list(
+        dict.fromkeys(candidate for candidate in (*(image_paths or ()), image_path) if candidate)
+    )
+    cmd = [
+        *config.executor_cmd,
+        *(("resume", thread_id) if thread_id else ("new",)),
+        *(arg for candidate in normalized_image_paths for arg in ("--image", candidate)),
+    ]
     logging.info(
         "Running executor command mode=%s sandbox=%s session_key=%s cmd=%s",
         mode,
@@ -214,54 +344,76 @@ def run_executor(
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
         env=_build_executor_env(config),
+        # Own session/process group, so cancel and timeout can stop the tool
+        # subprocesses the executor script spawns as well.
+        start_new_session=True,
     )
 
-    stdout_buffer = BoundedTextBuffer(
-        EXECUTOR_STREAM_BUFFER_MAX_CHARS,
-        head_chars=EXECUTOR_STREAM_BUFFER_HEAD_CHARS,
-        truncation_marker=EXECUTOR_STREAM_TRUNCATION_MARKER,
-    )
-    stderr_buffer = BoundedTextBuffer(
-        EXECUTOR_STREAM_BUFFER_MAX_CHARS,
-        head_chars=EXECUTOR_STREAM_BUFFER_HEAD_CHARS,
-        truncation_marker=EXECUTOR_STREAM_TRUNCATION_MARKER,
-    )
-    parsed_thread_id: Optional[str] = None
-    parsed_last_agent_message: Optional[str] = None
-    saw_json_events = False
-    saw_legacy_thread_id = False
-    saw_output_begin_marker = False
+    _register_active_process(process)
+    try:
+        stdout_buffer = BoundedTextBuffer(
+            EXECUTOR_STREAM_BUFFER_MAX_CHARS,
+            head_chars=EXECUTOR_STREAM_BUFFER_HEAD_CHARS,
+            truncation_marker=EXECUTOR_STREAM_TRUNCATION_MARKER,
+        )
+        stderr_buffer = BoundedTextBuffer(
+            EXECUTOR_STREAM_BUFFER_MAX_CHARS,
+            head_chars=EXECUTOR_STREAM_BUFFER_HEAD_CHARS,
+            truncation_marker=EXECUTOR_STREAM_TRUNCATION_MARKER,
+        )
+        parsed_thread_id: Optional[str] = None
+        parsed_last_agent_message: Optional[str] = None
+        saw_json_events = False
+        saw_legacy_thread_id = False
+        saw_output_begin_marker = False
+        # Plain replies are trimmed to max_output_chars downstream, so the text
+        # after OUTPUT_BEGIN only keeps a bounded head and tail. The tail keeps
+        # trailing media directives; structured envelopes are kept whole.
+        max_output_chars = getattr(config, "max_output_chars", None)
+        output_buffer: Optional[BoundedTextBuffer] = None
+        if isinstance(max_output_chars, int) and max_output_chars > 0:
+            output_buffer = BoundedTextBuffer(
+                4 * max_output_chars,
+                head_chars=2 * max_output_chars,
+                truncation_marker=EXECUTOR_STREAM_TRUNCATION_MARKER,
+            )
 
-    if process.stdin is None or process.stdout is None or process.stderr is None:
-        raise RuntimeError("Failed to initialize executor process pipes")
+        if process.stdin is None or process.stdout is None or process.stderr is None:
+            raise RuntimeError("Failed to initialize executor process pipes")
 
-    def close_process_pipes() -> None:
-        for pipe in (process.stdin, process.stdout, process.stderr):
-            try:
-                if pipe is not None and not pipe.closed:
-                    pipe.close()
-            except Exception:
-                pass
-
-    def drain_stdout() -> None:
-        nonlocal parsed_thread_id, parsed_last_agent_message
-        nonlocal saw_json_events, saw_legacy_thread_id, saw_output_begin_marker
-        for raw_line in process.stdout:
+        def close_process_pipes() -> None:
+            for pipe in (process.stdin, process.stdout, process.stderr):
+                try:
+                    if pipe is not None and not pipe.closed:
+                        pipe.close()
+                except Exception:
+                    pass
+
+        def handle_stdout_line(raw_line: str) -> None:
+            nonlocal parsed_thread_id, parsed_last_agent_message
+            nonlocal saw_json_events, saw_legacy_thread_id, saw_output_begin_marker, output_buffer
+            if saw_output_begin_marker:
+                if output_buffer is not None and STRUCTURED_OUTPUT_ENVELOPE_KEY in raw_line:
+                    stdout_buffer.append(output_buffer.render())
+                    output_buffer = None
+                if output_buffer is None:
+                    stdout_buffer.append(raw_line)
+                else:
+                    output_buffer.append(raw_line)
+                return
             stdout_buffer.append(raw_line)
             stripped_line = raw_line.strip()
             if raw_line.startswith("THREAD_ID="):
                 saw_legacy_thread_id = True
                 parsed_thread_id = raw_line[len("THREAD_ID="):].strip() or parsed_thread_id
-                continue
+                return
             if stripped_line == OUTPUT_BEGIN_MARKER:
                 saw_output_begin_marker = True
-                continue
+                return
             payload = parse_stream_json_line(raw_line)
             if payload is None:
-                continue
+                return
             saw_json_events = True
             payload_type = payload.get("type")
             if payload_type == "thread.started":
@@ -281,15 +433,14 @@ def run_executor(
                 except Exception:
                     logging.exception("Progress callback failure")
 
-    def drain_stderr() -> None:
-        for raw_line in process.stderr:
+        def handle_stderr_line(raw_line: str) -> None:
             stderr_buffer.append(raw_line)
             payload = parse_stream_json_line(raw_line)
             if payload is None:
-                continue
+                return
             timing = extract_executor_phase_timing(payload)
             if timing is None:
-                continue
+                return
             fields: Dict[str, object] = dict(timing)
             fields.setdefault("mode", mode)
             if actor_chat_id is not None:
@@ -302,91 +453,103 @@ def run_executor(
                 fields["channel_name"] = channel_name
             emit_event("bridge.executor_phase_timing", fields=fields)
 
-    stdout_worker = threading.Thread(target=drain_stdout, daemon=True)
-    stderr_worker = threading.Thread(target=drain_stderr, daemon=True)
-    stdout_worker.start()
-    stderr_worker.start()
-
-    try:
-        process.stdin.write(prompt)
-        if not prompt.endswith("\n"):
-            process.stdin.write("\n")
-        process.stdin.close()
-    except Exception:
-        process.kill()
-        process.wait(timeout=5)
-        close_process_pipes()
-        raise
+        stdin_payload = (prompt if prompt.endswith("\n") else prompt + "\n").encode(EXECUTOR_STREAM_ENCODING)
+        pipes = _ExecutorPipes(
+            process,
+            stdin_payload,
+            on_stdout_line=handle_stdout_line,
+            on_stderr_line=handle_stderr_line,
+        )
 
-    deadline = time.monotonic() + float(config.exec_timeout_seconds)
-    return_code: Optional[int] = None
-    while True:
-        if cancel_event is not None and cancel_event.is_set():
-            process.kill()
+        def abort_process() -> None:
+            _kill_process_group(process)
             process.wait(timeout=5)
-            stdout_worker.join(timeout=1.5)
-            stderr_worker.join(timeout=1.5)
+            pipes.close()
             close_process_pipes()
-            emit_event(
-                "bridge.executor_subprocess_cancelled",
-                level=logging.INFO,
-                fields={"mode": mode},
-            )
-            raise ExecutorCancelledError("Executor request canceled by user.")
-
-        remaining = deadline - time.monotonic()
-        if remaining <= 0:
-            process.kill()
-            process.wait(timeout=5)
-            stdout_worker.join(timeout=1.5)
-            stderr_worker.join(timeout=1.5)
-            close_process_pipes()
-            emit_event(
-                "bridge.executor_subprocess_timeout",
-                level=logging.WARNING,
-                fields={
-                    "mode": mode,
-                    "timeout_seconds": config.exec_timeout_seconds,
-                },
-            )
-            raise subprocess.TimeoutExpired(cmd, config.exec_timeout_seconds)
-        try:
-            return_code = process.wait(timeout=min(0.2, max(0.01, remaining)))
-            break
-        except subprocess.TimeoutExpired:
-            continue
 
-    if return_code is None:
-        raise RuntimeError("Executor subprocess completed without a return code")
+        deadline = time.monotonic() + float(config.exec_timeout_seconds)
+        return_code: Optional[int] = None
+        drain_deadline: Optional[float] = None
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                abort_process()
+                emit_event(
+                    "bridge.executor_subprocess_cancelled",
+                    level=logging.INFO,
+                    fields={"mode": mode},
+                )
+                raise ExecutorCancelledError("Executor request canceled by user.")
+
+            now = time.monotonic()
+            remaining = deadline - now
+            if remaining <= 0:
+                abort_process()
+                emit_event(
+                    "bridge.executor_subprocess_timeout",
+                    level=logging.WARNING,
+                    fields={
+                        "mode": mode,
+                        "timeout_seconds": config.exec_timeout_seconds,
+                    },
+                )
+                raise subprocess.TimeoutExpired(cmd, config.exec_timeout_seconds)
+
+            if return_code is None:
+                return_code = process.poll()
+                if return_code is not None:
+                    # Grandchildren can inherit the pipes; give them a short grace
+                    # period to flush instead of waiting for them to exit.
+                    drain_deadline = now + EXECUTOR_PIPE_DRAIN_GRACE_SECONDS
+            if not pipes.active:
+                if return_code is not None:
+                    break
+                try:
+                    return_code = process.wait(timeout=min(0.2, max(0.01, remaining)))
+                except subprocess.TimeoutExpired:
+                    continue
+                break
+            if drain_deadline is not None and now >= drain_deadline:
+                break
+            try:
+                pipes.pump(timeout=min(0.2, max(0.01, remaining)))
+            except OSError:
+                abort_process()
+                raise
 
-    stdout_worker.join(timeout=1.5)
-    stderr_worker.join(timeout=1.5)
-    close_process_pipes()
-    duration_ms = int((time.monotonic() - start) * 1000)
-    emit_event(
-        "bridge.executor_subprocess_finish",
-        fields={
-            "mode": mode,
-            "returncode": return_code,
-            "duration_ms": duration_ms,
-        },
-    )
+        if return_code is None:
+            raise RuntimeError("Executor subprocess completed without a return code")
 
-    result = subprocess.CompletedProcess(
-        args=cmd,
-        returncode=return_code,
-        stdout=stdout_buffer.render(),
-        stderr=stderr_buffer.render(),
-    )
-    if (
-        saw_json_events
-        and parsed_last_agent_message is not None
-        and not saw_legacy_thread_id
-        and not saw_output_begin_marker
-    ):
-        setattr(result, _EXECUTOR_RESULT_THREAD_ID_ATTR, parsed_thread_id)
-        setattr(result, _EXECUTOR_RESULT_OUTPUT_ATTR, parsed_last_agent_message.strip())
-    return result
+        pipes.close()
+        close_process_pipes()
+        if output_buffer is not None:
+            stdout_buffer.append(output_buffer.render())
+        duration_ms = int((time.monotonic() - start) * 1000)
+        emit_event(
+            "bridge.executor_subprocess_finish",
+            fields={
+                "mode": mode,
+                "returncode": return_code,
+                "duration_ms": duration_ms,
+            },
+        )
+
+        result = subprocess.CompletedProcess(
+            args=cmd,
+            returncode=return_code,
+            stdout=stdout_buffer.render(),
+            stderr=stderr_buffer.render(),
+        )
+        if (
+            saw_json_events
+            and parsed_last_agent_message is not None
+            and not saw_legacy_thread_id
+            and not saw_output_begin_marker
+        ):
+            setattr(result, _EXECUTOR_RESULT_THREAD_ID_ATTR, parsed_thread_id)
+            setattr(result, _EXECUTOR_RESULT_OUTPUT_ATTR, parsed_last_agent_message.strip())
+        return result
+    finally:
+        _unregister_active_process(process)
 
 
 def cached_executor_result_output(
@@ -414,60 +577,120 @@ def attach_cached_executor_result(
     return result
 
 
+def _kill_process_group(process: subprocess.Popen) -> None:
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        process.kill()
+
+
+def _register_active_process(process: subprocess.Popen) -> None:
+    with _ACTIVE_PROCESSES_LOCK:
+        _ACTIVE_PROCESSES.add(process)
+
+
+def _unregister_active_process(process: subprocess.Popen) -> None:
+    with _ACTIVE_PROCESSES_LOCK:
+        _ACTIVE_PROCESSES.discard(process)
+
+
+def kill_active_executors() -> int:
+    """Kill the process group of every executor subprocess still running.
+
+    Returns the number of process groups signalled.
+    """
+    with _ACTIVE_PROCESSES_LOCK:
+        processes = [process for process in _ACTIVE_PROCESSES if process.poll() is None]
+    for process in processes:
+        try:
+            _kill_process_group(process)
+        except OSError:
+            logging.exception("Failed to kill executor process group pid=%s", process.pid)
+    return len(processes)
+
+
+def _iter_lines(text: str, end: int) -> Iterator[str]:
+    position = 0
+    while position < end:
+        line_end = text.find("\n", position, end)
+        if line_end < 0:
+            line_end = end
+        yield text[position:line_end]
+        position = line_end + 1
+
+
+def _find_output_begin_line(text: str) -> Optional[re.Match[str]]:
+    # str.find skips through a long event stream far faster than a MULTILINE
+    # regex search; the pattern only confirms the marker owns its line.
+    position = text.find(OUTPUT_BEGIN_MARKER)
+    while position >= 0:
+        line_start = text.rfind("\n", 0, position) + 1
+        match = _OUTPUT_BEGIN_LINE_PATTERN.match(text, line_start)
+        if match is not None:
+            return match
+        position = text.find(OUTPUT_BEGIN_MARKER, position + len(OUTPUT_BEGIN_MARKER))
+    return None
+
+
+def _may_carry_final_output_fields(line: str) -> bool:
+    # Most stream events are progress noise (reasoning, command output) that
+    # the final parse ignores; a substring probe is far cheaper than decoding
+    # each of them just to read "type".
+    return "thread.started" in line or ("item.completed" in line and "agent_message" in line)
+
+
 def parse_executor_output(stdout: str) -> tuple[Optional[str], str]:
-    lines = (stdout or "").splitlines()
+    text = stdout or ""
     thread_id: Optional[str] = None
     last_agent_message: Optional[str] = None
-    output_lines: List[str] = []
-    seen_output = False
-    seen_json_events = False
-    for line in lines:
+    # Everything after the marker line is final output, not JSON events, so
+    # it is located up front and only the text before it is walked by line.
+    marker_match = _find_output_begin_line(text)
+    events_end = marker_match.start() if marker_match is not None else len(text)
+    if not any(text.find(needle, 0, events_end) >= 0 for needle in _EXECUTOR_EVENT_NEEDLES):
+        events_end = 0
+    for line in _iter_lines(text, events_end):
+        if line.startswith("THREAD_ID="):
+            thread_id = line[len("THREAD_ID="):].strip()
+            continue
+        if not _may_carry_final_output_fields(line):
+            continue
         payload = parse_stream_json_line(line)
-        if payload is not None:
-            seen_json_events = True
-            payload_type = payload.get("type")
-            if payload_type == "thread.started":
-                payload_thread_id = payload.get("thread_id")
-                if isinstance(payload_thread_id, str) and payload_thread_id.strip():
-                    thread_id = payload_thread_id.strip()
-            elif payload_type == "item.completed":
-                item = payload.get("item")
-                if isinstance(item, dict) and item.get("type") == "agent_message":
-                    text = item.get("text")
-                    if isinstance(text, str):
-                        last_agent_message = text
-
-        if not seen_output:
-            if line.startswith("THREAD_ID="):
-                thread_id = line[len("THREAD_ID="):].strip()
-                continue
-            if line.strip() == OUTPUT_BEGIN_MARKER:
-                seen_output = True
-                continue
-        else:
-            output_lines.append(line)
-
-    if seen_output:
-        output = "\n".join(output_lines).strip()
-    elif seen_json_events and last_agent_message is not None:
+        if payload is None:
+            continue
+        payload_type = payload.get("type")
+        if payload_type == "thread.started":
+            payload_thread_id = payload.get("thread_id")
+            if isinstance(payload_thread_id, str) and payload_thread_id.strip():
+                thread_id = payload_thread_id.strip()
+        elif payload_type == "item.completed":
+            item = payload.get("item")
+            if isinstance(item, dict) and item.get("type") == "agent_message":
+                text_value = item.get("text")
+                if isinstance(text_value, str):
+                    last_agent_message = text_value
+
+    if marker_match is not None:
+        # Final output is sliced from the original text instead of re-joining lines.
+        output = text[marker_match.end() + 1:].strip()
+    elif last_agent_message is not None:
         output = last_agent_message.strip()
     else:
-        output = (stdout or "").strip()
+        output = text.strip()
     return thread_id, output
 
+def _has_thread_reset_marker(text: str) -> bool:
+    # Resume failures surface as a short error near the start or end of a
+    # stream, so only bounded head/tail windows of verbose output are scanned.
+    if len(text) <= 2 * THREAD_RESET_SCAN_WINDOW_CHARS:
+        return _THREAD_RESET_MARKER_PATTERN.search(text) is not None
+    return (
+        _THREAD_RESET_MARKER_PATTERN.search(text, 0, THREAD_RESET_SCAN_WINDOW_CHARS) is not None
+        or _THREAD_RESET_MARKER_PATTERN.search(text, len(text) - THREAD_RESET_SCAN_WINDOW_CHARS) is not None
+    )
+
 def should_reset_thread_after_resume_failure(
     stderr: str,
     stdout: str,
 ) -> bool:
-    combined = f"{stderr}\n{stdout}".lower()
-    reset_markers = (
-        "thread not found",
-        "unknown thread",
-        "invalid thread",
-        "thread id not found",
-        "conversation not found",
-        "session not found",
-        "no such thread",
-        "could not find thread",
-    )
-    return any(marker in combined for marker in reset_markers)
+    return _has_thread_reset_marker(stderr or "") or _has_thread_reset_marker(stdout or "")
@@ -6,10 +6,10 @@ from dataclasses import asdict, dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 from telegram_bridge.conversation_scope import build_telegram_scope_key, parse_telegram_scope_key
-from telegram_bridge.executor import parse_executor_output
+from telegram_bridge.executor import cached_executor_result_output, parse_executor_output
 from telegram_bridge.handler_common import trim_output
 from telegram_bridge.response_delivery import clear_cancel_event, register_cancel_event
-from telegram_bridge.scope_state_store import load_json_object, persist_json_state_file
+from telegram_bridge.scope_state_store import load_json_object, next_snapshot_sequence, persist_json_state_file
 from telegram_bridge.session_manager import clear_busy, mark_busy
 from telegram_bridge.state_models import ScopeKey, State, normalize_scope_key
 from telegram_bridge.state_store import clear_in_flight_request, mark_in_flight_request
@@ -146,7 +146,8 @@ def load_chat_goals(path: str) -> Dict[ScopeKey, GoalState]:
 def persist_chat_goals(state: State) -> None:
     with state.lock:
         values = {scope_key: goal_state.to_dict() for scope_key, goal_state in state.chat_goals.items()}
-    persist_json_state_file(state.chat_goal_path, values)
+        sequence = next_snapshot_sequence()
+    persist_json_state_file(state.chat_goal_path, values, sequence=sequence)
 
 
 def get_goal_state(state: State, scope_key: ScopeKey) -> Optional[GoalState]:
@@ -326,7 +327,9 @@ def _run_goal_judge(
         return "continue", f"judge error: {type(exc).__name__}", False
     if result.returncode != 0:
         return "continue", f"judge error: returncode {result.returncode}", False
-    _, output = parse_executor_output(result.stdout or "")
+    # run_executor already parsed the stream as it arrived; reuse that.
+    cached_output = cached_executor_result_output(result)
+    _, output = cached_output or parse_executor_output(result.stdout or "")
     done, reason, parse_failed = _parse_judge_response(_truncate(output, JUDGE_MAX_OUTPUT_CHARS))
     if done and not _response_explicitly_requests_stop(last_response):
         return (
@@ -15,7 +15,11 @@ def _config_group(config, group_name: str):
     return getattr(config, group_name, config)
 
 def normalize_command(text: str) -> Optional[str]:
-    stripped = text.strip()
+    stripped = text.lstrip()
+    # Only "/cmd" or "@bot /cmd" can name a command, so ordinary prose is
+    # rejected on its first character before any splitting.
+    if stripped[:1] not in ("/", "@"):
+        return None
     head: Optional[str] = None
     if stripped.startswith("/"):
         head = stripped.split(maxsplit=1)[0]
@@ -186,14 +190,15 @@ def build_status_text(
         restart_requested = state.restart_requested
         restart_in_progress = state.restart_in_progress
         if state.canonical_sessions_enabled:
-            thread_count = sum(
-                1 for session in state.chat_sessions.values() if session.thread_id.strip()
-            )
-            worker_count = sum(
-                1
-                for session in state.chat_sessions.values()
-                if session.worker_created_at is not None and session.worker_last_used_at is not None
-                )
+            # One pass over the sessions; only the counters and the two
+            # per-scope flags leave the critical section.
+            thread_count = 0
+            worker_count = 0
+            for session in state.chat_sessions.values():
+                if session.thread_id.strip():
+                    thread_count += 1
+                if session.worker_created_at is not None and session.worker_last_used_at is not None:
+                    worker_count += 1
             has_thread = False
             has_worker = False
             if scope_key is not None:
@@ -20,6 +20,7 @@ class PreparedPromptInput:
     document_path: Optional[str] = None
     cleanup_paths: List[str] = field(default_factory=list)
     attachment_file_ids: List[str] = field(default_factory=list)
+    cleanup_dirs: List[str] = field(default_factory=list)
 
 @dataclass
 class OutboundMediaDirective:
@@ -100,7 +100,12 @@ class ProgressReporter:
         self._stop_event.set()
         if self._worker:
             self._worker.join(timeout=2.0)
-        self._maybe_edit(force=True)
+        # Terminal marks already flushed their phase; only push what is still pending
+        # instead of spending another edit on a fresh elapsed counter.
+        with self._lock:
+            pending_update = self.pending_update
+        if pending_update:
+            self._maybe_edit(force=True)
         emit_event(
             "bridge.progress_edit_stats",
             fields={
@@ -115,7 +120,13 @@ class ProgressReporter:
         )
 
     def mark_success(self) -> None:
-        self.set_phase("Finalizing response.", immediate=True)
+        # The reply follows right away on the same per-chat send budget; stop
+        # the heartbeat and leave this edit pending for close() instead of
+        # putting it in front.
+        self._stop_event.set()
+        with self._lock:
+            self.phase = "Finalizing response."
+            self.pending_update = True
 
     def mark_failure(self, detail: str) -> None:
         self.set_phase(detail, immediate=True)
@@ -174,6 +185,8 @@ class ProgressReporter:
             if now >= next_typing_at:
                 self._send_typing()
                 next_typing_at = now + PROGRESS_TYPING_INTERVAL_SECONDS
+            if self._stop_event.is_set():
+                break
             self._maybe_edit(force=False)
             if now >= next_progress_at:
                 self._maybe_edit(force=True)
@@ -332,10 +332,12 @@ def handle_update(
     engine: Optional[EngineAdapter] = None,
     update_flow_dependencies: Optional[UpdateFlowDependencies] = None,
 ) -> None:
-    if update_flow_dependencies is None:
-        update_flow_dependencies = build_update_flow_dependencies()
     handle_update_started_at = time.monotonic()
-    if handle_callback_query(state, config, client, update):
+    # Callback queries and chat messages never share an update, so anything
+    # without a top-level message is either a button press or ignorable.
+    if "message" not in update:
+        if "callback_query" in update:
+            handle_callback_query(state, config, client, update)
         return
     ctx = extract_incoming_update_context(update)
     if ctx is None:
@@ -356,6 +358,8 @@ def handle_update(
     prepared = prepare_update_request(state, config, client, ctx)
     if prepared is None:
         return
+    if update_flow_dependencies is None:
+        update_flow_dependencies = build_update_flow_dependencies()
     flow = build_update_flow_state(
         state,
         config,
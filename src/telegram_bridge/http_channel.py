@@ -1,9 +1,11 @@
-import json
-import os
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional
 from urllib.error import HTTPError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from urllib.request import Request
+
+from telegram_bridge import json_codec
+from telegram_bridge.http_keepalive import urlopen
+from telegram_bridge.media import DOWNLOAD_CHUNK_BYTES
 
 class HttpBridgeChannelAdapter:
     channel_name = "http"
@@ -50,13 +52,13 @@ class HttpBridgeChannelAdapter:
         endpoint = f"{self.api_base}{path}"
         data = None
         if payload is not None:
-            data = json.dumps(payload).encode("utf-8")
+            data = json_codec.dumps_compact(payload).encode("utf-8")
         request = Request(endpoint, data=data, method=method)
         for name, value in self._headers().items():
             request.add_header(name, value)
         try:
             with urlopen(request, timeout=self.timeout_seconds + 10) as response:
-                body = response.read().decode("utf-8")
+                body = response.read()
         except HTTPError as exc:
             detail = ""
             try:
@@ -67,7 +69,7 @@ class HttpBridgeChannelAdapter:
             if detail:
                 message = f"{message}: {detail}"
             raise RuntimeError(message) from exc
-        decoded = json.loads(body) if body else {}
+        decoded = json_codec.loads(body) if body else {}
         if not isinstance(decoded, dict):
             raise RuntimeError(f"{self.display_name} bridge response must be a JSON object")
         if decoded.get("ok") is False:
@@ -268,26 +270,44 @@ class HttpBridgeChannelAdapter:
         target_path: str,
         max_bytes: int,
         size_label: str = "File",
+        chunk_size: int = DOWNLOAD_CHUNK_BYTES,
     ) -> None:
+        with open(target_path, "wb") as handle:
+            self.download_file_to_handle(
+                file_path,
+                handle,
+                max_bytes,
+                size_label=size_label,
+                chunk_size=chunk_size,
+            )
+
+    def download_file_to_handle(
+        self,
+        file_path: str,
+        handle: BinaryIO,
+        max_bytes: int,
+        size_label: str = "File",
+        chunk_size: int = DOWNLOAD_CHUNK_BYTES,
+    ) -> int:
         query = urlencode({"file_path": file_path})
         endpoint = f"{self.api_base}/files/content?{query}"
         request = Request(endpoint, method="GET")
         if self.auth_token:
             request.add_header("Authorization", f"Bearer {self.auth_token}")
 
+        buffer = bytearray(max(1, chunk_size))
+        view = memoryview(buffer)
         total = 0
-        with (
-            urlopen(request, timeout=self.timeout_seconds + 10) as response,
-            open(target_path, "wb") as handle,
-        ):
+        with urlopen(request, timeout=self.timeout_seconds + 10) as response:
             while True:
-                chunk = response.read(64 * 1024)
-                if not chunk:
+                read_count = response.readinto(buffer)
+                if not read_count:
                     break
-                total += len(chunk)
+                total += read_count
                 if total > max_bytes:
                     raise ValueError(f"{size_label} too large (> {max_bytes} bytes).")
-                handle.write(chunk)
+                handle.write(view[:read_count])
 
-        if total <= 0 and os.path.exists(target_path):
+        if total <= 0:
             raise RuntimeError(f"{self.display_name} bridge file download returned empty content")
+        return total
@@ -0,0 +1,116 @@
+import io
+import socket
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.exceptions import ReadTimeoutError
+
+# Idle connections kept per host. Message workers, the outbound sender and
+# the poller all share the pool; connections opened past this under a burst
+# are closed after use instead of being pooled.
+POOL_MAXSIZE_PER_HOST = 16
+# A pooled socket that a NAT or server dropped silently would hang the next
+# request until its read timeout. TCP keepalive probes it while idle, so the
+# kernel marks it dead and the pool discards it at checkout instead.
+POOL_KEEPALIVE_IDLE_SECONDS = 30
+POOL_KEEPALIVE_INTERVAL_SECONDS = 10
+POOL_KEEPALIVE_PROBES = 3
+
+
+def _keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    options = [*HTTPConnection.default_socket_options, (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in (
+        ("TCP_KEEPIDLE", POOL_KEEPALIVE_IDLE_SECONDS),
+        ("TCP_KEEPINTVL", POOL_KEEPALIVE_INTERVAL_SECONDS),
+        ("TCP_KEEPCNT", POOL_KEEPALIVE_PROBES),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs.setdefault("socket_options", _keepalive_socket_options())
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Bot API and channel bridge calls share one requests.Session, whose pool
+# keeps HTTP/1.1 connections open per host, so consecutive long polls, sends
+# and downloads skip the TCP/TLS handshake and one shutdown hook closes every
+# pooled socket. Callers keep urllib's interface: urlopen() takes a urllib
+# Request and raises HTTPError/URLError, and a read timeout stays a timeout.
+_SESSION = requests.Session()
+for _scheme in ("http://", "https://"):
+    _SESSION.mount(_scheme, _KeepAliveAdapter(pool_maxsize=POOL_MAXSIZE_PER_HOST))
+# urllib never asked for compressed bodies; callers read raw bytes and
+# compare Content-Length against their own caps.
+_SESSION.headers["Accept-Encoding"] = "identity"
+
+
+@contextmanager
+def _translated_errors() -> Iterator[None]:
+    try:
+        yield
+    except (requests.exceptions.ReadTimeout, ReadTimeoutError) as exc:
+        raise socket.timeout(str(exc)) from exc
+    except (requests.exceptions.RequestException, Urllib3Error) as exc:
+        raise URLError(exc) from exc
+
+
+class PooledResponse:
+    """Streamed response body; closing it before the end drops the connection."""
+
+    def __init__(self, response: requests.Response) -> None:
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.url = response.url
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        with _translated_errors():
+            return self._response.raw.read(amt)
+
+    def readinto(self, buffer) -> int:
+        with _translated_errors():
+            return self._response.raw.readinto(buffer)
+
+    def close(self) -> None:
+        self._response.close()
+
+    def __enter__(self) -> "PooledResponse":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def urlopen(request: Request, timeout: Optional[float] = None) -> PooledResponse:
+    url = request.full_url
+    # A request that fails after it was sent is not resent: the server may
+    # already have acted on it, so the caller's retry policy decides.
+    with _translated_errors():
+        response = _SESSION.request(
+            request.get_method(),
+            url,
+            data=request.data,
+            headers=dict(request.header_items()),
+            timeout=timeout,
+            stream=True,
+        )
+        if response.status_code >= 400:
+            body = response.content
+            response.close()
+            raise HTTPError(url, response.status_code, response.reason, response.headers, io.BytesIO(body))
+    return PooledResponse(response)
+
+
+def close_idle_connections() -> None:
+    """Close every pooled idle connection; in-flight responses are untouched."""
+    _SESSION.close()
@@ -0,0 +1,30 @@
+import json
+from typing import Dict
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib encoder is always correct
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON text or UTF-8 bytes; decode errors are json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_compact(value: object, *, sort_keys: bool = False) -> str:
+    """Compact UTF-8 JSON (no ASCII escaping), e.g. for request bodies and journals."""
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(value, option=option).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def dumps_state(serialized: Dict[str, object], *, pretty: bool = True) -> str:
+    if not pretty:
+        return dumps_compact(serialized, sort_keys=True)
+    if orjson is not None:
+        return orjson.dumps(serialized, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode("utf-8") + "\n"
+    return json.dumps(serialized, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
@@ -8,6 +8,7 @@ import time
 from typing import Optional
 from urllib.error import HTTPError, URLError
 
+from telegram_bridge.backoff import compute_backoff_seconds
 from telegram_bridge.bridge_state_bootstrap import (
     build_policy_fingerprint_state_path,
     build_update_offset_state_path,
@@ -34,9 +35,9 @@ from telegram_bridge.bridge_runtime_setup import (
     build_runtime_bootstrap,
     close_runtime_bootstrap,
     clear_thread_state_for_policy_change,
+    notify_interrupted_requests,
     persist_bootstrap_state,
 )
-from telegram_bridge.conversation_scope import parse_telegram_scope_key
 from telegram_bridge.executor import (
     ExecutorProgressEvent,
     extract_executor_progress_event,
@@ -87,6 +88,8 @@ from telegram_bridge.stream_buffer import BoundedTextBuffer
 from telegram_bridge.structured_logging import configure_bridge_logging, emit_event
 from telegram_bridge.transport import TELEGRAM_LIMIT, TelegramClient, to_telegram_chunks
 
+POLL_ERROR_BACKOFF_CAP_SECONDS = 30.0
+
 __all__ = [
     "CanonicalSession",
     "PendingMediaGroup",
@@ -241,25 +244,7 @@ def run_bridge(config: Config) -> int:
 
         interrupted = pop_interrupted_requests(state)
         if interrupted:
-            for scope_key in sorted(interrupted):
-                try:
-                    target = parse_telegram_scope_key(scope_key)
-                except ValueError:
-                    continue
-                if target.chat_id not in config.allowed_chat_ids:
-                    continue
-                try:
-                    client.send_message(
-                        target.chat_id,
-                        "Your previous request was interrupted because the bridge restarted. "
-                        "Please resend it.",
-                        message_thread_id=target.message_thread_id,
-                    )
-                except Exception:
-                    logging.exception(
-                        "Failed to send restart-interruption notice for scope=%s",
-                        scope_key,
-                    )
+            notify_interrupted_requests(config, client, interrupted)
             logging.warning(
                 "Detected %s interrupted in-flight request(s) from previous runtime.",
                 len(interrupted),
@@ -271,6 +256,7 @@ def run_bridge(config: Config) -> int:
 
         offset = 0
         offset_state_path: Optional[str] = None
+        persisted_offset: Optional[int] = None
         if should_discard_startup_backlog(config):
             try:
                 offset = drop_pending_updates(client)
@@ -301,6 +287,7 @@ def run_bridge(config: Config) -> int:
                 },
             )
             persist_saved_update_offset(offset_state_path, offset)
+            persisted_offset = offset
 
         logging.info("Bridge started. Allowed chats=%s", sorted(config.allowed_chat_ids))
         logging.info("Channel plugin active=%s", config.channel_plugin)
@@ -416,6 +403,7 @@ def run_bridge(config: Config) -> int:
             },
         )
 
+        consecutive_poll_failures = 0
         while True:
             try:
                 expire_idle_worker_sessions(state, config, client)
@@ -446,11 +434,13 @@ def run_bridge(config: Config) -> int:
 
                 poll_timeout_seconds = compute_poll_timeout_seconds(state, config)
                 updates = client.get_updates(offset, timeout_seconds=poll_timeout_seconds)
+                consecutive_poll_failures = 0
                 if not updates and offset_state_path is not None and offset > 0:
                     reset_offset = maybe_reset_stale_runtime_offset(config, client, offset)
                     if reset_offset != offset:
                         offset = reset_offset
                         persist_saved_update_offset(offset_state_path, offset)
+                        persisted_offset = offset
                         continue
                 if updates:
                     emit_event(
@@ -477,24 +467,46 @@ def run_bridge(config: Config) -> int:
                         engine=engine,
                         update_flow_dependencies=bootstrap.update_flow_dependencies,
                     )
-                if offset_state_path is not None:
+                # Empty long polls leave the offset unchanged; skip the fsync'd rewrite.
+                if offset_state_path is not None and offset != persisted_offset:
                     persist_saved_update_offset(offset_state_path, offset)
+                    persisted_offset = offset
             except (HTTPError, URLError, TimeoutError):
                 logging.exception("Network/API error while polling Telegram")
+                retry_delay_seconds = compute_backoff_seconds(
+                    config.retry_sleep_seconds,
+                    consecutive_poll_failures,
+                    cap_seconds=POLL_ERROR_BACKOFF_CAP_SECONDS,
+                )
+                consecutive_poll_failures += 1
                 emit_event(
                     "bridge.poll_error",
                     level=logging.WARNING,
-                    fields={"category": "network_api"},
+                    fields={
+                        "category": "network_api",
+                        "consecutive_failures": consecutive_poll_failures,
+                        "retry_delay_seconds": retry_delay_seconds,
+                    },
                 )
-                time.sleep(config.retry_sleep_seconds)
+                time.sleep(retry_delay_seconds)
             except Exception:
                 logging.exception("Unexpected loop error")
+                retry_delay_seconds = compute_backoff_seconds(
+                    config.retry_sleep_seconds,
+                    consecutive_poll_failures,
+                    cap_seconds=POLL_ERROR_BACKOFF_CAP_SECONDS,
+                )
+                consecutive_poll_failures += 1
                 emit_event(
                     "bridge.poll_error",
                     level=logging.WARNING,
-                    fields={"category": "unexpected"},
+                    fields={
+                        "category": "unexpected",
+                        "consecutive_failures": consecutive_poll_failures,
+                        "retry_delay_seconds": retry_delay_seconds,
+                    },
                 )
-                time.sleep(config.retry_sleep_seconds)
+                time.sleep(retry_delay_seconds)
     finally:
         close_runtime_bootstrap(bootstrap)
 
@@ -1,20 +1,24 @@
 import os
+import secrets
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Protocol, Tuple
+from typing import BinaryIO, Callable, Dict, Optional, Protocol, Tuple
+
+DOWNLOAD_CHUNK_BYTES = 1 << 20
 
 class TelegramFileClientProtocol(Protocol):
     def get_file(self, file_id: str) -> Dict[str, object]:
         ...
 
-    def download_file_to_path(
+    def download_file_to_handle(
         self,
         file_path: str,
-        target_path: str,
+        handle: BinaryIO,
         max_bytes: int,
         size_label: str = "File",
-    ) -> None:
+        chunk_size: int = DOWNLOAD_CHUNK_BYTES,
+    ) -> int:
         ...
 
 @dataclass(frozen=True)
@@ -26,6 +30,87 @@ class TelegramFileDownloadSpec:
     default_suffix: str
     too_large_label: str
     suffix_hint: str = ""
+    temp_dir: Optional[str] = None
+
+def _preallocate_download(handle: BinaryIO, size_bytes: int) -> bool:
+    # Reserving the advertised size up front lets the filesystem lay the file
+    # out contiguously; unsupported filesystems simply skip it.
+    if size_bytes <= 0 or not hasattr(os, "posix_fallocate"):
+        return False
+    try:
+        os.posix_fallocate(handle.fileno(), 0, size_bytes)
+    except OSError:
+        return False
+    return True
+
+def _open_anonymous_file(directory: str) -> Optional[int]:
+    # O_TMPFILE gives an unlinked inode, so a failed or interrupted download
+    # never leaves a partial file behind. Not every OS or filesystem has it.
+    flag = getattr(os, "O_TMPFILE", 0)
+    # Linking the inode into place later goes through /proc/self/fd.
+    if not flag or not os.path.isdir("/proc/self/fd"):
+        return None
+    try:
+        return os.open(directory, flag | os.O_WRONLY, 0o600)
+    except OSError:
+        return None
+
+def _link_anonymous_file(fd: int, directory: str, prefix: str, suffix: str) -> str:
+    # A plain os.link() does not follow the /proc magic link; passing a
+    # src_dir_fd makes CPython use linkat(..., AT_SYMLINK_FOLLOW) instead.
+    proc_fd_dir = os.open("/proc/self/fd", os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for _ in range(tempfile.TMP_MAX):
+            path = os.path.join(directory, f"{prefix}{secrets.token_hex(6)}{suffix}")
+            try:
+                os.link(str(fd), path, src_dir_fd=proc_fd_dir, follow_symlinks=True)
+            except FileExistsError:
+                continue
+            return path
+    finally:
+        os.close(proc_fd_dir)
+    raise FileExistsError(f"No usable temporary file name in {directory}")
+
+def _download_to_anonymous_file(
+    stream_into: Callable[[BinaryIO], int],
+    spec: TelegramFileDownloadSpec,
+    suffix: str,
+) -> Optional[Tuple[str, int]]:
+    directory = spec.temp_dir or tempfile.gettempdir()
+    fd = _open_anonymous_file(directory)
+    if fd is None:
+        return None
+    with os.fdopen(fd, "wb") as handle:
+        downloaded_size = stream_into(handle)
+        handle.flush()
+        # Only a complete download gets a name on disk.
+        tmp_path = _link_anonymous_file(handle.fileno(), directory, spec.temp_prefix, suffix)
+    return tmp_path, downloaded_size
+
+def _download_to_named_temp_file(
+    stream_into: Callable[[BinaryIO], int],
+    spec: TelegramFileDownloadSpec,
+    suffix: str,
+) -> Tuple[str, int]:
+    # Stream straight into the still-open temp file rather than closing the
+    # mkstemp fd and having the client reopen the path.
+    with tempfile.NamedTemporaryFile(
+        prefix=spec.temp_prefix,
+        suffix=suffix,
+        dir=spec.temp_dir,
+        delete=False,
+    ) as handle:
+        tmp_path = handle.name
+        try:
+            downloaded_size = stream_into(handle)
+        except Exception:
+            handle.close()
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    return tmp_path, downloaded_size
 
 def download_telegram_file_to_temp(
     client: TelegramFileClientProtocol,
@@ -46,21 +131,24 @@ def download_telegram_file_to_temp(
     if not suffix:
         suffix = Path(file_path).suffix or spec.default_suffix
 
-    fd, tmp_path = tempfile.mkstemp(prefix=spec.temp_prefix, suffix=suffix)
-    os.close(fd)
-    try:
-        client.download_file_to_path(
+    def stream_into(handle: BinaryIO) -> int:
+        preallocated = isinstance(file_size, int) and _preallocate_download(handle, file_size)
+        downloaded_size = client.download_file_to_handle(
             file_path,
-            tmp_path,
+            handle,
             spec.max_bytes,
             size_label=spec.size_label,
+            chunk_size=DOWNLOAD_CHUNK_BYTES,
         )
-    except Exception:
-        try:
-            os.remove(tmp_path)
-        except OSError:
-            pass
-        raise
+        if preallocated and downloaded_size != file_size:
+            handle.truncate(downloaded_size)
+        return downloaded_size
+
+    anonymous = _download_to_anonymous_file(stream_into, spec, suffix)
+    if anonymous is not None:
+        tmp_path, downloaded_size = anonymous
+    else:
+        tmp_path, downloaded_size = _download_to_named_temp_file(stream_into, spec, suffix)
 
-    final_size = file_size if isinstance(file_size, int) else os.path.getsize(tmp_path)
+    final_size = file_size if isinstance(file_size, int) else downloaded_size
     return tmp_path, final_size
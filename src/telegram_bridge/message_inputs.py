@@ -12,19 +12,25 @@ TELEGRAM_REFERENCE_MESSAGE_ID_RE = re.compile(
 )
 
 def pick_largest_photo_file_id(photo_items: List[object]) -> Optional[str]:
-    best_file_id: Optional[str] = None
+    # ">=" keeps the last entry on size ties, matching Telegram's
+    # smallest-to-largest PhotoSize ordering; ids are only stripped when an
+    # entry would take the lead.
     best_size = -1
+    best_file_id: Optional[str] = None
     for item in photo_items:
         if not isinstance(item, dict):
             continue
         file_id = item.get("file_id")
-        if not isinstance(file_id, str) or not file_id.strip():
+        if not isinstance(file_id, str):
             continue
         file_size = item.get("file_size")
-        size_score = file_size if isinstance(file_size, int) else 0
-        if size_score >= best_size:
-            best_size = size_score
-            best_file_id = file_id.strip()
+        size = file_size if isinstance(file_size, int) else 0
+        if size < best_size:
+            continue
+        file_id = file_id.strip()
+        if file_id:
+            best_size = size
+            best_file_id = file_id
     return best_file_id
 
 def extract_discrete_photo_file_ids(photo_items: List[object]) -> List[str]:
@@ -392,25 +398,30 @@ def extract_document_payload(message: Dict[str, object]) -> Optional[DocumentPay
         mime_type=mime_type.strip() if isinstance(mime_type, str) and mime_type.strip() else "unknown",
     )
 
-def extract_message_media_payload(
+def _extract_voice_or_document(
     message: Dict[str, object],
-) -> tuple[Optional[str], Optional[str], Optional[DocumentPayload]]:
-    photo_file_ids = extract_message_photo_file_ids(message)
-    if photo_file_ids:
-        return photo_file_ids[0], None, None
-
+) -> tuple[Optional[str], Optional[DocumentPayload]]:
     for candidate in iter_media_group_messages(message):
         voice = candidate.get("voice")
         if isinstance(voice, dict):
             voice_file_id = voice.get("file_id")
             if isinstance(voice_file_id, str) and voice_file_id.strip():
-                return None, voice_file_id.strip(), None
+                return voice_file_id.strip(), None
 
         document = extract_document_payload(candidate)
         if document is not None:
-            return None, None, document
+            return None, document
 
-    return None, None, None
+    return None, None
+
+def extract_message_media_payload(
+    message: Dict[str, object],
+) -> tuple[Optional[str], Optional[str], Optional[DocumentPayload]]:
+    photo_file_ids = extract_message_photo_file_ids(message)
+    if photo_file_ids:
+        return photo_file_ids[0], None, None
+    voice_file_id, document = _extract_voice_or_document(message)
+    return None, voice_file_id, document
 
 def extract_message_photo_file_ids(message: Dict[str, object]) -> List[str]:
     photo_file_ids: List[str] = []
@@ -487,8 +498,7 @@ def get_recent_scope_photos(state: State, scope_key: str) -> List[str]:
     return []
 
 def describe_message_media(message: Dict[str, object]) -> str:
-    photo_file_ids = extract_message_photo_file_ids(message)
-    _, voice_file_id, document = extract_message_media_payload(message)
+    photo_file_ids, voice_file_id, document = _extract_media_selection(message)
     if photo_file_ids:
         if len(photo_file_ids) > 1:
             return "В исходном сообщении были изображения."
@@ -505,8 +515,11 @@ def describe_message_media(message: Dict[str, object]) -> str:
 def _extract_media_selection(
     message: Dict[str, object],
 ) -> tuple[List[str], Optional[str], Optional[DocumentPayload]]:
+    # Photos win over voice/documents, so the photo scan runs only once.
     photo_file_ids = extract_message_photo_file_ids(message)
-    _, voice_file_id, document = extract_message_media_payload(message)
+    if photo_file_ids:
+        return photo_file_ids, None, None
+    voice_file_id, document = _extract_voice_or_document(message)
     return photo_file_ids, voice_file_id, document
 
 
@@ -314,6 +314,7 @@ def process_prompt_request(
     image_path: Optional[str] = None
     image_paths: List[str] = []
     cleanup_paths: List[str] = []
+    cleanup_dirs: List[str] = []
     attachment_file_ids: List[str] = []
     attachment_store = getattr(state, "attachment_store", None)
     affective_runtime = getattr(state, "affective_runtime", None)
@@ -368,6 +369,7 @@ def process_prompt_request(
         image_path = prepared.image_path
         image_paths = list(prepared.image_paths)
         cleanup_paths = list(prepared.cleanup_paths)
+        cleanup_dirs = list(prepared.cleanup_dirs)
         attachment_file_ids = list(prepared.attachment_file_ids)
         prompt_text = prepared.prompt_text
         previous_thread_id = None if stateless else state_repo.get_thread_id(scope_key)
@@ -578,6 +580,7 @@ def process_prompt_request(
             message_id=message_id,
             cancel_event=cancel_event,
             cleanup_paths=cleanup_paths,
+            cleanup_dirs=cleanup_dirs,
         )
         emit_phase_timing(
             chat_id=chat_id,
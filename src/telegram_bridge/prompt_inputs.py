@@ -1,7 +1,7 @@
 import logging
 import os
 import subprocess
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from telegram_bridge.attachment_processing import (
     apply_voice_alias_replacements,
@@ -46,6 +46,7 @@ def transcribe_voice_for_chat(
     message_id: Optional[int],
     voice_file_id: str,
     echo_transcript: bool = True,
+    temp_dir_fn: Optional[Callable[[], str]] = None,
 ) -> Optional[str]:
     if not config.voice_transcribe_cmd:
         _reply(client, chat_id, message_id, config.voice_not_configured_message)
@@ -53,13 +54,21 @@ def transcribe_voice_for_chat(
 
     voice_path: Optional[str] = None
     cleanup_voice_path = False
+    temp_dir: Optional[str] = None
+
+    def download() -> str:
+        nonlocal temp_dir
+        if temp_dir_fn is not None:
+            temp_dir = temp_dir_fn()
+        return download_voice_to_temp(client, config, voice_file_id, temp_dir=temp_dir)
+
     try:
         try:
             resolution = resolve_voice_attachment_for_prompt(
                 getattr(state, "attachment_store", None),
                 channel_name=getattr(client, "channel_name", "telegram"),
                 file_id=voice_file_id,
-                downloader=lambda: download_voice_to_temp(client, config, voice_file_id),
+                downloader=download,
             )
         except ValueError as exc:
             logging.warning("Voice rejected for chat_id=%s: %s", chat_id, exc)
@@ -71,7 +80,8 @@ def transcribe_voice_for_chat(
             return None
 
         voice_path = resolution.local_path
-        cleanup_voice_path = bool(resolution.cleanup_path)
+        # A caller-provided temp dir is removed wholesale by its owner.
+        cleanup_voice_path = bool(resolution.cleanup_path) and temp_dir is None
         if voice_path is None:
             logging.warning("Voice audio unavailable for chat_id=%s file_id=%s", chat_id, voice_file_id)
             _reply(client, chat_id, message_id, config.voice_transcribe_error_message)
@@ -1,11 +1,16 @@
 import logging
 import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from telegram_bridge import attachment_processing
 from telegram_bridge.handler_models import PreparedPromptInput, PromptRequest
 
+PHOTO_DOWNLOAD_MAX_WORKERS = 4
+
 @dataclass
 class PromptPreparationState:
     prompt_text: str
@@ -14,6 +19,21 @@ class PromptPreparationState:
     document_path: Optional[str] = None
     cleanup_paths: List[str] = field(default_factory=list)
     attachment_file_ids: List[str] = field(default_factory=list)
+    temp_dir: Optional[str] = None
+    # Set when update preparation already length-checked prompt_text; any
+    # stage that changes the prompt clears it so the final check runs.
+    already_validated: bool = False
+
+    def ensure_temp_dir(self) -> str:
+        # Created on first download only, so text-only prompts never touch disk.
+        if self.temp_dir is None:
+            self.temp_dir = tempfile.mkdtemp(prefix="telegram-bridge-request-")
+        return self.temp_dir
+
+    def track_cleanup_path(self, path: Optional[str]) -> None:
+        # Files downloaded into temp_dir go away with the directory itself.
+        if path and (self.temp_dir is None or os.path.dirname(path) != self.temp_dir):
+            self.cleanup_paths.append(path)
 
     def append_context(self, context: str) -> None:
         if not context:
@@ -22,6 +42,7 @@ class PromptPreparationState:
             self.prompt_text = f"{self.prompt_text}\n\n{context}"
         else:
             self.prompt_text = context
+        self.already_validated = False
 
 
 def _reply(request: PromptRequest, text: str) -> None:
@@ -54,21 +75,68 @@ def _handle_photo_attachments(
     progress.set_phase(
         "Downloading images from Telegram." if len(normalized_photo_file_ids) > 1 else "Downloading image from Telegram."
     )
-    for current_photo_file_id in normalized_photo_file_ids:
+
+    def resolve_photo(photo_file_id: str, temp_dir_fn) -> attachment_processing.AttachmentResolution:
+        return attachment_processing.resolve_attachment_for_prompt(
+            attachment_store,
+            channel_name=channel_name,
+            file_id=photo_file_id,
+            media_label="image",
+            media_kind="photo",
+            downloader=lambda: attachment_processing.download_photo_to_temp(
+                request.client,
+                request.config,
+                photo_file_id,
+                temp_dir=temp_dir_fn(),
+            ),
+        )
+
+    if len(normalized_photo_file_ids) == 1:
+        photo_file_id = normalized_photo_file_ids[0]
+        return _collect_photo_resolutions(
+            request,
+            progress,
+            preparation,
+            normalized_photo_file_ids,
+            [lambda: resolve_photo(photo_file_id, preparation.ensure_temp_dir)],
+        )
+
+    # Album photos download concurrently; results are still consumed in order
+    # so failures and prompt context match the sequential path.
+    temp_dir = preparation.ensure_temp_dir()
+    with ThreadPoolExecutor(
+        max_workers=min(PHOTO_DOWNLOAD_MAX_WORKERS, len(normalized_photo_file_ids)),
+        thread_name_prefix="photo-download",
+    ) as pool:
+        futures = [
+            pool.submit(resolve_photo, photo_file_id, lambda: temp_dir)
+            for photo_file_id in normalized_photo_file_ids
+        ]
+        prepared = _collect_photo_resolutions(
+            request,
+            progress,
+            preparation,
+            normalized_photo_file_ids,
+            [future.result for future in futures],
+        )
+        if prepared is None:
+            # The request already failed; skip the downloads still queued
+            # instead of waiting for them when the pool closes.
+            pool.shutdown(wait=False, cancel_futures=True)
+        return prepared
+
+
+def _collect_photo_resolutions(
+    request: PromptRequest,
+    progress: Any,
+    preparation: PromptPreparationState,
+    photo_file_ids: List[str],
+    resolvers: List[Callable[[], attachment_processing.AttachmentResolution]],
+) -> Optional[PromptPreparationState]:
+    for current_photo_file_id, resolve in zip(photo_file_ids, resolvers):
         preparation.attachment_file_ids.append(current_photo_file_id)
         try:
-            resolution = attachment_processing.resolve_attachment_for_prompt(
-                attachment_store,
-                channel_name=channel_name,
-                file_id=current_photo_file_id,
-                media_label="image",
-                media_kind="photo",
-                downloader=lambda: attachment_processing.download_photo_to_temp(
-                    request.client,
-                    request.config,
-                    current_photo_file_id,
-                ),
-            )
+            resolution = resolve()
         except ValueError as exc:
             logging.warning("Photo rejected for chat_id=%s: %s", request.chat_id, exc)
             progress.mark_failure("Image request rejected.")
@@ -86,8 +154,7 @@ def _handle_photo_attachments(
 
         if resolution.local_path is not None:
             preparation.image_paths.append(resolution.local_path)
-        if resolution.cleanup_path:
-            preparation.cleanup_paths.append(resolution.cleanup_path)
+        preparation.track_cleanup_path(resolution.cleanup_path)
 
     if preparation.image_paths:
         preparation.image_path = preparation.image_paths[0]
@@ -118,6 +185,7 @@ def _handle_voice_attachment(
         message_id=request.message_id,
         voice_file_id=request.voice_file_id,
         echo_transcript=True,
+        temp_dir_fn=preparation.ensure_temp_dir,
     )
     if transcript is None:
         progress.mark_failure("Voice transcription failed.")
@@ -170,6 +238,7 @@ def _handle_voice_attachment(
         preparation.prompt_text = f"{preparation.prompt_text}\n\nVoice transcript:\n{transcript}"
     else:
         preparation.prompt_text = transcript
+    preparation.already_validated = False
     return preparation
 
 
@@ -199,6 +268,7 @@ def _handle_document_attachment(
                 request.client,
                 request.config,
                 document,
+                temp_dir=preparation.ensure_temp_dir(),
             ),
             file_name=document.file_name,
             mime_type=document.mime_type,
@@ -219,8 +289,7 @@ def _handle_document_attachment(
         return preparation
 
     preparation.document_path = resolution.local_path
-    if resolution.cleanup_path:
-        preparation.cleanup_paths.append(resolution.cleanup_path)
+    preparation.track_cleanup_path(resolution.cleanup_path)
     preparation.append_context(
         attachment_processing.build_document_analysis_context(
             preparation.document_path,
@@ -231,27 +300,37 @@ def _handle_document_attachment(
     return preparation
 
 
+def _prompt_length_prevalidated(request: PromptRequest) -> bool:
+    # Update preparation sets length_validated once the exact prompt it hands
+    # to the worker has passed the max_input_chars check.
+    diagnostics = request.prompt_diagnostics
+    return isinstance(diagnostics, dict) and diagnostics.get("length_validated") is True
+
+
 def _finalize_prompt_preparation(
     request: PromptRequest,
     progress: Any,
     preparation: PromptPreparationState,
     *,
     send_input_too_long_fn,
+    already_validated: bool = False,
 ) -> Optional[PreparedPromptInput]:
     if not preparation.prompt_text:
         progress.mark_failure("No prompt content to execute.")
         return None
 
-    if len(preparation.prompt_text) > request.config.max_input_chars:
-        progress.mark_failure("Input rejected as too long.")
-        send_input_too_long_fn(
-            client=request.client,
-            chat_id=request.chat_id,
-            message_id=request.message_id,
-            actual_length=len(preparation.prompt_text),
-            max_input_chars=request.config.max_input_chars,
-        )
-        return None
+    if not already_validated:
+        prompt_length = len(preparation.prompt_text)
+        if prompt_length > request.config.max_input_chars:
+            progress.mark_failure("Input rejected as too long.")
+            send_input_too_long_fn(
+                client=request.client,
+                chat_id=request.chat_id,
+                message_id=request.message_id,
+                actual_length=prompt_length,
+                max_input_chars=request.config.max_input_chars,
+            )
+            return None
 
     return PreparedPromptInput(
         prompt_text=preparation.prompt_text,
@@ -259,13 +338,15 @@ def _finalize_prompt_preparation(
         image_paths=preparation.image_paths,
         document_path=preparation.document_path,
         cleanup_paths=preparation.cleanup_paths,
+        cleanup_dirs=[preparation.temp_dir] if preparation.temp_dir else [],
         attachment_file_ids=preparation.attachment_file_ids,
     )
 
 
-def prepare_prompt_input_request(
+def _run_prompt_preparation_stages(
     request: PromptRequest,
     progress: Any,
+    preparation: PromptPreparationState,
     *,
     transcribe_voice_for_chat_fn,
     strip_required_prefix_fn,
@@ -274,7 +355,6 @@ def prepare_prompt_input_request(
     emit_event_fn,
     prefix_help_message: str,
 ) -> Optional[PreparedPromptInput]:
-    preparation = PromptPreparationState(prompt_text=request.prompt.strip())
     channel_name = getattr(request.client, "channel_name", "telegram")
     attachment_store = getattr(request.state, "attachment_store", None)
 
@@ -313,8 +393,45 @@ def prepare_prompt_input_request(
         progress,
         preparation,
         send_input_too_long_fn=send_input_too_long_fn,
+        already_validated=preparation.already_validated,
     )
 
+
+def prepare_prompt_input_request(
+    request: PromptRequest,
+    progress: Any,
+    *,
+    transcribe_voice_for_chat_fn,
+    strip_required_prefix_fn,
+    is_whatsapp_channel_fn,
+    send_input_too_long_fn,
+    emit_event_fn,
+    prefix_help_message: str,
+) -> Optional[PreparedPromptInput]:
+    preparation = PromptPreparationState(
+        prompt_text=request.prompt.strip(),
+        already_validated=_prompt_length_prevalidated(request),
+    )
+    prepared: Optional[PreparedPromptInput] = None
+    try:
+        prepared = _run_prompt_preparation_stages(
+            request,
+            progress,
+            preparation,
+            transcribe_voice_for_chat_fn=transcribe_voice_for_chat_fn,
+            strip_required_prefix_fn=strip_required_prefix_fn,
+            is_whatsapp_channel_fn=is_whatsapp_channel_fn,
+            send_input_too_long_fn=send_input_too_long_fn,
+            emit_event_fn=emit_event_fn,
+            prefix_help_message=prefix_help_message,
+        )
+    finally:
+        # On success the caller owns temp_dir via cleanup_dirs; otherwise
+        # drop any partial downloads here.
+        if prepared is None and preparation.temp_dir is not None:
+            shutil.rmtree(preparation.temp_dir, ignore_errors=True)
+    return prepared
+
 def prewarm_attachment_archive_for_message(
     state,
     config,
@@ -6,6 +6,7 @@ import time
 from dataclasses import dataclass
 from typing import List, Optional
 
+from telegram_bridge.backoff import compute_backoff_seconds
 from telegram_bridge.channel_adapter import ChannelAdapter
 from telegram_bridge.conversation_scope import build_telegram_scope_key
 from telegram_bridge.engine_adapter import EngineAdapter
@@ -17,8 +18,30 @@ from telegram_bridge import prompt_execution
 from telegram_bridge import response_delivery
 from telegram_bridge.runtime_profile import RETRY_WITH_NEW_SESSION_PHASE, resume_retry_phase
 from telegram_bridge.state_store import StateRepository
+from telegram_bridge.stream_buffer import output_tail
 from telegram_bridge.structured_logging import emit_event
 
+EXECUTOR_RETRY_BACKOFF_CAP_SECONDS = 10.0
+
+
+def _wait_before_executor_retry(
+    config,
+    cancel_event: Optional[threading.Event],
+    failure_count: int,
+) -> None:
+    delay_seconds = compute_backoff_seconds(
+        getattr(config, "retry_sleep_seconds", 1.0),
+        failure_count,
+        cap_seconds=EXECUTOR_RETRY_BACKOFF_CAP_SECONDS,
+    )
+    if delay_seconds <= 0:
+        return
+    # Waiting on the cancel event keeps /cancel responsive during the pause.
+    if cancel_event is not None:
+        cancel_event.wait(delay_seconds)
+    else:
+        time.sleep(delay_seconds)
+
 
 @dataclass(frozen=True)
 class PromptRuntimeHooks:
@@ -351,6 +374,7 @@ def execute_prompt_with_retry(
                         "reason": "executor_exception",
                     },
                 )
+                _wait_before_executor_retry(config, cancel_event, attempt - 1)
                 continue
             progress.mark_failure("Execution failed before completion.")
             runtime_hooks.send_executor_failure_message_fn(
@@ -387,7 +411,7 @@ def execute_prompt_with_retry(
                 "Executor failed for chat_id=%s on resume due to invalid thread; "
                 "clearing thread and retrying as new. stderr=%r",
                 chat_id,
-                (result.stderr or "")[-1000:],
+                output_tail(result.stderr, 1000),
             )
             reset_and_retry_new = True
             progress.set_phase(runtime_hooks.resume_retry_phase_fn(config))
@@ -422,7 +446,7 @@ def execute_prompt_with_retry(
             "Executor failed for chat_id=%s returncode=%s stderr=%r",
             chat_id,
             result.returncode,
-            (result.stderr or "")[-1000:],
+            output_tail(result.stderr, 1000),
         )
         runtime_hooks.emit_event_fn(
             "bridge.request_failed",
@@ -14,6 +14,8 @@ CANCEL_SUCCESS_TOAST = "Remember proposal dismissed."
 UNKNOWN_PROPOSAL_TOAST = "Remember proposal not found."
 DELETE_SUCCESS_TOAST = "Removed from remember.md."
 UNKNOWN_ENTRY_TOAST = "Remembered item not found."
+# Proposals nobody tapped Save/Cancel on are dropped after this long.
+REMEMBER_PROPOSAL_TTL_SECONDS = 24 * 60 * 60
 
 NUMBERED_ENTRY_RE = re.compile(r"^\s*(\d+)\.\s+(.*\S)\s*$")
 
@@ -100,8 +102,19 @@ def _build_reply_markup(token: str) -> dict[str, object]:
 def _store_pending_proposal(state: State, scope_key: str, proposal: str) -> str:
     token = secrets.token_hex(8)
     pending = PendingRememberProposal(scope_key=scope_key, text=proposal)
+    cutoff = pending.created_at - REMEMBER_PROPOSAL_TTL_SECONDS
     with state.lock:
-        state.pending_remember_proposals[token] = pending
+        proposals = state.pending_remember_proposals
+        # Oldest first (insertion order): stop at the first proposal that is
+        # still fresh, so each store only touches the ones it drops.
+        stale_tokens = []
+        for stale_token, stale in proposals.items():
+            if stale.created_at > cutoff:
+                break
+            stale_tokens.append(stale_token)
+        for stale_token in stale_tokens:
+            del proposals[stale_token]
+        proposals[token] = pending
     return token
 
 
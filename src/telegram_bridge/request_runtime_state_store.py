@@ -2,7 +2,13 @@ import threading
 import time
 from typing import Dict
 
-from telegram_bridge.scope_state_store import load_json_object, persist_json_state_file
+from telegram_bridge.scope_state_store import (
+    load_journaled_json_object,
+    load_json_object,
+    next_snapshot_sequence,
+    persist_journaled_state_file,
+    persist_json_state_file,
+)
 from telegram_bridge.state_models import ScopeKey, State, WorkerSession, normalize_scope_key, normalize_scope_storage_key
 
 _IN_FLIGHT_WRITE_LOCK = threading.Lock()
@@ -14,6 +20,13 @@ _IN_FLIGHT_WRITE_LAST_PERSISTED: Dict[str, Dict[str, object]] = {}
 # Allow a short quiet window so overlapping request-start/request-finish updates
 # collapse into one persisted snapshot instead of thrashing the same file.
 _IN_FLIGHT_COALESCE_IDLE_SECONDS = 0.005
+_WORKER_SESSION_FIELDS = (
+    "created_at",
+    "last_used_at",
+    "thread_id",
+    "policy_fingerprint",
+    "hit_count",
+)
 
 
 def _persist_in_flight_snapshot(path_value: str, serialized: Dict[str, object]) -> None:
@@ -36,15 +49,16 @@ def _persist_in_flight_snapshot(path_value: str, serialized: Dict[str, object])
     saw_distinct_pending = False
     while True:
         try:
-            # In-flight request state churns on every request start/finish. Preserve
-            # atomic replacement but skip per-write fsync to avoid turning concurrent
-            # request bookkeeping into a disk-bound bottleneck.
+            # In-flight request state churns on every request start/finish and is
+            # only a crash-recovery hint, so rewrite it in place without a temp
+            # file or fsync to keep request bookkeeping off the disk-bound path.
             persist_json_state_file(
                 path_value,
                 next_payload,
                 fsync_file=False,
                 pretty=False,
                 delete_when_empty=True,
+                atomic=False,
             )
         except Exception:
             with _IN_FLIGHT_WRITE_LOCK:
@@ -89,7 +103,7 @@ def _persist_in_flight_snapshot(path_value: str, serialized: Dict[str, object])
 
 
 def load_worker_sessions(path: str) -> Dict[ScopeKey, WorkerSession]:
-    raw = load_json_object(path, state_label="worker session")
+    raw = load_journaled_json_object(path, state_label="worker session")
     parsed: Dict[ScopeKey, WorkerSession] = {}
     for key, value in raw.items():
         if not isinstance(value, dict):
@@ -101,6 +115,7 @@ def load_worker_sessions(path: str) -> Dict[ScopeKey, WorkerSession]:
         last_used_at = value.get("last_used_at")
         thread_id = value.get("thread_id")
         policy_fingerprint = value.get("policy_fingerprint")
+        hit_count = value.get("hit_count")
         if not isinstance(created_at, (int, float)):
             continue
         if not isinstance(last_used_at, (int, float)):
@@ -109,13 +124,17 @@ def load_worker_sessions(path: str) -> Dict[ScopeKey, WorkerSession]:
             thread_id = ""
         if not isinstance(policy_fingerprint, str):
             policy_fingerprint = ""
+        if not isinstance(hit_count, int) or hit_count < 0:
+            hit_count = 0
         parsed[scope_key] = WorkerSession(
             created_at=float(created_at),
             last_used_at=float(last_used_at),
             thread_id=thread_id.strip(),
             policy_fingerprint=policy_fingerprint.strip(),
+            hit_count=hit_count,
         )
-    return parsed
+    # The file is written with sorted keys; restore least-recently-used order.
+    return dict(sorted(parsed.items(), key=lambda item: item[1].last_used_at))
 
 
 def load_in_flight_requests(path: str) -> Dict[ScopeKey, Dict[str, object]]:
@@ -139,17 +158,41 @@ def load_in_flight_requests(path: str) -> Dict[ScopeKey, Dict[str, object]]:
 
 
 def persist_worker_sessions(state: State) -> None:
+    # Only copy flat value tuples while holding the lock; the per-session
+    # dicts are built after it is released.
     with state.lock:
-        serialized = {
-            normalize_scope_key(scope_key): {
-                "created_at": session.created_at,
-                "last_used_at": session.last_used_at,
-                "thread_id": session.thread_id,
-                "policy_fingerprint": session.policy_fingerprint,
-            }
+        rows = [
+            (
+                scope_key,
+                (
+                    session.created_at,
+                    session.last_used_at,
+                    session.thread_id,
+                    session.policy_fingerprint,
+                    session.hit_count,
+                ),
+            )
             for scope_key, session in state.worker_sessions.items()
-        }
-    persist_json_state_file(state.worker_sessions_path, serialized)
+        ]
+        sequence = next_snapshot_sequence()
+    serialized = {
+        normalize_scope_key(scope_key): dict(zip(_WORKER_SESSION_FIELDS, values))
+        for scope_key, values in rows
+    }
+    persist_journaled_state_file(
+        state.worker_sessions_path,
+        serialized,
+        fsync_file=state.persist_durable,
+        sequence=sequence,
+    )
+
+
+def request_worker_sessions_persist(state: State) -> None:
+    # Every request refreshes last_used_at and the hit count; the runtime
+    # flusher coalesces those into one journal append per burst.
+    flusher = state.worker_session_flusher
+    if flusher is None or not flusher.mark_dirty():
+        persist_worker_sessions(state)
 
 
 def persist_in_flight_requests(state: State) -> None:
@@ -42,42 +42,70 @@ def mark_in_flight_request(
     persist_in_flight_requests_fn(state)
     sync_canonical_session_fn(state, scope_key)
 
-def clear_in_flight_request(
+def clear_in_flight_request_locked(
     state: State,
     scope_key: ScopeKey,
     *,
-    normalize_scope_key_fn,
     canonical_session_is_empty_fn,
+) -> bool:
+    """Drop the in-flight marker for a normalized scope; caller holds ``state.lock``."""
+    if state.canonical_sessions_enabled:
+        session = state.chat_sessions.get(scope_key)
+        if session is None or (
+            session.in_flight_started_at is None
+            and session.in_flight_message_id is None
+        ):
+            return False
+        session.in_flight_started_at = None
+        session.in_flight_message_id = None
+        if canonical_session_is_empty_fn(session):
+            del state.chat_sessions[scope_key]
+        return True
+
+    if scope_key not in state.in_flight_requests:
+        return False
+    del state.in_flight_requests[scope_key]
+    return True
+
+def persist_cleared_in_flight_request(
+    state: State,
+    scope_key: ScopeKey,
+    *,
     persist_canonical_scope_and_mirror_legacy_fn,
     persist_in_flight_requests_fn,
     sync_canonical_session_fn,
 ) -> None:
-    scope_key = normalize_scope_key_fn(scope_key)
     if state.canonical_sessions_enabled:
-        changed = False
-        with state.lock:
-            session = state.chat_sessions.get(scope_key)
-            if session is not None and (
-                session.in_flight_started_at is not None
-                or session.in_flight_message_id is not None
-            ):
-                session.in_flight_started_at = None
-                session.in_flight_message_id = None
-                if canonical_session_is_empty_fn(session):
-                    del state.chat_sessions[scope_key]
-                changed = True
-        if changed:
-            persist_canonical_scope_and_mirror_legacy_fn(state, scope_key)
+        persist_canonical_scope_and_mirror_legacy_fn(state, scope_key)
         return
+    persist_in_flight_requests_fn(state)
+    sync_canonical_session_fn(state, scope_key)
 
-    removed = False
+def clear_in_flight_request(
+    state: State,
+    scope_key: ScopeKey,
+    *,
+    normalize_scope_key_fn,
+    canonical_session_is_empty_fn,
+    persist_canonical_scope_and_mirror_legacy_fn,
+    persist_in_flight_requests_fn,
+    sync_canonical_session_fn,
+) -> None:
+    scope_key = normalize_scope_key_fn(scope_key)
     with state.lock:
-        if scope_key in state.in_flight_requests:
-            del state.in_flight_requests[scope_key]
-            removed = True
+        removed = clear_in_flight_request_locked(
+            state,
+            scope_key,
+            canonical_session_is_empty_fn=canonical_session_is_empty_fn,
+        )
     if removed:
-        persist_in_flight_requests_fn(state)
-        sync_canonical_session_fn(state, scope_key)
+        persist_cleared_in_flight_request(
+            state,
+            scope_key,
+            persist_canonical_scope_and_mirror_legacy_fn=persist_canonical_scope_and_mirror_legacy_fn,
+            persist_in_flight_requests_fn=persist_in_flight_requests_fn,
+            sync_canonical_session_fn=sync_canonical_session_fn,
+        )
 
 def pop_interrupted_requests(
     state: State,
@@ -1,6 +1,8 @@
+import logging
 import threading
 from typing import List, Optional
 
+from telegram_bridge.background_tasks import submit_pooled_task
 from telegram_bridge.channel_adapter import ChannelAdapter
 from telegram_bridge.conversation_scope import build_telegram_scope_key
 from telegram_bridge.engine_adapter import EngineAdapter
@@ -20,6 +22,15 @@ from telegram_bridge.state_store import State
 
 
 def _start_worker(processor, request) -> None:
+    worker_pool = getattr(getattr(request, "state", None), "worker_pool", None)
+    if worker_pool is not None:
+        try:
+            submit_pooled_task(worker_pool, processor, request)
+            return
+        except RuntimeError:
+            # The pool refuses work once shutdown has begun; the chat is already
+            # marked busy, so the request must still run to release it.
+            logging.warning("Worker pool rejected request; running it on a dedicated thread.")
     start_background_worker(processor, request)
 
 
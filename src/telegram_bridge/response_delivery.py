@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
-from telegram_bridge.background_tasks import start_daemon_thread
+from telegram_bridge.background_tasks import send_polling_reply, start_daemon_thread
 from telegram_bridge.channel_adapter import ChannelAdapter
 from telegram_bridge.conversation_scope import parse_telegram_scope_key
 from telegram_bridge.handler_models import OutboundMediaDirective
@@ -31,6 +31,9 @@ REQUEST_CANCELED_MESSAGE = "Request canceled."
 
 EXECUTOR_USAGE_LIMIT_RE = re.compile(r"\bhit your usage limit\b", re.IGNORECASE)
 EXECUTOR_RETRY_AT_RE = re.compile(r"\btry again at ([0-9]{1,2}:\d{2}\s*[AP]M)\b", re.IGNORECASE)
+# Every known failure message mentions "usage"; whitespace and JSON escapes
+# between words would defeat a stricter probe on the raw streams.
+_KNOWN_EXECUTOR_FAILURE_PROBE_RE = re.compile(r"usage", re.IGNORECASE)
 
 @dataclass(frozen=True)
 class ParsedOutboundPayload:
@@ -475,8 +478,11 @@ def send_input_too_long(
     message_id: Optional[int],
     actual_length: int,
     max_input_chars: int,
+    state: Optional[State] = None,
 ) -> None:
-    client.send_message(
+    send_polling_reply(
+        state,
+        client,
         chat_id,
         f"Input too long ({actual_length} chars). Max is {max_input_chars}.",
         reply_to_message_id=message_id,
@@ -492,10 +498,14 @@ def send_prompt_trimmed_warning(
     max_input_chars: int,
     dropped_sections: list[str],
     trimmed_user_chars: int,
+    state: Optional[State] = None,
 ) -> None:
     dropped_text = ", ".join(dropped_sections) if dropped_sections else "none"
     trimmed_text = str(trimmed_user_chars) if trimmed_user_chars > 0 else "0"
-    client.send_message(
+    # Sent from the polling thread for accepted prompts; queue it when possible.
+    send_polling_reply(
+        state,
+        client,
         chat_id,
         (
             "Input was long, so the bridge trimmed prompt context before sending it to the model.\n"
@@ -590,6 +600,13 @@ def normalize_known_executor_failure_message(message: str) -> Optional[str]:
     return None
 
 def extract_executor_failure_message(stdout: str, stderr: str) -> Optional[str]:
+    # One scan per stream rules out the common case before any line is
+    # split, JSON-decoded, or normalized.
+    if not (
+        _KNOWN_EXECUTOR_FAILURE_PROBE_RE.search(stdout or "")
+        or _KNOWN_EXECUTOR_FAILURE_PROBE_RE.search(stderr or "")
+    ):
+        return None
     candidates: List[str] = []
     for stream in (stdout or "", stderr or ""):
         for raw_line in stream.splitlines():
@@ -7,7 +7,7 @@ import shlex
 import tomllib
 from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
 
 from telegram_bridge.env_parser import Env, build_voice_alias_replacements
 from telegram_bridge.runtime_paths import (
@@ -27,7 +27,7 @@ def normalize_filesystem_path(path_value: str) -> str:
 @dataclass
 class CoreConfig:
     token: str
-    allowed_chat_ids: Set[int]
+    allowed_chat_ids: FrozenSet[int]
     api_base: str
     poll_timeout_seconds: int
     retry_sleep_seconds: float
@@ -74,6 +74,8 @@ class SessionConfig:
     require_prefix_in_private: bool
     allow_private_chats_unlisted: bool
     allow_group_chats_unlisted: bool
+    state_persist_durable: bool = False
+    message_workers_max: int = 16
 
 
 @dataclass
@@ -282,7 +284,7 @@ def parse_plugin_name_env(name: str, default: str) -> str:
 def parse_plugin_list_env(name: str, default: List[str]) -> List[str]:
     return Env(name).as_lower_list(default)
 
-def parse_allowed_chat_ids(raw: str) -> Set[int]:
+def parse_allowed_chat_ids(raw: str) -> FrozenSet[int]:
     values = [item.strip() for item in raw.split(",") if item.strip()]
     if not values:
         raise ValueError("TELEGRAM_ALLOWED_CHAT_IDS is empty")
@@ -292,7 +294,8 @@ def parse_allowed_chat_ids(raw: str) -> Set[int]:
             parsed.add(int(value))
         except ValueError as exc:
             raise ValueError(f"Invalid TELEGRAM_ALLOWED_CHAT_IDS value: {value!r}") from exc
-    return parsed
+    # Checked on every update; freeze it once at load time.
+    return frozenset(parsed)
 
 def default_voice_alias_replacements() -> List[Tuple[str, str]]:
     """Deprecated: use telegram_bridge.env_parser.build_voice_alias_replacements."""
@@ -417,15 +420,17 @@ def resolve_runtime_identity() -> tuple[str, str, str, str, str]:
 def load_core_config_values(
     *,
     token: str,
-    allowed_chat_ids: Set[int],
+    allowed_chat_ids: FrozenSet[int],
     state_dir: str,
     exec_timeout_seconds: int,
 ) -> Dict[str, object]:
     return {
         "token": token,
-        "allowed_chat_ids": allowed_chat_ids,
+        "allowed_chat_ids": frozenset(allowed_chat_ids),
         "api_base": os.getenv("TELEGRAM_API_BASE", "https://api.telegram.org").rstrip("/"),
-        "poll_timeout_seconds": parse_int_env("TELEGRAM_POLL_TIMEOUT_SECONDS", 30),
+        # Telegram holds a long poll for up to 50s; 45s keeps idle getUpdates
+        # calls rare while the +10s socket timeout in transport stays ahead of it.
+        "poll_timeout_seconds": parse_int_env("TELEGRAM_POLL_TIMEOUT_SECONDS", 45),
         "retry_sleep_seconds": float(os.getenv("TELEGRAM_RETRY_SLEEP_SECONDS", "3")),
         "exec_timeout_seconds": exec_timeout_seconds,
         "max_input_chars": parse_int_env("TELEGRAM_MAX_INPUT_CHARS", TELEGRAM_LIMIT),
@@ -549,6 +554,15 @@ def load_session_config_values(
             "TELEGRAM_ALLOW_GROUP_CHATS_UNLISTED",
             False,
         ),
+        "state_persist_durable": parse_bool_env(
+            "TELEGRAM_STATE_PERSIST_DURABLE",
+            False,
+        ),
+        "message_workers_max": parse_int_env(
+            "TELEGRAM_MESSAGE_WORKERS_MAX",
+            16,
+            minimum=1,
+        ),
     }
 
 def load_identity_config_values(
@@ -821,7 +835,7 @@ def load_config() -> Config:
         "1.1.1.1",
     )
 
-    allowed_chat_ids = parse_allowed_chat_ids(raw_chat_ids) if raw_chat_ids else set()
+    allowed_chat_ids = parse_allowed_chat_ids(raw_chat_ids) if raw_chat_ids else frozenset()
     (
         assistant_name,
         progress_label,
@@ -47,6 +47,7 @@ YOUTUBE_LIGHTWEIGHT_REQUEST_RE = re.compile(
     r"^(?:(?:please|pls|summary|summarise|summarize|analyse|analyze|explain|transcript|full transcript|captions?|subtitles?|transcribe|translate|translation|key points?|timestamps?|таймкоды|переведи|перевод|суммаризируй|суммаризуй|кратко|краткое содержание|резюме|сводка|анализ|проанализируй|транскрипт|стенограмма|субтитры|расшифровка)(?:\s+(?:this|it|video|clip|short|link))?\s*)+$",
     re.IGNORECASE,
 )
+YOUTUBE_REQUEST_SEPARATOR_RE = re.compile(r"[\s\.,!?:;()\[\]{}'\"`~@#$%^&*_+=/\\|-]+")
 WHATSAPP_REPLY_PREFIX = "Даю справку:"
 WHATSAPP_REPLY_PREFIX_RE = re.compile(r"^\s*даю\s+справку\s*:\s*", re.IGNORECASE)
 WHATSAPP_LEGACY_REPLY_PREFIX_RE = re.compile(r"^\s*говорун\s*:\s*", re.IGNORECASE)
@@ -403,28 +404,45 @@ def extract_keyword_request(text: str, keywords: List[str]) -> tuple[bool, str]:
     if not stripped:
         return False, ""
 
-    lowered = stripped.lower()
+    # Every text message passes through several keyword checks; lowercase
+    # only the prefix each keyword could match, not the whole message.
     for keyword in keywords:
-        if lowered == keyword:
+        if stripped[: len(keyword)].lower() != keyword:
+            continue
+        remainder = stripped[len(keyword):]
+        if not remainder:
             return True, ""
-        if lowered.startswith(keyword):
-            remainder = stripped[len(keyword):]
-            if remainder and remainder[0] not in (" ", ":", "-"):
-                continue
-            return True, remainder.lstrip(" :-\t")
+        if remainder[0] not in (" ", ":", "-"):
+            continue
+        return True, remainder.lstrip(" :-\t")
     return False, ""
 
+HA_KEYWORDS = ["ha", "home assistant"]
+SERVER3_KEYWORDS = ["server3 tv"]
+NEXTCLOUD_KEYWORDS = ["nextcloud"]
+SRO_KEYWORDS = ["sro", "server3 runtime observer", "runtime observer"]
+PRIORITY_KEYWORD_INITIALS = frozenset(
+    keyword[0] for keyword in (*HA_KEYWORDS, *SERVER3_KEYWORDS, *NEXTCLOUD_KEYWORDS, *SRO_KEYWORDS)
+)
+
+def may_start_with_priority_keyword(text: str) -> bool:
+    """Cheap pre-check: False means no priority keyword extractor can match."""
+    for char in text:
+        if not char.isspace():
+            return char.lower() in PRIORITY_KEYWORD_INITIALS
+    return False
+
 def extract_ha_keyword_request(text: str) -> tuple[bool, str]:
-    return extract_keyword_request(text, ["ha", "home assistant"])
+    return extract_keyword_request(text, HA_KEYWORDS)
 
 def extract_server3_keyword_request(text: str) -> tuple[bool, str]:
-    return extract_keyword_request(text, ["server3 tv"])
+    return extract_keyword_request(text, SERVER3_KEYWORDS)
 
 def extract_nextcloud_keyword_request(text: str) -> tuple[bool, str]:
-    return extract_keyword_request(text, ["nextcloud"])
+    return extract_keyword_request(text, NEXTCLOUD_KEYWORDS)
 
 def extract_sro_keyword_request(text: str) -> tuple[bool, str]:
-    return extract_keyword_request(text, ["sro", "server3 runtime observer", "runtime observer"])
+    return extract_keyword_request(text, SRO_KEYWORDS)
 
 def extract_youtube_link_request(text: str) -> tuple[bool, str]:
     stripped = text.strip()
@@ -437,7 +455,7 @@ def extract_youtube_link_request(text: str) -> tuple[bool, str]:
 
     url = match.group("url").rstrip(").,!?]}'\"")
     remainder = f"{stripped[: match.start()]} {stripped[match.end() :]}"
-    normalized_remainder = re.sub(r"[\s\.,!?:;()\[\]{}'\"`~@#$%^&*_+=/\\|-]+", " ", remainder).strip()
+    normalized_remainder = YOUTUBE_REQUEST_SEPARATOR_RE.sub(" ", remainder).strip()
     if normalized_remainder and not YOUTUBE_LIGHTWEIGHT_REQUEST_RE.fullmatch(normalized_remainder):
         return False, ""
     return True, url
@@ -21,6 +21,7 @@ from telegram_bridge.runtime_profile import (
     extract_sro_keyword_request,
     extract_server3_keyword_request,
     extract_youtube_link_request,
+    may_start_with_priority_keyword,
 )
 
 
@@ -118,6 +119,10 @@ def apply_priority_keyword_routing(
             stateless=False,
             priority_keyword_mode=False,
         )
+    # Most messages (including /commands) cannot start with a keyword; skip
+    # the per-keyword strip-and-compare passes for them.
+    if not may_start_with_priority_keyword(prompt_input):
+        return _route_youtube_link(prompt_input=prompt_input, command=command)
 
     sro_keyword_mode, sro_request = extract_sro_keyword_request(prompt_input)
     if sro_keyword_mode:
@@ -195,6 +200,9 @@ def apply_priority_keyword_routing(
             routed_event="bridge.ha_keyword_routed",
         )
 
+    return _route_youtube_link(prompt_input=prompt_input, command=command)
+
+def _route_youtube_link(*, prompt_input: str, command: Optional[str]) -> KeywordRouteResult:
     youtube_link_mode, youtube_url = extract_youtube_link_request(prompt_input)
     if command is None and youtube_link_mode:
         return KeywordRouteResult(
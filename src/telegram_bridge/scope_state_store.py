@@ -1,16 +1,54 @@
+import itertools
 import json
 import os
 import tempfile
 import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
+from telegram_bridge import json_codec
 from telegram_bridge.conversation_scope import normalize_scope_storage_key
 from telegram_bridge.state_models import ScopeKey, State, normalize_scope_key
 
 _PERSIST_PATH_LOCKS: Dict[str, threading.Lock] = {}
 _PERSIST_PATH_LOCKS_LOCK = threading.Lock()
 
+# Hot per-scope maps (chat threads, worker sessions) keep a JSON snapshot plus
+# an append-only journal of changed keys, so each update costs one short
+# append instead of a rewrite of every scope. The snapshot is rewritten once
+# the journal outgrows the live map by this ratio (with a floor so small maps
+# are not compacted after every change), and on the first write to a file
+# that was never loaded through the journal.
+STATE_JOURNAL_SUFFIX = ".journal"
+STATE_JOURNAL_COMPACT_RATIO = 10
+STATE_JOURNAL_COMPACT_MIN_RECORDS = 256
+# path -> (map as last persisted, journal records since the last snapshot)
+_JOURNAL_BASELINES: Dict[str, Tuple[Dict[str, object], int]] = {}
+_JOURNAL_DELETED = object()
+# journal path -> append-only fd, kept open between flushes until compaction
+_JOURNAL_FDS: Dict[str, int] = {}
+
+# Snapshots are copied under state.lock but written under a per-path lock, so
+# two writers can reach the file in the opposite order. Snapshot sequences
+# (drawn while state.lock is held) let the older one skip its write instead
+# of landing over the newer state.
+_SNAPSHOT_SEQUENCE = itertools.count(1)
+_PERSISTED_SNAPSHOT_SEQUENCES: Dict[str, int] = {}
+
+
+def next_snapshot_sequence() -> int:
+    """Number a state snapshot; call while holding the lock it was copied under."""
+    return next(_SNAPSHOT_SEQUENCE)
+
+
+def _is_stale_snapshot_locked(normalized_path_value: str, sequence: Optional[int]) -> bool:
+    if sequence is None:
+        return False
+    if sequence < _PERSISTED_SNAPSHOT_SEQUENCES.get(normalized_path_value, 0):
+        return True
+    _PERSISTED_SNAPSHOT_SEQUENCES[normalized_path_value] = sequence
+    return False
+
 
 def normalize_path_value(path_value: str) -> str:
     return str(Path(path_value).expanduser())
@@ -27,11 +65,17 @@ def _persist_lock_for_path(path_value: str) -> threading.Lock:
 
 
 def load_json_object(path: str, *, state_label: str) -> Dict[object, object]:
-    data_path = Path(normalize_path_value(path))
-    if not data_path.exists():
+    # Reading straight away (no exists() probe) costs one failed open for a
+    # missing file and cannot race a concurrent replace.
+    try:
+        with open(normalize_path_value(path), "rb") as handle:
+            data = handle.read()
+    except (FileNotFoundError, NotADirectoryError):
         return {}
+    except Exception as exc:
+        raise ValueError(f"Failed to parse {state_label} state {path}: {exc}") from exc
     try:
-        raw = json.loads(data_path.read_text(encoding="utf-8"))
+        raw = json_codec.loads(data)
     except Exception as exc:
         raise ValueError(f"Failed to parse {state_label} state {path}: {exc}") from exc
     if not isinstance(raw, dict):
@@ -46,6 +90,8 @@ def persist_json_state_file(
     fsync_file: bool = True,
     pretty: bool = True,
     delete_when_empty: bool = False,
+    atomic: bool = True,
+    sequence: Optional[int] = None,
 ) -> None:
     if not path_value:
         return
@@ -53,37 +99,214 @@ def persist_json_state_file(
     path = Path(normalized_path_value)
     if delete_when_empty and not serialized:
         with _persist_lock_for_path(normalized_path_value):
+            if _is_stale_snapshot_locked(normalized_path_value, sequence):
+                return
             try:
                 path.unlink()
             except FileNotFoundError:
                 pass
         return
-    if pretty:
-        payload = json.dumps(serialized, indent=2, sort_keys=True) + "\n"
-    else:
-        payload = json.dumps(serialized, separators=(",", ":"), sort_keys=True)
+    payload = _format_state_payload(serialized, pretty=pretty)
     with _persist_lock_for_path(normalized_path_value):
-        path.parent.mkdir(parents=True, exist_ok=True)
-        fd, tmp_name = tempfile.mkstemp(
-            prefix=f".{path.name}.",
-            suffix=".tmp",
-            dir=str(path.parent),
+        if _is_stale_snapshot_locked(normalized_path_value, sequence):
+            return
+        _write_json_state_file_locked(
+            normalized_path_value,
+            payload,
+            fsync_file=fsync_file,
+            atomic=atomic,
         )
-        tmp_path = Path(tmp_name)
+
+
+def _format_state_payload(serialized: Dict[str, object], *, pretty: bool = True) -> str:
+    return json_codec.dumps_state(serialized, pretty=pretty)
+
+
+def _write_all(fd: int, data: bytes, *, fsync_file: bool) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    if fsync_file:
+        os.fsync(fd)
+
+
+def _write_json_state_file_locked(
+    normalized_path_value: str,
+    payload: str,
+    *,
+    fsync_file: bool,
+    atomic: bool = True,
+) -> None:
+    path = Path(normalized_path_value)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not atomic:
+        # Best-effort state (a torn file is quarantined on load) is rewritten
+        # in place; Path.replace alone never fsyncs the directory either.
+        fd = os.open(normalized_path_value, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            _write_all(fd, payload.encode("utf-8"), fsync_file=fsync_file)
+        finally:
+            os.close(fd)
+        return
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        dir=str(path.parent),
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        try:
+            _write_all(fd, payload.encode("utf-8"), fsync_file=fsync_file)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, normalized_path_value)
+    except Exception:
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as handle:
-                handle.write(payload)
-                handle.flush()
-                if fsync_file:
-                    os.fsync(handle.fileno())
-            tmp_path.replace(path)
-        except Exception:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def state_journal_path(path_value: str) -> str:
+    return normalize_path_value(path_value) + STATE_JOURNAL_SUFFIX
+
+
+def _replay_state_journal(journal_path: Path, raw: Dict[object, object]) -> int:
+    try:
+        handle = journal_path.open("r+b")
+    except FileNotFoundError:
+        return 0
+    records = 0
+    good_end = 0
+    with handle:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
             try:
-                if tmp_path.exists():
-                    tmp_path.unlink()
-            except OSError:
-                pass
-            raise
+                record = json_codec.loads(line.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                break
+            good_end += len(line)
+            if not isinstance(record, dict) or not isinstance(record.get("k"), str):
+                continue
+            records += 1
+            if "v" in record:
+                raw[record["k"]] = record["v"]
+            else:
+                raw.pop(record["k"], None)
+        # A crash mid-append can only tear the final record. Cut it off, or
+        # every later O_APPEND record would land behind it and be skipped
+        # on the next replay.
+        if handle.seek(0, os.SEEK_END) != good_end:
+            handle.truncate(good_end)
+    return records
+
+
+def load_journaled_json_object(path: str, *, state_label: str) -> Dict[object, object]:
+    raw = load_json_object(path, state_label=state_label)
+    normalized_path_value = normalize_path_value(path)
+    with _persist_lock_for_path(normalized_path_value):
+        _close_journal_fd_locked(state_journal_path(path))
+        records = _replay_state_journal(Path(state_journal_path(path)), raw)
+        _JOURNAL_BASELINES[normalized_path_value] = (dict(raw), records)
+    return raw
+
+
+def _append_state_journal_locked(
+    journal_path: str,
+    changes: List[Tuple[str, object]],
+    *,
+    fsync_file: bool,
+) -> None:
+    lines = []
+    for key, value in changes:
+        record = {"k": key} if value is _JOURNAL_DELETED else {"k": key, "v": value}
+        lines.append(json_codec.dumps_compact(record, sort_keys=True) + "\n")
+    fd = _JOURNAL_FDS.get(journal_path)
+    if fd is None:
+        Path(journal_path).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        _JOURNAL_FDS[journal_path] = fd
+    try:
+        _write_all(fd, "".join(lines).encode("utf-8"), fsync_file=fsync_file)
+    except OSError:
+        _close_journal_fd_locked(journal_path)
+        raise
+
+
+def _close_journal_fd_locked(journal_path: str) -> None:
+    fd = _JOURNAL_FDS.pop(journal_path, None)
+    if fd is not None:
+        os.close(fd)
+
+
+def close_state_journals() -> None:
+    """Close every journal fd left open between flushes; call once flushing stops."""
+    for journal_path in list(_JOURNAL_FDS):
+        with _persist_lock_for_path(journal_path[: -len(STATE_JOURNAL_SUFFIX)]):
+            _close_journal_fd_locked(journal_path)
+
+
+def _compact_state_journal_locked(
+    normalized_path_value: str,
+    serialized: Dict[str, object],
+    *,
+    fsync_file: bool,
+) -> None:
+    # The journal already covers everything in the new snapshot, so a crash
+    # between the snapshot replace and the unlink replays to the same state.
+    _write_json_state_file_locked(
+        normalized_path_value,
+        _format_state_payload(serialized),
+        fsync_file=fsync_file,
+    )
+    _close_journal_fd_locked(normalized_path_value + STATE_JOURNAL_SUFFIX)
+    try:
+        os.unlink(normalized_path_value + STATE_JOURNAL_SUFFIX)
+    except FileNotFoundError:
+        pass
+
+
+def persist_journaled_state_file(
+    path_value: str,
+    serialized: Dict[str, object],
+    *,
+    fsync_file: bool = True,
+    sequence: Optional[int] = None,
+) -> None:
+    if not path_value:
+        return
+    normalized_path_value = normalize_path_value(path_value)
+    with _persist_lock_for_path(normalized_path_value):
+        if _is_stale_snapshot_locked(normalized_path_value, sequence):
+            return
+        baseline = _JOURNAL_BASELINES.get(normalized_path_value)
+        if baseline is None:
+            # Nothing loaded through the journal yet: start from a snapshot.
+            _compact_state_journal_locked(normalized_path_value, serialized, fsync_file=fsync_file)
+            _JOURNAL_BASELINES[normalized_path_value] = (dict(serialized), 0)
+            return
+        previous, records = baseline
+        changes: List[Tuple[str, object]] = [
+            (key, value)
+            for key, value in serialized.items()
+            if key not in previous or previous[key] != value
+        ]
+        changes.extend((key, _JOURNAL_DELETED) for key in previous if key not in serialized)
+        if not changes:
+            return
+        _append_state_journal_locked(
+            normalized_path_value + STATE_JOURNAL_SUFFIX,
+            changes,
+            fsync_file=fsync_file,
+        )
+        records += len(changes)
+        if records > max(STATE_JOURNAL_COMPACT_MIN_RECORDS, STATE_JOURNAL_COMPACT_RATIO * len(serialized)):
+            _compact_state_journal_locked(normalized_path_value, serialized, fsync_file=fsync_file)
+            records = 0
+        _JOURNAL_BASELINES[normalized_path_value] = (dict(serialized), records)
 
 
 def _load_scope_string_map(
@@ -91,8 +314,9 @@ def _load_scope_string_map(
     *,
     state_label: str,
     normalize_value,
+    load_object=load_json_object,
 ) -> Dict[ScopeKey, str]:
-    raw = load_json_object(path, state_label=state_label)
+    raw = load_object(path, state_label=state_label)
     parsed: Dict[ScopeKey, str] = {}
     for key, value in raw.items():
         if not isinstance(value, str) or not value.strip():
@@ -111,6 +335,7 @@ def load_chat_threads(path: str) -> Dict[ScopeKey, str]:
         path,
         state_label="chat thread",
         normalize_value=lambda value: value,
+        load_object=load_journaled_json_object,
     )
 
 
@@ -162,54 +387,143 @@ def load_chat_pi_providers(path: str) -> Dict[ScopeKey, str]:
     )
 
 
-def _persist_scope_string_map(path_value: str, values: Dict[ScopeKey, str]) -> None:
+def _persist_scope_string_map(
+    path_value: str,
+    values: Dict[ScopeKey, str],
+    *,
+    fsync_file: bool = True,
+    sequence: Optional[int] = None,
+) -> None:
     serialized = {
         normalize_scope_key(scope_key): value
         for scope_key, value in values.items()
     }
-    persist_json_state_file(path_value, serialized)
+    persist_json_state_file(path_value, serialized, fsync_file=fsync_file, sequence=sequence)
 
 
 def persist_chat_threads(state: State) -> None:
     with state.lock:
-        values = dict(state.chat_threads)
-    _persist_scope_string_map(state.chat_thread_path, values)
+        serialized = {
+            normalize_scope_key(scope_key): value
+            for scope_key, value in state.chat_threads.items()
+        }
+        sequence = next_snapshot_sequence()
+    persist_journaled_state_file(
+        state.chat_thread_path,
+        serialized,
+        fsync_file=state.persist_durable,
+        sequence=sequence,
+    )
 
 
-def persist_chat_engines(state: State) -> None:
-    with state.lock:
-        values = dict(state.chat_engines)
-    _persist_scope_string_map(state.chat_engine_path, values)
+def request_chat_threads_persist(state: State) -> None:
+    # Every reply rebinds a thread id; the runtime flusher coalesces those
+    # bursts into one journal append instead of one per message.
+    flusher = state.chat_thread_flusher
+    if flusher is None or not flusher.mark_dirty():
+        persist_chat_threads(state)
 
 
-def persist_chat_codex_models(state: State) -> None:
-    with state.lock:
-        values = dict(state.chat_codex_models)
-    _persist_scope_string_map(state.chat_codex_model_path, values)
+def persist_chat_engines(
+    state: State,
+    values: Optional[Dict[ScopeKey, str]] = None,
+    sequence: Optional[int] = None,
+) -> None:
+    if values is None:
+        with state.lock:
+            values = dict(state.chat_engines)
+            sequence = next_snapshot_sequence()
+    _persist_scope_string_map(
+        state.chat_engine_path,
+        values,
+        fsync_file=state.persist_durable,
+        sequence=sequence,
+    )
 
 
-def persist_chat_gemma_models(state: State) -> None:
-    with state.lock:
-        values = dict(state.chat_gemma_models)
-    _persist_scope_string_map(state.chat_gemma_model_path, values)
+def persist_chat_codex_models(
+    state: State,
+    values: Optional[Dict[ScopeKey, str]] = None,
+    sequence: Optional[int] = None,
+) -> None:
+    if values is None:
+        with state.lock:
+            values = dict(state.chat_codex_models)
+            sequence = next_snapshot_sequence()
+    _persist_scope_string_map(
+        state.chat_codex_model_path,
+        values,
+        fsync_file=state.persist_durable,
+        sequence=sequence,
+    )
 
 
-def persist_chat_codex_efforts(state: State) -> None:
-    with state.lock:
-        values = dict(state.chat_codex_efforts)
-    _persist_scope_string_map(state.chat_codex_effort_path, values)
+def persist_chat_gemma_models(
+    state: State,
+    values: Optional[Dict[ScopeKey, str]] = None,
+    sequence: Optional[int] = None,
+) -> None:
+    if values is None:
+        with state.lock:
+            values = dict(state.chat_gemma_models)
+            sequence = next_snapshot_sequence()
+    _persist_scope_string_map(
+        state.chat_gemma_model_path,
+        values,
+        fsync_file=state.persist_durable,
+        sequence=sequence,
+    )
 
 
-def persist_chat_pi_models(state: State) -> None:
-    with state.lock:
-        values = dict(state.chat_pi_models)
-    _persist_scope_string_map(state.chat_pi_model_path, values)
+def persist_chat_codex_efforts(
+    state: State,
+    values: Optional[Dict[ScopeKey, str]] = None,
+    sequence: Optional[int] = None,
+) -> None:
+    if values is None:
+        with state.lock:
+            values = dict(state.chat_codex_efforts)
+            sequence = next_snapshot_sequence()
+    _persist_scope_string_map(
+        state.chat_codex_effort_path,
+        values,
+        fsync_file=state.persist_durable,
+        sequence=sequence,
+    )
 
 
-def persist_chat_pi_providers(state: State) -> None:
-    with state.lock:
-        values = dict(state.chat_pi_providers)
-    _persist_scope_string_map(state.chat_pi_provider_path, values)
+def persist_chat_pi_models(
+    state: State,
+    values: Optional[Dict[ScopeKey, str]] = None,
+    sequence: Optional[int] = None,
+) -> None:
+    if values is None:
+        with state.lock:
+            values = dict(state.chat_pi_models)
+            sequence = next_snapshot_sequence()
+    _persist_scope_string_map(
+        state.chat_pi_model_path,
+        values,
+        fsync_file=state.persist_durable,
+        sequence=sequence,
+    )
+
+
+def persist_chat_pi_providers(
+    state: State,
+    values: Optional[Dict[ScopeKey, str]] = None,
+    sequence: Optional[int] = None,
+) -> None:
+    if values is None:
+        with state.lock:
+            values = dict(state.chat_pi_providers)
+            sequence = next_snapshot_sequence()
+    _persist_scope_string_map(
+        state.chat_pi_provider_path,
+        values,
+        fsync_file=state.persist_durable,
+        sequence=sequence,
+    )
 
 
 def _get_string_override(
@@ -220,8 +534,8 @@ def _get_string_override(
     normalize=str.strip,
 ) -> Optional[str]:
     scope_key = normalize_scope_key(scope_key)
-    with state.lock:
-        value = normalize(values.get(scope_key, ""))
+    # Lock-free like get_thread_id: one atomic dict get of an immutable str.
+    value = normalize(values.get(scope_key, ""))
     return value or None
 
 
@@ -236,9 +550,13 @@ def _set_string_override(
 ) -> None:
     scope_key = normalize_scope_key(scope_key)
     normalized_value = normalize(raw_value)
+    # Snapshot in the same critical section as the update; persist_fn only
+    # serializes and writes, outside the lock.
     with state.lock:
         values[scope_key] = normalized_value
-    persist_fn(state)
+        snapshot = dict(values)
+        sequence = next_snapshot_sequence()
+    persist_fn(state, snapshot, sequence)
 
 
 def _clear_string_override(
@@ -248,14 +566,16 @@ def _clear_string_override(
     persist_fn,
 ) -> bool:
     scope_key = normalize_scope_key(scope_key)
-    removed = False
+    snapshot = None
     with state.lock:
         if scope_key in values:
             del values[scope_key]
-            removed = True
-    if removed:
-        persist_fn(state)
-    return removed
+            snapshot = dict(values)
+            sequence = next_snapshot_sequence()
+    if snapshot is None:
+        return False
+    persist_fn(state, snapshot, sequence)
+    return True
 
 
 def get_chat_engine(state: State, scope_key: ScopeKey) -> Optional[str]:
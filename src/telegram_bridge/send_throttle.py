@@ -0,0 +1,93 @@
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional
+
+PER_KEY_BUCKET_PRUNE_THRESHOLD = 1024
+
+
+class TokenBucket:
+    """Monotonic-clock token bucket; reservations may drive tokens negative."""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: float,
+        *,
+        now: float,
+    ) -> None:
+        self.rate_per_second = max(1e-6, float(rate_per_second))
+        self.burst = max(1.0, float(burst))
+        self.tokens = self.burst
+        self.updated_at = now
+
+    def refill(self, now: float) -> None:
+        if now > self.updated_at:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate_per_second)
+            self.updated_at = now
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        self.refill(now)
+        self.tokens -= 1.0
+        if self.tokens >= 0.0:
+            return 0.0
+        return -self.tokens / self.rate_per_second
+
+    def try_take(self, now: float) -> bool:
+        self.refill(now)
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+    def is_full(self, now: float) -> bool:
+        self.refill(now)
+        return self.tokens >= self.burst
+
+
+def prune_full_buckets(buckets: Dict[Hashable, TokenBucket], now: float) -> None:
+    """Drop buckets that have refilled completely; a fresh one is equivalent."""
+    for key in [key for key, bucket in buckets.items() if bucket.is_full(now)]:
+        del buckets[key]
+
+
+class SendThrottle:
+    """Pace outbound sends against one global bucket plus one bucket per chat."""
+
+    def __init__(
+        self,
+        global_rate_per_second: float,
+        global_burst: float,
+        per_key_rate_per_second: float,
+        per_key_burst: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._global = TokenBucket(global_rate_per_second, global_burst, now=clock())
+        self._per_key_rate_per_second = per_key_rate_per_second
+        self._per_key_burst = per_key_burst
+        self._per_key: Dict[Hashable, TokenBucket] = {}
+
+    def reserve(self, key: Optional[Hashable] = None) -> float:
+        with self._lock:
+            now = self._clock()
+            delay_seconds = self._global.reserve(now)
+            if key is None:
+                return delay_seconds
+            bucket = self._per_key.get(key)
+            if bucket is None:
+                if len(self._per_key) >= PER_KEY_BUCKET_PRUNE_THRESHOLD:
+                    prune_full_buckets(self._per_key, now)
+                bucket = TokenBucket(self._per_key_rate_per_second, self._per_key_burst, now=now)
+                self._per_key[key] = bucket
+            return max(delay_seconds, bucket.reserve(now))
+
+    def acquire(self, key: Optional[Hashable] = None) -> float:
+        delay_seconds = self.reserve(key)
+        if delay_seconds > 0:
+            self._sleep(delay_seconds)
+        return delay_seconds
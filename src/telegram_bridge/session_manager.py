@@ -5,6 +5,7 @@ import subprocess
 import threading
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -18,12 +19,18 @@ from telegram_bridge.state_store import (
     WorkerSession,
     canonical_session_is_empty,
     clear_worker_session,
-    clear_in_flight_request,
+    clear_in_flight_request_locked,
+    mark_worker_session_recent,
     persist_canonical_sessions,
     persist_chat_threads,
+    persist_cleared_in_flight_request,
     persist_worker_sessions,
+    request_chat_threads_persist,
+    request_worker_sessions_persist,
     sync_canonical_session,
 )
+from telegram_bridge.send_throttle import PER_KEY_BUCKET_PRUNE_THRESHOLD, TokenBucket, prune_full_buckets
+from telegram_bridge.stream_buffer import output_tail
 from telegram_bridge.structured_logging import emit_event
 
 
@@ -38,6 +45,9 @@ def _session_config(config):
 def build_repo_root() -> str:
     return build_shared_core_root()
 
+# Every per-message state check (rate limit, busy, cancel) maps the scope key
+# to its legacy chat-id alias; the parse is pure, so it is cached per key.
+@lru_cache(maxsize=1024)
 def _legacy_scope_alias(scope_key: str) -> Optional[int]:
     try:
         target = parse_telegram_scope_key(scope_key)
@@ -87,42 +97,70 @@ def _normalize_policy_path(path: object) -> str:
         return ""
     return str(Path(raw).expanduser().resolve())
 
+PolicyFileSignature = tuple[str, Optional[int], Optional[int], Optional[int]]
+
+_policy_signature_memo_lock = threading.Lock()
+_policy_signature_memo: Optional[tuple[tuple[PolicyFileSignature, ...], str]] = None
+
+def _policy_file_signature(normalized_path: str) -> PolicyFileSignature:
+    try:
+        stats = os.stat(normalized_path)
+    except OSError:
+        return (normalized_path, None, None, None)
+    return (normalized_path, stats.st_mtime_ns, stats.st_size, stats.st_ino)
+
 def compute_policy_fingerprint(paths: List[str]) -> str:
+    global _policy_signature_memo
+    # Canonical order so the startup fingerprint matches the sorted, de-duplicated
+    # paths get_cached_policy_fingerprint() checks sessions against.
+    signatures = tuple(
+        _policy_file_signature(normalized_path)
+        for normalized_path in _normalize_policy_fingerprint_paths(paths)
+    )
+    with _policy_signature_memo_lock:
+        memo = _policy_signature_memo
+    if memo is not None and memo[0] == signatures:
+        return memo[1]
+
     hasher = hashlib.sha256()
-    for file_path in paths:
-        normalized_path = _normalize_policy_path(file_path)
-        if not normalized_path:
-            continue
+    for normalized_path, mtime_ns, size, _inode in signatures:
         hasher.update(normalized_path.encode("utf-8"))
         hasher.update(b"\0")
-        try:
-            stats = os.stat(normalized_path)
-            hasher.update(str(stats.st_mtime_ns).encode("utf-8"))
-            hasher.update(b":")
-            hasher.update(str(stats.st_size).encode("utf-8"))
-        except OSError:
+        if mtime_ns is None:
             hasher.update(b"missing")
+        else:
+            hasher.update(str(mtime_ns).encode("utf-8"))
+            hasher.update(b":")
+            hasher.update(str(size).encode("utf-8"))
         hasher.update(b"\0")
-    return hasher.hexdigest()
+    fingerprint = hasher.hexdigest()
+    with _policy_signature_memo_lock:
+        _policy_signature_memo = (signatures, fingerprint)
+    return fingerprint
 
 def is_rate_limited(state: State, config, scope_key: str) -> bool:
     core = _core_config(config)
-    now = time.time()
+    limit_per_minute = core.rate_limit_per_minute
+    if limit_per_minute <= 0:
+        return True
+    now = time.monotonic()
     legacy_alias = _legacy_scope_alias(scope_key)
     with state.lock:
-        entries = state.recent_requests.get(scope_key)
-        if entries is None and legacy_alias is not None:
-            entries = state.recent_requests.pop(legacy_alias, None)
-            if entries is not None:
-                state.recent_requests[scope_key] = entries
-        if entries is None:
-            entries = state.recent_requests.setdefault(scope_key, [])
-        threshold = now - 60
-        entries[:] = [t for t in entries if t >= threshold]
-        if len(entries) >= core.rate_limit_per_minute:
-            return True
-        entries.append(now)
-    return False
+        bucket = state.recent_requests.get(scope_key)
+        if bucket is None and legacy_alias is not None:
+            bucket = state.recent_requests.pop(legacy_alias, None)
+            if bucket is not None:
+                state.recent_requests[scope_key] = bucket
+        if bucket is None:
+            if len(state.recent_requests) >= PER_KEY_BUCKET_PRUNE_THRESHOLD:
+                prune_full_buckets(state.recent_requests, now)
+            # Sustained throughput is limit per minute, but an idle scope
+            # starts with a full burst of limit and refills at limit/60 per
+            # second meanwhile, so up to about twice the limit can pass in
+            # the first minute (the old sliding window capped it at limit).
+            bucket = TokenBucket(limit_per_minute / 60.0, limit_per_minute, now=now)
+            state.recent_requests[scope_key] = bucket
+        return not bucket.try_take(now)
 
 def mark_busy(state: State, scope_key: str) -> bool:
     legacy_alias = _legacy_scope_alias(scope_key)
@@ -136,12 +174,15 @@ def mark_busy(state: State, scope_key: str) -> bool:
             state.busy_chats.discard(legacy_alias)
     return True
 
-def clear_busy(state: State, scope_key: str) -> None:
+def _clear_busy_locked(state: State, scope_key: str) -> None:
     legacy_alias = _legacy_scope_alias(scope_key)
+    state.busy_chats.discard(scope_key)
+    if legacy_alias is not None:
+        state.busy_chats.discard(legacy_alias)
+
+def clear_busy(state: State, scope_key: str) -> None:
     with state.lock:
-        state.busy_chats.discard(scope_key)
-        if legacy_alias is not None:
-            state.busy_chats.discard(legacy_alias)
+        _clear_busy_locked(state, scope_key)
 
 def _has_active_worker(session: Optional[CanonicalSession]) -> bool:
     return (
@@ -160,6 +201,10 @@ WORKER_POLICY_REFRESH_MESSAGE = (
 )
 WORKER_CAPACITY_REJECTED_MESSAGE = "All workers are currently in use. Please wait and retry."
 POLICY_FINGERPRINT_CACHE_TTL_SECONDS = 10.0
+# Capacity eviction compares use counters across the oldest few idle workers
+# (approximate LFU) instead of strictly evicting the least recently used one.
+WORKER_EVICTION_SAMPLE_SIZE = 4
+WORKER_SESSION_HIT_COUNT_LIMIT = 1 << 20
 
 _policy_fingerprint_cache_lock = threading.Lock()
 _policy_fingerprint_cache: dict[tuple[str, ...], tuple[float, str]] = {}
@@ -319,6 +364,31 @@ def _ensure_chat_worker_session_canonical(
         session_replaced_for_policy=session_replaced_for_policy,
     )
 
+def _select_idle_worker_to_evict(state: State, scope_key: str) -> Optional[str]:
+    # worker_sessions is kept in least-recently-used order; sample the oldest
+    # idle entries and evict the one with the fewest hits (oldest on ties).
+    victim_scope_key: Optional[str] = None
+    victim_hit_count = 0
+    sampled = 0
+    for candidate_scope_key, candidate_session in state.worker_sessions.items():
+        if candidate_scope_key == scope_key or _scope_is_busy(state, candidate_scope_key):
+            continue
+        if victim_scope_key is None or candidate_session.hit_count < victim_hit_count:
+            victim_scope_key = candidate_scope_key
+            victim_hit_count = candidate_session.hit_count
+        sampled += 1
+        if sampled >= WORKER_EVICTION_SAMPLE_SIZE:
+            break
+    return victim_scope_key
+
+def _record_worker_session_hit(state: State, session: WorkerSession) -> None:
+    session.hit_count += 1
+    if session.hit_count < WORKER_SESSION_HIT_COUNT_LIMIT:
+        return
+    # Age every counter so long-lived sessions cannot pin capacity forever.
+    for candidate_session in state.worker_sessions.values():
+        candidate_session.hit_count >>= 1
+
 def _ensure_chat_worker_session_legacy(
     state: State,
     config,
@@ -351,14 +421,8 @@ def _ensure_chat_worker_session_legacy(
             needs_persist_sessions = True
 
         if session is None and len(state.worker_sessions) >= session_config.persistent_workers_max:
-            idle_candidates = [
-                (candidate_scope_key, candidate_session)
-                for candidate_scope_key, candidate_session in state.worker_sessions.items()
-                if not _scope_is_busy(state, candidate_scope_key) and candidate_scope_key != scope_key
-            ]
-            if idle_candidates:
-                idle_candidates.sort(key=lambda item: item[1].last_used_at)
-                evicted_idle_scope_key = idle_candidates[0][0]
+            evicted_idle_scope_key = _select_idle_worker_to_evict(state, scope_key)
+            if evicted_idle_scope_key is not None:
                 del state.worker_sessions[evicted_idle_scope_key]
                 if evicted_idle_scope_key in state.chat_threads:
                     del state.chat_threads[evicted_idle_scope_key]
@@ -376,18 +440,21 @@ def _ensure_chat_worker_session_legacy(
                     last_used_at=now,
                     thread_id=seed_thread_id,
                     policy_fingerprint=current_policy_fingerprint,
+                    hit_count=1,
                 )
                 needs_persist_sessions = True
             else:
                 session.last_used_at = now
                 session.policy_fingerprint = current_policy_fingerprint
                 session.thread_id = state.chat_threads.get(scope_key, session.thread_id)
+                _record_worker_session_hit(state, session)
+                mark_worker_session_recent(state.worker_sessions, scope_key)
                 needs_persist_sessions = True
 
     if needs_persist_threads:
-        persist_chat_threads(state)
+        request_chat_threads_persist(state)
     if needs_persist_sessions:
-        persist_worker_sessions(state)
+        request_worker_sessions_persist(state)
     if state.canonical_sessions_enabled:
         sync_canonical_session(state, scope_key)
         if evicted_idle_scope_key is not None:
@@ -506,9 +573,13 @@ def expire_idle_worker_sessions(
                     continue
                 expired_scope_keys.append(scope_key)
         else:
+            # Oldest first (LRU order): stop at the first idle worker that is
+            # still fresh; busy workers are skipped without ending the scan.
             for scope_key, session in state.worker_sessions.items():
-                if session.last_used_at > cutoff or _scope_is_busy(state, scope_key):
+                if _scope_is_busy(state, scope_key):
                     continue
+                if session.last_used_at > cutoff:
+                    break
                 expired_scope_keys.append(_normalize_scope_key(scope_key))
 
     if not expired_scope_keys:
@@ -569,24 +640,27 @@ def request_safe_restart(
         )
         return "run_now", busy_count
 
+def _pop_ready_restart_request_locked(state: State) -> Optional[tuple[int, Optional[int], Optional[int]]]:
+    if state.restart_in_progress:
+        return None
+    if not state.restart_requested:
+        return None
+    if state.busy_chats:
+        return None
+    if state.restart_chat_id is None:
+        return None
+
+    state.restart_requested = False
+    state.restart_in_progress = True
+    return (
+        state.restart_chat_id,
+        state.restart_message_thread_id,
+        state.restart_reply_to_message_id,
+    )
+
 def pop_ready_restart_request(state: State) -> Optional[tuple[int, Optional[int], Optional[int]]]:
     with state.lock:
-        if state.restart_in_progress:
-            return None
-        if not state.restart_requested:
-            return None
-        if state.busy_chats:
-            return None
-        if state.restart_chat_id is None:
-            return None
-
-        state.restart_requested = False
-        state.restart_in_progress = True
-        return (
-            state.restart_chat_id,
-            state.restart_message_thread_id,
-            state.restart_reply_to_message_id,
-        )
+        return _pop_ready_restart_request_locked(state)
 
 def finish_restart_attempt(state: State) -> None:
     with state.lock:
@@ -598,11 +672,9 @@ def reset_codex_session_state_for_restart(state: State) -> dict[str, int]:
 
     if state.canonical_sessions_enabled:
         changed = False
+        emptied_scope_keys: List[str] = []
         with state.lock:
-            for scope_key in list(state.chat_sessions):
-                session = state.chat_sessions.get(scope_key)
-                if session is None:
-                    continue
+            for scope_key, session in state.chat_sessions.items():
                 had_thread = bool(session.thread_id)
                 had_worker = (
                     session.worker_created_at is not None
@@ -620,8 +692,10 @@ def reset_codex_session_state_for_restart(state: State) -> dict[str, int]:
                     session.worker_last_used_at = None
                     session.worker_policy_fingerprint = ""
                 if canonical_session_is_empty(session):
-                    del state.chat_sessions[scope_key]
+                    emptied_scope_keys.append(scope_key)
                 changed = True
+            for scope_key in emptied_scope_keys:
+                del state.chat_sessions[scope_key]
         if changed:
             persist_canonical_sessions(state)
         return {"threads": cleared_threads, "workers": cleared_workers}
@@ -665,8 +739,8 @@ def run_restart_script(
     try:
         result = subprocess.run(
             ["bash", script_path, "--unit", restart_unit],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             timeout=90,
             check=False,
         )
@@ -705,7 +779,7 @@ def run_restart_script(
         logging.error(
             "Bridge restart command failed returncode=%s stderr=%r",
             result.returncode,
-            (result.stderr or "")[-1000:],
+            output_tail(result.stderr, 1000),
         )
         emit_event(
             "bridge.restart_script_failed",
@@ -748,6 +822,22 @@ def trigger_restart_async(
         reply_to_message_id,
     )
 
+def _finalize_locked(
+    state: State,
+    scope_key: str,
+) -> tuple[bool, Optional[tuple[int, Optional[int], Optional[int]]]]:
+    # One lock hold for in-flight clear, busy release and restart hand-off;
+    # persistence and notifications happen after the lock is released.
+    in_flight_removed = False
+    with state.lock:
+        try:
+            in_flight_removed = clear_in_flight_request_locked(state, scope_key)
+        except Exception:
+            logging.exception("Failed to clear in-flight request state for scope=%s", scope_key)
+        _clear_busy_locked(state, scope_key)
+        ready_restart = _pop_ready_restart_request_locked(state)
+    return in_flight_removed, ready_restart
+
 def finalize_chat_work(
     state: State,
     client,
@@ -756,17 +846,16 @@ def finalize_chat_work(
     message_thread_id: Optional[int] = None,
 ) -> None:
     scope_key = _resolve_scope_key(scope_key, chat_id, message_thread_id)
-    try:
-        clear_in_flight_request(state, scope_key)
-    except Exception:
-        logging.exception("Failed to clear in-flight request state for scope=%s", scope_key)
-    finally:
-        clear_busy(state, scope_key)
+    in_flight_removed, ready_restart = _finalize_locked(state, scope_key)
+    if in_flight_removed:
+        try:
+            persist_cleared_in_flight_request(state, scope_key)
+        except Exception:
+            logging.exception("Failed to persist cleared in-flight request state for scope=%s", scope_key)
     emit_event(
         "bridge.chat_work_finalized",
         fields={"chat_id": chat_id, "scope_key": scope_key},
     )
-    ready_restart = pop_ready_restart_request(state)
     if not ready_restart:
         return
 
@@ -1,7 +1,7 @@
 import time
 from typing import Optional
 
-from telegram_bridge.state_models import ScopeKey, State
+from telegram_bridge.state_models import ScopeKey, State, mark_worker_session_recent
 
 def clear_worker_session(
     state: State,
@@ -50,15 +50,18 @@ def get_thread_id(
     normalize_scope_key_fn,
 ) -> Optional[str]:
     scope_key = normalize_scope_key_fn(scope_key)
+    # Read-only lookups skip state.lock. Legacy thread ids are replaced whole;
+    # canonical sessions are edited in place under the lock, but only their
+    # thread_id is read here, and a single attribute load is atomic under the
+    # GIL, so a racing writer yields the old or the new id, never a mix. Reads
+    # that need several session fields to agree must take the lock.
     if state.canonical_sessions_enabled:
-        with state.lock:
-            session = state.chat_sessions.get(scope_key)
-            if session is None:
-                return None
-            thread_id = session.thread_id.strip()
-            return thread_id or None
-    with state.lock:
-        return state.chat_threads.get(scope_key)
+        session = state.chat_sessions.get(scope_key)
+        if session is None:
+            return None
+        thread_id = session.thread_id.strip()
+        return thread_id or None
+    return state.chat_threads.get(scope_key)
 
 def set_thread_id(
     state: State,
@@ -103,6 +106,7 @@ def set_thread_id(
         if session is not None:
             session.thread_id = normalized_thread_id
             session.last_used_at = time.time()
+            mark_worker_session_recent(state.worker_sessions, scope_key)
             persist_sessions = True
     if persist_threads:
         persist_legacy_state_fn(state, chat_threads=True)
@@ -150,6 +154,7 @@ def clear_thread_id(
         if session is not None:
             session.thread_id = ""
             session.last_used_at = time.time()
+            mark_worker_session_recent(state.worker_sessions, scope_key)
             persist_sessions = True
     if removed:
         persist_legacy_state_fn(state, chat_threads=True)
@@ -1,9 +1,10 @@
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from typing import Deque, Dict, List, Optional, Set
 
 from telegram_bridge.conversation_scope import normalize_scope_storage_key
+from telegram_bridge.send_throttle import TokenBucket
 
 ScopeKey = str
 
@@ -13,7 +14,7 @@ def normalize_scope_key(scope_key: object) -> ScopeKey:
         raise ValueError(f"Invalid scope key: {scope_key!r}")
     return normalized
 
-@dataclass
+@dataclass(slots=True)
 class CanonicalSession:
     thread_id: str = ""
     worker_created_at: Optional[float] = None
@@ -22,12 +23,21 @@ class CanonicalSession:
     in_flight_started_at: Optional[float] = None
     in_flight_message_id: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class WorkerSession:
     created_at: float
     last_used_at: float
     thread_id: str
     policy_fingerprint: str
+    hit_count: int = 0
+
+
+def mark_worker_session_recent(worker_sessions: Dict[ScopeKey, WorkerSession], scope_key: ScopeKey) -> None:
+    # worker_sessions is kept in least-recently-used order so capacity eviction
+    # and idle expiry can walk it from the front instead of sorting.
+    session = worker_sessions.pop(scope_key, None)
+    if session is not None:
+        worker_sessions[scope_key] = session
 
 @dataclass
 class PendingMediaGroup:
@@ -91,9 +101,10 @@ class PendingRememberProposal:
 class State:
     started_at: float = field(default_factory=time.time)
     busy_chats: Set[ScopeKey] = field(default_factory=set)
-    recent_requests: Dict[ScopeKey, List[float]] = field(default_factory=dict)
+    recent_requests: Dict[ScopeKey, TokenBucket] = field(default_factory=dict)
     chat_threads: Dict[ScopeKey, str] = field(default_factory=dict)
     chat_thread_path: str = ""
+    chat_thread_flusher: Optional[object] = None
     chat_engines: Dict[ScopeKey, str] = field(default_factory=dict)
     chat_engine_path: str = ""
     chat_gemma_models: Dict[ScopeKey, str] = field(default_factory=dict)
@@ -108,8 +119,10 @@ class State:
     chat_pi_model_path: str = ""
     worker_sessions: Dict[ScopeKey, WorkerSession] = field(default_factory=dict)
     worker_sessions_path: str = ""
+    worker_session_flusher: Optional[object] = None
     in_flight_requests: Dict[ScopeKey, Dict[str, object]] = field(default_factory=dict)
     in_flight_path: str = ""
+    persist_durable: bool = False
     canonical_sessions_enabled: bool = False
     canonical_legacy_mirror_enabled: bool = False
     canonical_sqlite_enabled: bool = False
@@ -125,6 +138,8 @@ class State:
     affective_runtime: Optional[object] = None
     attachment_store: Optional[object] = None
     voice_alias_learning_store: Optional[object] = None
+    worker_pool: Optional[object] = None
+    outbound_messages: Optional[object] = None
     cancel_events: Dict[ScopeKey, threading.Event] = field(default_factory=dict)
     pending_media_groups: Dict[str, PendingMediaGroup] = field(default_factory=dict)
     pending_text_batches: Dict[ScopeKey, PendingTextBatch] = field(default_factory=dict)
@@ -134,7 +149,7 @@ class State:
     chat_goals: Dict[ScopeKey, object] = field(default_factory=dict)
     chat_goal_path: str = ""
     pending_diary_batches: Dict[ScopeKey, PendingDiaryBatch] = field(default_factory=dict)
-    queued_diary_batches: Dict[ScopeKey, List[PendingDiaryBatch]] = field(default_factory=dict)
+    queued_diary_batches: Dict[ScopeKey, Deque[PendingDiaryBatch]] = field(default_factory=dict)
     diary_queue_processing_scopes: Set[ScopeKey] = field(default_factory=set)
     auth_fingerprint_path: str = ""
     auth_fingerprint: str = ""
@@ -46,6 +46,7 @@ from telegram_bridge.scope_state_store import (
     load_json_object,
     normalize_path_value,
     persist_chat_threads,
+    request_chat_threads_persist,
     persist_chat_codex_efforts,
     persist_chat_codex_models,
     persist_chat_engines,
@@ -64,6 +65,7 @@ from telegram_bridge.request_runtime_state_store import (
     load_worker_sessions,
     persist_in_flight_requests,
     persist_worker_sessions,
+    request_worker_sessions_persist,
 )
 from telegram_bridge import request_state
 from telegram_bridge import session_state
@@ -77,6 +79,7 @@ from telegram_bridge.state_models import (
     ScopeKey,
     State,
     WorkerSession,
+    mark_worker_session_recent,
     normalize_scope_key,
 )
 
@@ -92,6 +95,7 @@ __all__ = [
     "clear_chat_pi_model",
     "clear_chat_pi_provider",
     "clear_in_flight_request",
+    "clear_in_flight_request_locked",
     "clear_thread_id",
     "clear_worker_session",
     "ensure_canonical_sessions_sqlite",
@@ -116,6 +120,7 @@ __all__ = [
     "load_or_import_canonical_sessions_sqlite",
     "load_worker_sessions",
     "mark_in_flight_request",
+    "mark_worker_session_recent",
     "mirror_legacy_from_canonical",
     "persist_canonical_and_mirror_legacy",
     "persist_canonical_scope_and_mirror_legacy",
@@ -135,10 +140,13 @@ __all__ = [
     "persist_chat_pi_models",
     "persist_chat_pi_providers",
     "persist_chat_threads",
+    "persist_cleared_in_flight_request",
     "persist_in_flight_requests",
     "persist_worker_sessions",
     "pop_interrupted_requests",
     "quarantine_corrupt_state_file",
+    "request_chat_threads_persist",
+    "request_worker_sessions_persist",
     "set_chat_codex_effort",
     "set_chat_codex_model",
     "set_chat_engine",
@@ -242,6 +250,22 @@ def clear_in_flight_request(state: State, scope_key: ScopeKey) -> None:
         sync_canonical_session_fn=sync_canonical_session,
     )
 
+def clear_in_flight_request_locked(state: State, scope_key: ScopeKey) -> bool:
+    return request_state.clear_in_flight_request_locked(
+        state,
+        normalize_scope_key(scope_key),
+        canonical_session_is_empty_fn=canonical_session_is_empty,
+    )
+
+def persist_cleared_in_flight_request(state: State, scope_key: ScopeKey) -> None:
+    request_state.persist_cleared_in_flight_request(
+        state,
+        normalize_scope_key(scope_key),
+        persist_canonical_scope_and_mirror_legacy_fn=persist_canonical_scope_and_mirror_legacy,
+        persist_in_flight_requests_fn=persist_in_flight_requests,
+        sync_canonical_session_fn=sync_canonical_session,
+    )
+
 def pop_interrupted_requests(state: State) -> Dict[ScopeKey, Dict[str, object]]:
     return request_state.pop_interrupted_requests(
         state,
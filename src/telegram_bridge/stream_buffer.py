@@ -1,5 +1,6 @@
+import os
 from collections import deque
-from typing import Deque, List
+from typing import BinaryIO, Deque, List, Optional, Union
 
 class BoundedTextBuffer:
     """Keep bounded stream text while preserving head context and tail output."""
@@ -72,3 +73,26 @@ class BoundedTextBuffer:
         elif len(tail) > tail_budget:
             tail = tail[-tail_budget:]
         return head + marker + tail
+
+def output_tail(output: Optional[Union[str, bytes]], limit: int) -> str:
+    """Return the last ``limit`` units of captured output for logging.
+
+    Byte output is sliced before decoding so a large capture is never decoded
+    just to log its tail.
+    """
+    tail = (output or "")[-limit:] if limit > 0 else ""
+    if isinstance(tail, bytes):
+        return tail.decode("utf-8", errors="replace")
+    return tail
+
+def spooled_output_tail(handle: BinaryIO, limit: int) -> str:
+    """Return the last ``limit`` bytes written to a spooled stderr file.
+
+    Child stderr that is only ever logged by its tail goes to a temp file, so
+    the kernel writes it without a Python reader and only the tail is read.
+    """
+    if limit <= 0:
+        return ""
+    size = handle.seek(0, os.SEEK_END)
+    handle.seek(max(0, size - limit))
+    return handle.read().decode("utf-8", errors="replace")
@@ -1,22 +1,48 @@
-import json
 import logging
 import mimetypes
 import os
 import socket
 import time
 import uuid
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
-from urllib.parse import quote, urlencode
-from urllib.request import Request, urlopen
-
+from urllib.parse import quote
+from urllib.request import Request
+
+from telegram_bridge import json_codec
+from telegram_bridge.backoff import compute_backoff_seconds
+from telegram_bridge import http_keepalive
+from telegram_bridge.media import DOWNLOAD_CHUNK_BYTES
+from telegram_bridge.send_throttle import SendThrottle
 from telegram_bridge.structured_logging import emit_event
 
 TELEGRAM_LIMIT = 4096
 TELEGRAM_CAPTION_LIMIT = 1024
+# Reserve room for a multipart prefix like [2/7]\n
+TELEGRAM_CHUNK_LIMIT = TELEGRAM_LIMIT - 16
 TELEGRAM_API_DEFAULT_MAX_ATTEMPTS = 3
 TELEGRAM_API_MAX_BACKOFF_SECONDS = 10.0
 TELEGRAM_TRANSIENT_ERROR_CODES = {429, 500, 502, 503, 504}
+TELEGRAM_ALLOWED_UPDATES = ("message", "callback_query")
+# Telegram allows roughly 30 messages/s per bot and about 1/s per chat; stay
+# just under both so bursts queue locally instead of coming back as 429s.
+TELEGRAM_GLOBAL_SENDS_PER_SECOND = 29.0
+# getUpdates holds the connection for up to its own timeout, so the socket
+# read timeout must outlast it.
+TELEGRAM_LONG_POLL_READ_SLACK_SECONDS = 10
+# Long polls in a row that may time out as empty ticks before the timeout is
+# raised to the poll loop as a network error.
+TELEGRAM_LONG_POLL_TIMEOUT_STREAK_LIMIT = 3
+TELEGRAM_PER_CHAT_SENDS_PER_SECOND = 1.0
+TELEGRAM_PER_CHAT_SEND_BURST = 3
+TELEGRAM_THROTTLED_METHODS = frozenset(
+    {"sendMessage", "sendPhoto", "sendDocument", "sendAudio", "sendVoice", "editMessageText"}
+)
+
+# Bot API calls share one pool of keep-alive connections, so consecutive
+# long polls, sends and downloads skip the TCP/TLS handshake.
+urlopen = http_keepalive.urlopen
+close_idle_connections = http_keepalive.close_idle_connections
 
 class TelegramApiError(RuntimeError):
     def __init__(
@@ -37,16 +63,20 @@ def split_for_limit(text: str, limit: int) -> List[str]:
     if not text:
         return [""]
     chunks: List[str] = []
-    remaining = text
-    while remaining:
-        if len(remaining) <= limit:
-            chunks.append(remaining)
+    # Walk one index through the text rather than re-slicing the remainder.
+    pos = 0
+    text_length = len(text)
+    while pos < text_length:
+        if text_length - pos <= limit:
+            chunks.append(text[pos:])
             break
-        split_at = remaining.rfind("\n", 0, limit)
-        if split_at <= 0:
-            split_at = limit
-        chunks.append(remaining[:split_at])
-        remaining = remaining[split_at:].lstrip("\n")
+        split_at = text.rfind("\n", pos, pos + limit)
+        if split_at <= pos:
+            split_at = pos + limit
+        chunks.append(text[pos:split_at])
+        pos = split_at
+        while pos < text_length and text[pos] == "\n":
+            pos += 1
     return chunks
 
 def to_telegram_chunks(text: str) -> List[str]:
@@ -54,20 +84,34 @@ def to_telegram_chunks(text: str) -> List[str]:
     if not stripped:
         return [""]
 
-    # Reserve room for a multipart prefix like [2/7]\n
-    base_chunks = split_for_limit(stripped, TELEGRAM_LIMIT - 16)
+    base_chunks = split_for_limit(stripped, TELEGRAM_CHUNK_LIMIT)
     if len(base_chunks) == 1:
         return base_chunks
 
     total = len(base_chunks)
-    output: List[str] = []
-    for index, chunk in enumerate(base_chunks, start=1):
-        output.append(f"[{index}/{total}]\n{chunk}")
-    return output
+    return [f"[{index}/{total}]\n{chunk}" for index, chunk in enumerate(base_chunks, start=1)]
+
+def _response_content_length(response) -> Optional[int]:
+    headers = getattr(response, "headers", None)
+    raw_length = headers.get("Content-Length") if headers is not None else None
+    if raw_length is None or not str(raw_length).strip().isdigit():
+        return None
+    return int(str(raw_length).strip())
 
 class TelegramClient:
     def __init__(self, config) -> None:
         self.config = config
+        self._endpoint_prefix = f"{config.api_base}/bot{config.token}/"
+        self._file_prefix = f"{config.api_base}/file/bot{config.token}/"
+        self._request_timeout_seconds = config.poll_timeout_seconds + TELEGRAM_LONG_POLL_READ_SLACK_SECONDS
+        self._allowed_updates_sent: Optional[Tuple[str, ...]] = None
+        self._consecutive_poll_timeouts = 0
+        self._send_throttle = SendThrottle(
+            TELEGRAM_GLOBAL_SENDS_PER_SECOND,
+            TELEGRAM_GLOBAL_SENDS_PER_SECOND,
+            TELEGRAM_PER_CHAT_SENDS_PER_SECOND,
+            TELEGRAM_PER_CHAT_SEND_BURST,
+        )
 
     def _api_max_attempts(self) -> int:
         raw = getattr(self.config, "api_max_attempts", TELEGRAM_API_DEFAULT_MAX_ATTEMPTS)
@@ -95,8 +139,12 @@ class TelegramClient:
     def _compute_backoff_seconds(self, exc: Exception, attempt_index: int) -> float:
         if isinstance(exc, TelegramApiError) and exc.retry_after_seconds is not None:
             return max(0.0, min(exc.retry_after_seconds, TELEGRAM_API_MAX_BACKOFF_SECONDS))
-        base = self._api_backoff_base_seconds()
-        return min(base * (2**attempt_index), TELEGRAM_API_MAX_BACKOFF_SECONDS)
+        # Jitter spreads retries from concurrent senders during a Telegram outage.
+        return compute_backoff_seconds(
+            self._api_backoff_base_seconds(),
+            attempt_index,
+            cap_seconds=TELEGRAM_API_MAX_BACKOFF_SECONDS,
+        )
 
     def _execute_with_retry(
         self,
@@ -118,6 +166,10 @@ class TelegramClient:
                     )
                 return response_body
             except Exception as exc:
+                if method == "getUpdates" and isinstance(exc, (TimeoutError, socket.timeout)):
+                    # An expired long poll is an empty tick for the caller, not
+                    # a failure worth retrying with backoff.
+                    raise
                 is_last_attempt = attempt_index >= (max_attempts - 1)
                 is_transient = self._is_transient_error(exc)
                 if is_last_attempt or not is_transient:
@@ -164,13 +216,29 @@ class TelegramClient:
 
         raise RuntimeError("unreachable retry state")
 
-    def _request(self, method: str, payload: Dict[str, object]) -> Dict[str, object]:
+    def _pace_send(self, method: str, payload: Dict[str, object]) -> None:
+        if method in TELEGRAM_THROTTLED_METHODS:
+            self._send_throttle.acquire(payload.get("chat_id"))
+
+    def _request(
+        self,
+        method: str,
+        payload: Dict[str, object],
+        *,
+        timeout_seconds: Optional[float] = None,
+    ) -> Dict[str, object]:
+        endpoint = self._endpoint_prefix + method
+        http_timeout_seconds = self._request_timeout_seconds if timeout_seconds is None else timeout_seconds
+        # Raw UTF-8 JSON keeps non-ASCII reply text at its encoded size instead
+        # of tripling it through percent-encoding, and is built once per call.
+        data = json_codec.dumps_compact(payload).encode("utf-8")
+
         def request_once() -> str:
-            endpoint = f"{self.config.api_base}/bot{self.config.token}/{method}"
-            data = urlencode(payload).encode("utf-8")
+            self._pace_send(method, payload)
             request = Request(endpoint, data=data, method="POST")
+            request.add_header("Content-Type", "application/json")
             try:
-                with urlopen(request, timeout=self.config.poll_timeout_seconds + 10) as response:
+                with urlopen(request, timeout=http_timeout_seconds) as response:
                     return response.read().decode("utf-8")
             except HTTPError as exc:
                 response_body = ""
@@ -190,7 +258,7 @@ class TelegramClient:
                 ) from exc
 
         body = self._execute_with_retry(method, request_once)
-        decoded = json.loads(body)
+        decoded = json_codec.loads(body)
         if not decoded.get("ok"):
             description = str(decoded.get("description", "unknown Telegram error"))
             error_code = decoded.get("error_code")
@@ -221,7 +289,7 @@ class TelegramClient:
         if not body:
             return fallback, None, None
         try:
-            decoded = json.loads(body)
+            decoded = json_codec.loads(body)
         except Exception:
             return fallback, None, None
         if not isinstance(decoded, dict):
@@ -241,38 +309,41 @@ class TelegramClient:
         file_bytes: bytes,
         content_type: str,
     ) -> Dict[str, object]:
-        def request_once() -> str:
-            endpoint = f"{self.config.api_base}/bot{self.config.token}/{method}"
-            boundary = f"----telegram-bridge-{uuid.uuid4().hex}"
-            body_parts: List[bytes] = []
-
-            for key, value in payload.items():
-                body_parts.append(f"--{boundary}\r\n".encode("utf-8"))
-                body_parts.append(
-                    f'Content-Disposition: form-data; name="{key}"\r\n\r\n'.encode("utf-8")
-                )
-                body_parts.append(str(value).encode("utf-8"))
-                body_parts.append(b"\r\n")
+        endpoint = self._endpoint_prefix + method
+        # Draw the boundary and copy the file into the body once per call, not
+        # once per retry attempt.
+        boundary = f"----telegram-bridge-{uuid.uuid4().hex}"
+        body_parts: List[bytes] = []
 
+        for key, value in payload.items():
             body_parts.append(f"--{boundary}\r\n".encode("utf-8"))
             body_parts.append(
-                (
-                    f'Content-Disposition: form-data; name="{file_field}"; '
-                    f'filename="{file_name}"\r\n'
-                ).encode("utf-8")
+                f'Content-Disposition: form-data; name="{key}"\r\n\r\n'.encode("utf-8")
             )
-            body_parts.append(f"Content-Type: {content_type}\r\n\r\n".encode("utf-8"))
-            body_parts.append(file_bytes)
+            body_parts.append(str(value).encode("utf-8"))
             body_parts.append(b"\r\n")
-            body_parts.append(f"--{boundary}--\r\n".encode("utf-8"))
-            body = b"".join(body_parts)
 
+        body_parts.append(f"--{boundary}\r\n".encode("utf-8"))
+        body_parts.append(
+            (
+                f'Content-Disposition: form-data; name="{file_field}"; '
+                f'filename="{file_name}"\r\n'
+            ).encode("utf-8")
+        )
+        body_parts.append(f"Content-Type: {content_type}\r\n\r\n".encode("utf-8"))
+        body_parts.append(file_bytes)
+        body_parts.append(b"\r\n")
+        body_parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+        body = b"".join(body_parts)
+
+        def request_once() -> str:
+            self._pace_send(method, payload)
             request = Request(endpoint, data=body, method="POST")
             request.add_header("Content-Type", f"multipart/form-data; boundary={boundary}")
             request.add_header("Content-Length", str(len(body)))
 
             try:
-                with urlopen(request, timeout=self.config.poll_timeout_seconds + 10) as response:
+                with urlopen(request, timeout=self._request_timeout_seconds) as response:
                     return response.read().decode("utf-8")
             except HTTPError as exc:
                 error_body = ""
@@ -293,7 +364,7 @@ class TelegramClient:
 
         response_body = self._execute_with_retry(method, request_once)
 
-        decoded = json.loads(response_body)
+        decoded = json_codec.loads(response_body)
         if not decoded.get("ok"):
             description = str(decoded.get("description", "unknown Telegram error"))
             error_code = decoded.get("error_code")
@@ -311,14 +382,40 @@ class TelegramClient:
         self,
         offset: int,
         timeout_seconds: Optional[int] = None,
+        allowed_updates: Tuple[str, ...] = TELEGRAM_ALLOWED_UPDATES,
     ) -> List[Dict[str, object]]:
         timeout = self.config.poll_timeout_seconds if timeout_seconds is None else timeout_seconds
         payload: Dict[str, object] = {
             "offset": offset,
             "timeout": timeout,
-            "allowed_updates": json.dumps(["message", "callback_query"]),
         }
-        response = self._request("getUpdates", payload)
+        # Telegram keeps the last allowed_updates filter server-side, so it only
+        # needs to be sent until one poll with it has succeeded. The request
+        # body is JSON already, so the list goes in as-is.
+        if allowed_updates != self._allowed_updates_sent:
+            payload["allowed_updates"] = list(allowed_updates)
+        try:
+            response = self._request(
+                "getUpdates",
+                payload,
+                timeout_seconds=timeout + TELEGRAM_LONG_POLL_READ_SLACK_SECONDS,
+            )
+        except (TimeoutError, socket.timeout):
+            # Connect, DNS and TLS stalls arrive wrapped in URLError, so this is
+            # a read timeout. Only a long poll can expire quietly, and the read
+            # timeout outlasts it, so repeated expiries mean a stalled link.
+            self._consecutive_poll_timeouts += 1
+            logging.debug(
+                "getUpdates read timed out (timeout=%ss, consecutive=%s).",
+                timeout,
+                self._consecutive_poll_timeouts,
+            )
+            if timeout <= 0 or self._consecutive_poll_timeouts >= TELEGRAM_LONG_POLL_TIMEOUT_STREAK_LIMIT:
+                self._consecutive_poll_timeouts = 0
+                raise
+            return []
+        self._consecutive_poll_timeouts = 0
+        self._allowed_updates_sent = allowed_updates
         result = response.get("result", [])
         if not isinstance(result, list):
             raise RuntimeError("Invalid getUpdates response: result is not a list")
@@ -332,19 +429,11 @@ class TelegramClient:
         message_thread_id: Optional[int] = None,
         reply_markup: Optional[Dict[str, object]] = None,
     ) -> None:
+        # Chunks stay strictly sequential: Telegram only orders messages by
+        # arrival, and the per-chat send throttle paces them anyway.
+        base_payload = self._message_payload(chat_id, reply_to_message_id, message_thread_id, reply_markup)
         for chunk in to_telegram_chunks(text):
-            payload: Dict[str, object] = {
-                "chat_id": str(chat_id),
-                "text": chunk,
-                "disable_web_page_preview": "true",
-            }
-            if reply_to_message_id is not None:
-                payload["reply_to_message_id"] = str(reply_to_message_id)
-            if message_thread_id is not None:
-                payload["message_thread_id"] = str(message_thread_id)
-            if reply_markup:
-                payload["reply_markup"] = json.dumps(reply_markup)
-            self._request("sendMessage", payload)
+            self._request("sendMessage", {**base_payload, "text": chunk})
 
     def send_message_get_id(
         self,
@@ -354,17 +443,8 @@ class TelegramClient:
         message_thread_id: Optional[int] = None,
         reply_markup: Optional[Dict[str, object]] = None,
     ) -> Optional[int]:
-        payload: Dict[str, object] = {
-            "chat_id": str(chat_id),
-            "text": text,
-            "disable_web_page_preview": "true",
-        }
-        if reply_to_message_id is not None:
-            payload["reply_to_message_id"] = str(reply_to_message_id)
-        if message_thread_id is not None:
-            payload["message_thread_id"] = str(message_thread_id)
-        if reply_markup:
-            payload["reply_markup"] = json.dumps(reply_markup)
+        payload = self._message_payload(chat_id, reply_to_message_id, message_thread_id, reply_markup)
+        payload["text"] = text
         response = self._request("sendMessage", payload)
         result = response.get("result")
         if isinstance(result, dict):
@@ -373,6 +453,25 @@ class TelegramClient:
                 return message_id
         return None
 
+    @staticmethod
+    def _message_payload(
+        chat_id: int,
+        reply_to_message_id: Optional[int],
+        message_thread_id: Optional[int],
+        reply_markup: Optional[Dict[str, object]],
+    ) -> Dict[str, object]:
+        payload: Dict[str, object] = {
+            "chat_id": chat_id,
+            "disable_web_page_preview": True,
+        }
+        if reply_to_message_id is not None:
+            payload["reply_to_message_id"] = reply_to_message_id
+        if message_thread_id is not None:
+            payload["message_thread_id"] = message_thread_id
+        if reply_markup:
+            payload["reply_markup"] = reply_markup
+        return payload
+
     def _send_media(
         self,
         method: str,
@@ -384,14 +483,14 @@ class TelegramClient:
         message_thread_id: Optional[int],
     ) -> Dict[str, object]:
         payload: Dict[str, object] = {
-            "chat_id": str(chat_id),
+            "chat_id": chat_id,
         }
         if caption:
             payload["caption"] = caption[:TELEGRAM_CAPTION_LIMIT]
         if reply_to_message_id is not None:
-            payload["reply_to_message_id"] = str(reply_to_message_id)
+            payload["reply_to_message_id"] = reply_to_message_id
         if message_thread_id is not None:
-            payload["message_thread_id"] = str(message_thread_id)
+            payload["message_thread_id"] = message_thread_id
 
         if os.path.isfile(media):
             with open(media, "rb") as handle:
@@ -491,13 +590,13 @@ class TelegramClient:
         reply_markup: Optional[Dict[str, object]] = None,
     ) -> None:
         payload: Dict[str, object] = {
-            "chat_id": str(chat_id),
-            "message_id": str(message_id),
+            "chat_id": chat_id,
+            "message_id": message_id,
             "text": text,
-            "disable_web_page_preview": "true",
+            "disable_web_page_preview": True,
         }
         if reply_markup:
-            payload["reply_markup"] = json.dumps(reply_markup)
+            payload["reply_markup"] = reply_markup
         self._request("editMessageText", payload)
 
     def answer_callback_query(
@@ -517,11 +616,11 @@ class TelegramClient:
         message_thread_id: Optional[int] = None,
     ) -> None:
         payload: Dict[str, object] = {
-            "chat_id": str(chat_id),
+            "chat_id": chat_id,
             "action": action,
         }
         if message_thread_id is not None:
-            payload["message_thread_id"] = str(message_thread_id)
+            payload["message_thread_id"] = message_thread_id
         self._request("sendChatAction", payload)
 
     def get_file(self, file_id: str) -> Dict[str, object]:
@@ -537,26 +636,50 @@ class TelegramClient:
         target_path: str,
         max_bytes: int,
         size_label: str = "File",
+        chunk_size: int = DOWNLOAD_CHUNK_BYTES,
     ) -> None:
+        with open(target_path, "wb") as handle:
+            self.download_file_to_handle(
+                file_path,
+                handle,
+                max_bytes,
+                size_label=size_label,
+                chunk_size=chunk_size,
+            )
+
+    def download_file_to_handle(
+        self,
+        file_path: str,
+        handle: BinaryIO,
+        max_bytes: int,
+        size_label: str = "File",
+        chunk_size: int = DOWNLOAD_CHUNK_BYTES,
+    ) -> int:
         cleaned = file_path.lstrip("/")
         if not cleaned:
             raise RuntimeError("Invalid Telegram file_path")
         encoded = quote(cleaned, safe="/")
-        endpoint = f"{self.config.api_base}/file/bot{self.config.token}/{encoded}"
+        endpoint = self._file_prefix + encoded
         request = Request(endpoint, method="GET")
 
+        # Stream through one reusable buffer so large documents never sit in
+        # memory as a stack of per-read bytes objects.
+        buffer = bytearray(max(1, chunk_size))
+        view = memoryview(buffer)
         total = 0
-        with (
-            urlopen(request, timeout=self.config.poll_timeout_seconds + 10) as response,
-            open(target_path, "wb") as handle,
-        ):
+        with urlopen(request, timeout=self._request_timeout_seconds) as response:
+            declared_length = _response_content_length(response)
+            if declared_length is not None and declared_length > max_bytes:
+                raise ValueError(f"{size_label} too large (> {max_bytes} bytes).")
             while True:
-                chunk = response.read(64 * 1024)
-                if not chunk:
+                # Never read past the first byte over the cap.
+                read_count = response.readinto(view[: min(len(buffer), max_bytes + 1 - total)])
+                if not read_count:
                     break
-                total += len(chunk)
+                total += read_count
                 if total > max_bytes:
                     raise ValueError(
                         f"{size_label} too large (> {max_bytes} bytes)."
                     )
-                handle.write(chunk)
+                handle.write(view[:read_count])
+        return total
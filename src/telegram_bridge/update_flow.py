@@ -3,6 +3,7 @@ import time
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
+from telegram_bridge.background_tasks import send_polling_reply
 from telegram_bridge.handler_models import UpdateDispatchRequest, UpdateFlowState
 from telegram_bridge.conversation_scope import parse_telegram_scope_key
 from telegram_bridge.state_store import mark_in_flight_request
@@ -184,7 +185,9 @@ def _maybe_handle_busy_live_codex_turn(
                 "reason": "steer_call_failed",
             },
         )
-        request.client.send_message(
+        send_polling_reply(
+            request.state,
+            request.client,
             request.chat_id,
             LIVE_CODEX_STEER_FAILED_MESSAGE,
             reply_to_message_id=request.message_id,
@@ -206,7 +209,9 @@ def _maybe_handle_busy_live_codex_turn(
             "reason": follow_up_reason,
         },
     )
-    request.client.send_message(
+    send_polling_reply(
+        request.state,
+        request.client,
         request.chat_id,
         LIVE_CODEX_STEER_UNSUPPORTED_MESSAGE,
         reply_to_message_id=request.message_id,
@@ -307,7 +312,9 @@ def _accept_dispatch_request(
                 "reason": "chat_busy",
             },
         )
-        request.client.send_message(
+        send_polling_reply(
+            request.state,
+            request.client,
             request.chat_id,
             request.config.busy_message,
             reply_to_message_id=request.message_id,
@@ -330,7 +337,9 @@ def _resolve_standard_dispatch_plan(request: UpdateDispatchRequest) -> Optional[
         )
     except Exception as exc:
         logging.exception("Failed to resolve engine for scope=%s", request.scope_key)
-        request.client.send_message(
+        send_polling_reply(
+            request.state,
+            request.client,
             request.chat_id,
             f"Engine selection failed: {exc}",
             reply_to_message_id=request.message_id,
@@ -1,6 +1,7 @@
 import logging
 from typing import Dict, Optional
 
+from telegram_bridge.background_tasks import send_polling_reply
 from telegram_bridge.channel_adapter import ChannelAdapter
 from telegram_bridge.engine_adapter import EngineAdapter
 from telegram_bridge.handler_common import RATE_LIMIT_MESSAGE, extract_chat_context, normalize_command, strip_required_prefix
@@ -103,6 +104,7 @@ def _reject_input_too_long(flow: UpdateFlowState, actual_length: int) -> None:
         message_id=flow.ctx.message_id,
         actual_length=actual_length,
         max_input_chars=flow.config.max_input_chars,
+        state=flow.state,
     )
 
 
@@ -127,24 +129,6 @@ def _build_prompt_with_diagnostics(
         wrapper_breaks += 2
     wrapper_overhead = len(user_message_label) + wrapper_breaks
 
-    original_prompt_parts = []
-    if telegram_context_prompt:
-        original_prompt_parts.append(telegram_context_prompt)
-    if reply_context_prompt:
-        original_prompt_parts.append(reply_context_prompt)
-    if current_sender_prompt:
-        original_prompt_parts.append(current_sender_prompt)
-    if raw_prompt:
-        original_prompt_parts.append(f"{user_message_label}{raw_prompt}")
-    original_prompt = "\n\n".join(original_prompt_parts).strip()
-    original_length = len(original_prompt)
-
-    dropped_sections: list[str] = []
-    trimmed_user_chars = 0
-    final_reply_context = reply_context_prompt
-    final_sender_prompt = current_sender_prompt
-    final_raw_prompt = raw_prompt
-
     def assemble_prompt(*, reply_context: str, sender_prompt: str, user_prompt: str) -> str:
         parts = []
         if telegram_context_prompt:
@@ -157,11 +141,20 @@ def _build_prompt_with_diagnostics(
             parts.append(f"{user_message_label}{user_prompt}")
         return "\n\n".join(parts).strip()
 
-    prompt = assemble_prompt(
-        reply_context=final_reply_context,
-        sender_prompt=final_sender_prompt,
-        user_prompt=final_raw_prompt,
+    # The untrimmed prompt is also the first candidate; build it only once.
+    original_prompt = assemble_prompt(
+        reply_context=reply_context_prompt,
+        sender_prompt=current_sender_prompt,
+        user_prompt=raw_prompt,
     )
+    original_length = len(original_prompt)
+
+    dropped_sections: list[str] = []
+    trimmed_user_chars = 0
+    final_reply_context = reply_context_prompt
+    final_sender_prompt = current_sender_prompt
+    final_raw_prompt = raw_prompt
+    prompt = original_prompt
     if len(prompt) > max_input_chars and final_sender_prompt:
         dropped_sections.append("current_sender")
         final_sender_prompt = ""
@@ -390,7 +383,9 @@ def prepare_update_request(
                 "reason": prefix_result.rejection_reason,
             },
         )
-        client.send_message(
+        send_polling_reply(
+            state,
+            client,
             ctx.chat_id,
             prefix_result.rejection_message or PREFIX_HELP_MESSAGE,
             reply_to_message_id=ctx.message_id,
@@ -460,7 +455,9 @@ def prepare_update_dispatch_request(
                 "reason": keyword_result.rejection_reason,
             },
         )
-        flow.client.send_message(
+        send_polling_reply(
+            flow.state,
+            flow.client,
             flow.ctx.chat_id,
             keyword_result.rejection_message or PREFIX_HELP_MESSAGE,
             reply_to_message_id=flow.ctx.message_id,
@@ -527,9 +524,11 @@ def prepare_update_dispatch_request(
     if not prompt and not flow.voice_file_id and flow.document is None:
         return None
 
-    if prompt and len(prompt) > flow.config.max_input_chars:
-        _reject_input_too_long(flow, len(prompt))
+    prompt_length = int(prompt_details["final_length"])
+    if prompt and prompt_length > flow.config.max_input_chars:
+        _reject_input_too_long(flow, prompt_length)
         return None
+    prompt_details["length_validated"] = True
 
     if bool(prompt_details.get("trimmed")):
         emit_event(
@@ -553,6 +552,7 @@ def prepare_update_dispatch_request(
             max_input_chars=flow.config.max_input_chars,
             dropped_sections=list(prompt_details["dropped_sections"]),
             trimmed_user_chars=int(prompt_details["trimmed_user_chars"]),
+            state=flow.state,
         )
 
     if is_rate_limited(flow.state, flow.config, flow.ctx.scope_key):
@@ -565,7 +565,9 @@ def prepare_update_dispatch_request(
                 "reason": "rate_limited",
             },
         )
-        flow.client.send_message(
+        send_polling_reply(
+            flow.state,
+            flow.client,
             flow.ctx.chat_id,
             RATE_LIMIT_MESSAGE,
             reply_to_message_id=flow.ctx.message_id,
@@ -7,6 +7,7 @@ import tempfile
 from typing import Dict, List
 
 from telegram_bridge.runtime_profile import build_repo_root
+from telegram_bridge.stream_buffer import spooled_output_tail
 from telegram_bridge.transport import TELEGRAM_LIMIT
 
 YOUTUBE_ANALYZER_TIMEOUT_SECONDS = 1800
@@ -26,23 +27,26 @@ def build_youtube_analyzer_command(youtube_url: str, request_text: str) -> List[
 def run_youtube_analyzer(youtube_url: str, request_text: str) -> Dict[str, object]:
     cmd = build_youtube_analyzer_command(youtube_url, request_text)
     logging.info("Running YouTube analyzer command: %s", cmd)
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=YOUTUBE_ANALYZER_TIMEOUT_SECONDS,
-        check=False,
-    )
-    if result.returncode != 0:
-        logging.error(
-            "YouTube analyzer failed returncode=%s stderr=%r",
-            result.returncode,
-            (result.stderr or "")[-2000:],
+    # Downloader progress on stderr can run long; only its tail is logged.
+    with tempfile.TemporaryFile() as stderr_file:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            timeout=YOUTUBE_ANALYZER_TIMEOUT_SECONDS,
+            check=False,
         )
-        raise RuntimeError("YouTube analysis failed")
+        if result.returncode != 0:
+            logging.error(
+                "YouTube analyzer failed returncode=%s stderr=%r",
+                result.returncode,
+                spooled_output_tail(stderr_file, 2000),
+            )
+            raise RuntimeError("YouTube analysis failed")
     try:
-        payload = json.loads(result.stdout or "{}")
-    except json.JSONDecodeError as exc:
+        # json.loads decodes the captured bytes itself.
+        payload = json.loads(result.stdout or b"{}")
+    except ValueError as exc:
         raise RuntimeError("YouTube analysis returned invalid JSON") from exc
     if not isinstance(payload, dict) or not payload.get("ok", False):
         raise RuntimeError("YouTube analysis did not complete successfully")
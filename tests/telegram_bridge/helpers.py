@@ -141,10 +141,29 @@ class FakeDownloadClient:
     def get_file(self, file_id):
         return dict(self.file_meta)
 
-    def download_file_to_path(self, file_path, target_path, max_bytes, size_label="File"):
+    def download_file_to_path(
+        self,
+        file_path,
+        target_path,
+        max_bytes,
+        size_label="File",
+        chunk_size=1 << 20,
+    ):
         self.download_calls += 1
         Path(target_path).write_bytes(b"x")
 
+    def download_file_to_handle(
+        self,
+        file_path,
+        handle,
+        max_bytes,
+        size_label="File",
+        chunk_size=1 << 20,
+    ):
+        self.download_calls += 1
+        handle.write(b"x")
+        return 1
+
 class FakeProgressEditClient:
     channel_name = "whatsapp"
     supports_message_edits = True
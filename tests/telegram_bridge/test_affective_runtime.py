@@ -300,6 +300,12 @@ class AffectiveRuntimeTests(unittest.TestCase):
         self.assertGreater(state["stress"], 0.0)
         self.assertLess(state["confidence"], 0.0)
 
+    def test_user_feedback_counts_each_marker_once_including_overlaps(self):
+        extract = bridge_affective_runtime._extract_user_feedback
+        self.assertAlmostEqual(extract("Thanks, thanks! nice"), 0.35 + 0.35 + 0.05)
+        self.assertAlmostEqual(extract("brokenice"), 0.35 - 0.45)
+        self.assertEqual(extract(""), 0.0)
+
     def test_process_prompt_includes_affective_block_when_enabled(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             config = make_config(
@@ -1,6 +1,8 @@
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -181,6 +183,17 @@ class TestAttachmentProcessing(unittest.TestCase):
             ["whisper", "--model", "small", "/tmp/voice.ogg"],
         )
 
+    def test_build_voice_transcribe_command_substitutes_every_embedded_placeholder(self):
+        template = ["transcribe", "--in={file}", "--log", "{file}.log", "--lang", "en"]
+
+        cmd = attachment_processing.build_voice_transcribe_command(template, "/tmp/voice.ogg")
+
+        self.assertEqual(
+            cmd,
+            ["transcribe", "--in=/tmp/voice.ogg", "--log", "/tmp/voice.ogg.log", "--lang", "en"],
+        )
+        self.assertEqual(template[1], "--in={file}")
+
     def test_parse_voice_confidence_clamps_and_ignores_invalid_values(self):
         self.assertEqual(
             attachment_processing.parse_voice_confidence("VOICE_CONFIDENCE=1.7"),
@@ -308,5 +321,18 @@ class TestAttachmentProcessing(unittest.TestCase):
                 attachment_processing.transcribe_voice(config, "/tmp/voice.ogg")
 
 
+    def test_transcribe_voice_kills_command_when_canceled(self):
+        config = make_config(
+            voice_transcribe_cmd=[sys.executable, "-c", "import time; time.sleep(30)"],
+            voice_transcribe_timeout_seconds=30,
+        )
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        started_at = time.monotonic()
+        with self.assertRaises(attachment_processing.VoiceTranscriptionCancelledError):
+            attachment_processing.transcribe_voice(config, "/tmp/voice.ogg", cancel_event=cancel_event)
+        self.assertLess(time.monotonic() - started_at, 10)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,45 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_ROOT = ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from telegram_bridge.backoff import compute_backoff_seconds
+
+
+def _no_jitter(low, high):
+    return 0.0
+
+
+class TestBackoff(unittest.TestCase):
+    def test_delay_doubles_per_failure_until_cap(self):
+        delays = [
+            compute_backoff_seconds(1.0, failure_count, cap_seconds=30.0, uniform_fn=_no_jitter)
+            for failure_count in range(7)
+        ]
+
+        self.assertEqual(delays, [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0])
+
+    def test_jitter_stays_within_ratio_and_cap(self):
+        self.assertEqual(
+            compute_backoff_seconds(2.0, 1, cap_seconds=30.0, uniform_fn=lambda low, high: high),
+            4.8,
+        )
+        self.assertEqual(
+            compute_backoff_seconds(2.0, 1, cap_seconds=30.0, uniform_fn=lambda low, high: low),
+            3.2,
+        )
+        self.assertEqual(
+            compute_backoff_seconds(20.0, 3, cap_seconds=30.0, uniform_fn=lambda low, high: high),
+            30.0,
+        )
+
+    def test_zero_base_disables_delay(self):
+        self.assertEqual(compute_backoff_seconds(0.0, 5, cap_seconds=30.0), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -179,6 +179,53 @@ class TestCommandKnownRouting(unittest.TestCase):
         self.assertFalse(disabled)
         self.assertEqual(observed["message_id"], 14)
 
+    def test_handle_known_command_skips_context_for_unknown_command(self):
+        handled = command_known_routing.handle_known_command(
+            State(),
+            make_config(),
+            FakeTelegramClient(),
+            "tg:1",
+            1,
+            None,
+            16,
+            "/unknown",
+            "/unknown arg",
+            known_command_context_cls=lambda **_kwargs: self.fail("context should not be built"),
+            help_command_aliases={"/help"},
+            cancel_command_aliases={"/cancel"},
+            handle_help_known_command=lambda *_args: self.fail("help should not run"),
+            handle_cancel_known_command=lambda *_args: self.fail("cancel should not run"),
+            known_command_handlers={"/engine": lambda _ctx: True},
+            diary_mode_enabled=lambda _config: True,
+            diary_command_handlers={"/today": lambda _ctx: True},
+        )
+
+        self.assertFalse(handled)
+
+    def test_build_known_command_table_folds_aliases(self):
+        def handle_help(_ctx):
+            return True
+
+        def handle_cancel(_ctx):
+            return True
+
+        def handle_engine(_ctx):
+            return True
+
+        table = command_known_routing.build_known_command_table(
+            {"/engine": handle_engine},
+            help_command_aliases=("/help", "/h"),
+            cancel_command_aliases=("/cancel", "/c"),
+            handle_help_known_command=handle_help,
+            handle_cancel_known_command=handle_cancel,
+        )
+
+        self.assertIs(table["/engine"], handle_engine)
+        self.assertIs(table["/h"], handle_help)
+        self.assertIs(table["/help"], handle_help)
+        self.assertIs(table["/c"], handle_cancel)
+        self.assertIs(table["/cancel"], handle_cancel)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -457,6 +457,78 @@ class TestConfig(unittest.TestCase):
         attachment_store.close.assert_called_once_with()
         affective_runtime.close.assert_called_once_with()
 
+    def test_close_runtime_bootstrap_cancels_workers_before_closing_stores(self):
+        attachment_store = mock.Mock()
+        cancel_event = threading.Event()
+        worker_started = threading.Event()
+        observed = []
+        state = bridge.State(
+            attachment_store=attachment_store,
+            worker_pool=bridge_runtime_setup.build_worker_pool(1),
+        )
+        state.cancel_events["tg:1"] = cancel_event
+
+        def running_request():
+            worker_started.set()
+            cancel_event.wait(5)
+            observed.append(attachment_store.close.called)
+
+        state.worker_pool.submit(running_request)
+        queued = state.worker_pool.submit(observed.append, "queued ran")
+        worker_started.wait(5)
+        bootstrap = bridge.RuntimeBootstrap(
+            state=state,
+            state_paths={},
+            loaded_threads={},
+            loaded_worker_sessions={},
+            loaded_in_flight={},
+            canonical_bootstrap_source="none",
+            affective_runtime=None,
+            voice_alias_learning_store=None,
+        )
+
+        bridge.close_runtime_bootstrap(bootstrap)
+
+        self.assertEqual(observed, [False])
+        self.assertTrue(queued.cancelled())
+        attachment_store.close.assert_called_once_with()
+
+    def test_worker_pool_runs_tasks_on_daemon_threads_and_bounds_its_join(self):
+        pool = bridge_runtime_setup.build_worker_pool(2)
+        release = threading.Event()
+        daemon_flags = []
+
+        def stuck_task():
+            daemon_flags.append(threading.current_thread().daemon)
+            release.wait(5)
+
+        running = pool.submit(stuck_task)
+        self.assertEqual(pool.submit(lambda: "done").result(timeout=5), "done")
+        pool.shutdown(wait=False, cancel_futures=True)
+
+        self.assertFalse(pool.join(0.1))
+        self.assertEqual(daemon_flags, [True])
+        with self.assertRaises(RuntimeError):
+            pool.submit(stuck_task)
+        release.set()
+        self.assertTrue(pool.join(5))
+        self.assertTrue(running.done())
+
+    def test_notify_interrupted_requests_sends_to_allowed_scopes(self):
+        client = FakeTelegramClient()
+        config = make_config(allowed_chat_ids={1, 2})
+
+        bridge_runtime_setup.notify_interrupted_requests(
+            config,
+            client,
+            ["tg:2", "tg:1:topic:7", "tg:3", "bogus"],
+        )
+
+        self.assertEqual(sorted(chat_id for chat_id, _, _, _ in client.messages), [1, 2])
+        self.assertTrue(
+            all(text == bridge_runtime_setup.INTERRUPTED_NOTICE_TEXT for _, text, _, _ in client.messages)
+        )
+
     def test_run_bridge_closes_runtime_bootstrap_when_plugin_selection_fails(self):
         bootstrap = bridge.RuntimeBootstrap(
             state=bridge.State(
@@ -533,6 +605,46 @@ class TestConfig(unittest.TestCase):
         attachment_store.close.assert_called_once_with()
         affective_runtime.close.assert_called_once_with()
 
+    def test_run_bridge_skips_offset_rewrite_after_empty_polls(self):
+        bootstrap = bridge.RuntimeBootstrap(
+            state=bridge.State(),
+            state_paths={
+                "chat_threads": "/tmp/chat_threads.json",
+                "in_flight_requests": "/tmp/in_flight_requests.json",
+                "chat_sessions": "/tmp/chat_sessions.json",
+            },
+            loaded_threads={},
+            loaded_worker_sessions={},
+            loaded_in_flight={},
+            canonical_bootstrap_source="none",
+            affective_runtime=None,
+            voice_alias_learning_store=None,
+        )
+        client = mock.Mock()
+        client.get_updates.side_effect = [[], [], KeyboardInterrupt()]
+        registry = mock.Mock()
+        registry.build_channel.return_value = client
+        registry.build_engine.return_value = mock.Mock()
+
+        with (
+            mock.patch.object(bridge, "build_runtime_bootstrap", return_value=bootstrap),
+            mock.patch.object(bridge, "build_default_plugin_registry", return_value=registry),
+            mock.patch.object(bridge, "persist_bootstrap_state"),
+            mock.patch.object(bridge, "pop_interrupted_requests", return_value=[]),
+            mock.patch.object(bridge, "should_discard_startup_backlog", return_value=False),
+            mock.patch.object(bridge, "compute_initial_update_offset", return_value=(5, "/tmp/update_offset.json")),
+            mock.patch.object(bridge, "maybe_reset_stale_runtime_offset", return_value=5),
+            mock.patch.object(bridge, "persist_saved_update_offset") as persist_saved_update_offset,
+            mock.patch.object(bridge, "expire_idle_worker_sessions"),
+            mock.patch.object(bridge, "flush_ready_media_group_updates", return_value=[]),
+            mock.patch.object(bridge, "flush_ready_text_batch_updates", return_value=[]),
+            mock.patch.object(bridge, "compute_poll_timeout_seconds", return_value=1),
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                bridge.run_bridge(make_config())
+
+        persist_saved_update_offset.assert_called_once_with("/tmp/update_offset.json", 5)
+
     def test_load_config_reads_allow_private_chats_unlisted_override(self):
         with mock.patch.dict(
             os.environ,
@@ -546,6 +658,18 @@ class TestConfig(unittest.TestCase):
             config = bridge.load_config()
         self.assertTrue(config.allow_private_chats_unlisted)
 
+    def test_load_config_defaults_to_long_poll_timeout(self):
+        with mock.patch.dict(
+            os.environ,
+            {
+                "TELEGRAM_BOT_TOKEN": "token",
+                "TELEGRAM_ALLOWED_CHAT_IDS": "1",
+            },
+            clear=True,
+        ):
+            config = bridge.load_config()
+        self.assertEqual(config.poll_timeout_seconds, 45)
+
     def test_load_config_reads_busy_message_override(self):
         with mock.patch.dict(
             os.environ,
@@ -774,6 +898,39 @@ class TestConfig(unittest.TestCase):
 
         self.assertEqual(absolute_fingerprint, tilde_fingerprint)
 
+    def test_policy_fingerprint_matches_cached_fingerprint_for_unsorted_paths(self):
+        bridge_session_manager._policy_fingerprint_cache.clear()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy_a = Path(tmpdir) / "a.txt"
+            policy_b = Path(tmpdir) / "b.txt"
+            policy_a.write_text("a\n", encoding="utf-8")
+            policy_b.write_text("bb\n", encoding="utf-8")
+            configured = [str(policy_b), str(policy_a), str(policy_a)]
+
+            startup_fingerprint = bridge_session_manager.compute_policy_fingerprint(configured)
+            cached_fingerprint = bridge_session_manager.get_cached_policy_fingerprint(configured)
+
+        self.assertEqual(startup_fingerprint, cached_fingerprint)
+
+    def test_policy_fingerprint_reuses_digest_until_file_stat_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            policy_path = Path(tmpdir) / "policy.txt"
+            policy_path.write_text("policy-v1\n", encoding="utf-8")
+
+            with mock.patch.object(
+                bridge_session_manager.hashlib,
+                "sha256",
+                wraps=bridge_session_manager.hashlib.sha256,
+            ) as sha256:
+                first = bridge_session_manager.compute_policy_fingerprint([str(policy_path)])
+                second = bridge_session_manager.compute_policy_fingerprint([str(policy_path)])
+                policy_path.write_text("policy-v2 longer\n", encoding="utf-8")
+                third = bridge_session_manager.compute_policy_fingerprint([str(policy_path)])
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, third)
+        self.assertEqual(sha256.call_count, 2)
+
     def test_policy_fingerprint_cache_normalizes_tilde_and_absolute_paths(self):
         bridge_session_manager._policy_fingerprint_cache.clear()
         home_dir = Path.home()
@@ -2,10 +2,12 @@ import unittest
 from unittest import mock
 import json
 import tempfile
+import threading
 from pathlib import Path
 
 from tests.telegram_bridge.helpers import FakeTelegramClient, make_config
 
+from telegram_bridge.background_tasks import OutboundMessageQueue
 import telegram_bridge.control_commands as bridge_control_commands
 from telegram_bridge.state_store import State
 
@@ -111,6 +113,55 @@ class TestControlCommands(unittest.TestCase):
 
         self.assertEqual(client.messages[-1], (1, bridge_control_commands.CANCEL_REQUESTED_MESSAGE, 88, None))
 
+    def test_handle_cancel_command_routes_reply_through_outbound_queue(self):
+        client = FakeTelegramClient()
+        outbound_messages = OutboundMessageQueue()
+        state = State(outbound_messages=outbound_messages)
+
+        with mock.patch.object(bridge_control_commands, "request_chat_cancel", return_value="requested"):
+            bridge_control_commands.handle_cancel_command(state, client, "tg:1", 1, 77, 88)
+        outbound_messages.close()
+
+        self.assertEqual(client.messages[-1], (1, bridge_control_commands.CANCEL_REQUESTED_MESSAGE, 88, None))
+
+    def test_outbound_queue_merges_backlogged_replies_to_the_same_target(self):
+        client = FakeTelegramClient()
+        sending = threading.Event()
+        release = threading.Event()
+        original_send_message = client.send_message
+
+        def _slow_send_message(*args, **kwargs):
+            sending.set()
+            release.wait(5)
+            return original_send_message(*args, **kwargs)
+
+        client.send_message = _slow_send_message
+        outbound_messages = OutboundMessageQueue()
+        outbound_messages.send_message(client, 1, "first", reply_to_message_id=88)
+        sending.wait(5)
+        outbound_messages.send_message(client, 1, "second", reply_to_message_id=88)
+        outbound_messages.send_message(client, 1, "third", reply_to_message_id=88)
+        outbound_messages.send_message(client, 2, "other chat")
+        outbound_messages.send_message(client, 1, "x" * 4080, reply_to_message_id=88)
+        release.set()
+        outbound_messages.close()
+
+        self.assertEqual(
+            [(chat_id, text[:20]) for chat_id, text, _, _ in client.messages],
+            [(1, "first"), (1, "second\nthird"), (2, "other chat"), (1, "x" * 20)],
+        )
+
+    def test_handle_cancel_command_replies_inline_once_outbound_queue_closed(self):
+        client = FakeTelegramClient()
+        outbound_messages = OutboundMessageQueue()
+        outbound_messages.close()
+        state = State(outbound_messages=outbound_messages)
+
+        with mock.patch.object(bridge_control_commands, "request_chat_cancel", return_value="requested"):
+            bridge_control_commands.handle_cancel_command(state, client, "tg:1", 1, 77, 88)
+
+        self.assertEqual(client.messages[-1], (1, bridge_control_commands.CANCEL_REQUESTED_MESSAGE, 88, None))
+
     def test_handle_cancel_command_replies_for_unavailable_status(self):
         client = FakeTelegramClient()
 
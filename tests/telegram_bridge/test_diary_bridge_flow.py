@@ -203,6 +203,46 @@ class DiaryBridgeFlowTests(unittest.TestCase):
             self.assertEqual(len(entries), 1)
             self.assertIn("beach", entries[0].title.lower())
 
+    def test_cancel_during_voice_transcription_skips_saving_the_entry(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = make_config(tmpdir)
+            state = bridge_state_store.State()
+            client = FakeDiaryClient()
+            voice_path = Path(tmpdir) / "voice.ogg"
+            voice_path.write_bytes(b"ogg")
+            pending = bridge_state_store.PendingDiaryBatch(
+                scope_key="tg:1",
+                chat_id=1,
+                message_thread_id=None,
+                latest_message_id=101,
+                sender_name="User",
+                actor_user_id=1,
+                messages=[
+                    {
+                        "message_id": 101,
+                        "date": int(time.time()),
+                        "text": "Lunch by the water.",
+                        "voice": {"file_id": "voice-1"},
+                    }
+                ],
+            )
+
+            def cancel_transcription(config, voice_path, cancel_event=None):
+                cancel_event.set()
+                raise bridge_diary_processing.VoiceTranscriptionCancelledError("Voice transcription canceled.")
+
+            with mock.patch.object(
+                bridge_diary_processing, "download_voice_to_temp", return_value=str(voice_path)
+            ), mock.patch.object(
+                bridge_diary_processing, "transcribe_voice", side_effect=cancel_transcription
+            ), mock.patch.object(bridge_diary_processing, "append_day_entry") as append_day_entry:
+                bridge_diary_processing.process_diary_batch(state, config, client, "tg:1", pending)
+
+            append_day_entry.assert_not_called()
+            texts = [text for _, text, _ in client.messages]
+            self.assertIn("Request canceled.", texts)
+            self.assertFalse(any("Saved " in text for text in texts))
+
     def test_diary_queue_keeps_later_batches_separate_while_first_is_processing(self) -> None:
         config = make_config(tempfile.mkdtemp())
         state = bridge_state_store.State()
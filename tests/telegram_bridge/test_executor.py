@@ -41,6 +41,7 @@ import telegram_bridge.prompt_execution as bridge_prompt_execution
 import telegram_bridge.session_manager as bridge_session_manager
 import telegram_bridge.signal_channel as bridge_signal_channel
 import telegram_bridge.special_request_processing as bridge_special_request_processing
+import telegram_bridge.stream_buffer as bridge_stream_buffer
 import telegram_bridge.structured_logging as bridge_structured_logging
 import telegram_bridge.transport as bridge_transport
 import telegram_bridge.voice_alias_commands as bridge_voice_alias_commands
@@ -161,6 +162,25 @@ class TestExecutor(unittest.TestCase):
             )
         restart.assert_not_called()
 
+    def test_codex_app_server_suppresses_bubblewrap_notice_only_when_unrestricted(self):
+        notice = "Codex could not find bubblewrap on PATH; will use the bundled bubblewrap in the meantime."
+        sessions = {
+            sandbox_mode: bridge_codex_app_server.CodexAppServerSession(
+                scope_key="tg:1",
+                config=SimpleNamespace(
+                    cwd="/tmp",
+                    codex_model="",
+                    codex_reasoning_effort="",
+                    codex_sandbox_mode=sandbox_mode,
+                ),
+            )
+            for sandbox_mode in ("off", "workspace-write")
+        }
+
+        self.assertTrue(sessions["off"]._should_suppress_stderr_line(notice))
+        self.assertFalse(sessions["off"]._should_suppress_stderr_line("could not find bubblewrap on PATH"))
+        self.assertFalse(sessions["workspace-write"]._should_suppress_stderr_line(notice))
+
     def test_codex_app_server_fail_inflight_requests_unblocks_waiters(self):
         session = bridge_codex_app_server.CodexAppServerSession(
             scope_key="tg:1",
@@ -252,6 +272,57 @@ class TestExecutor(unittest.TestCase):
         self.assertEqual(thread_id, "thread-123")
         self.assertEqual(output, "hello")
 
+    def test_parse_executor_output_slices_text_after_output_marker(self):
+        sample_stream = "THREAD_ID=thread-9\nprogress noise\nOUTPUT_BEGIN\n first line\nsecond line\n\n"
+        thread_id, output = bridge.parse_executor_output(sample_stream)
+        self.assertEqual(thread_id, "thread-9")
+        self.assertEqual(output, "first line\nsecond line")
+
+    def test_parse_executor_output_accepts_padded_marker_line_only(self):
+        sample_stream = "THREAD_ID=thread-9\nnot OUTPUT_BEGIN\n  OUTPUT_BEGIN \r\nanswer\n"
+        thread_id, output = bridge.parse_executor_output(sample_stream)
+        self.assertEqual(thread_id, "thread-9")
+        self.assertEqual(output, "answer")
+
+    def test_parse_executor_output_skips_marker_text_inside_earlier_lines(self):
+        sample_stream = (
+            '{"type":"item.completed","item":{"type":"agent_message","text":"print OUTPUT_BEGIN"}}\n'
+            "OUTPUT_BEGIN_LATER\n"
+            "OUTPUT_BEGIN\n"
+            "final\n"
+        )
+        thread_id, output = bridge.parse_executor_output(sample_stream)
+        self.assertIsNone(thread_id)
+        self.assertEqual(output, "final")
+
+    def test_parse_executor_output_ignores_json_events_after_output_marker(self):
+        sample_stream = (
+            "THREAD_ID=thread-9\n"
+            "OUTPUT_BEGIN\n"
+            '{"type":"thread.started","thread_id":"thread-other"}\n'
+        )
+        thread_id, output = bridge.parse_executor_output(sample_stream)
+        self.assertEqual(thread_id, "thread-9")
+        self.assertEqual(output, '{"type":"thread.started","thread_id":"thread-other"}')
+
+    def test_parse_executor_output_skips_decoding_progress_events(self):
+        sample_stream = (
+            '{"type":"thread.started","thread_id":"thread-123"}\n'
+            '{"type":"item.started","item":{"type":"command_execution","command":"ls"}}\n'
+            '{"type":"item.completed","item":{"type":"reasoning","text":"thinking"}}\n'
+            '{"type":"item.completed","item":{"type":"agent_message","text":"hello"}}\n'
+        )
+        with mock.patch.object(
+            bridge_executor,
+            "parse_stream_json_line",
+            wraps=bridge_executor.parse_stream_json_line,
+        ) as parse_stream_json_line:
+            thread_id, output = bridge_executor.parse_executor_output(sample_stream)
+
+        self.assertEqual(thread_id, "thread-123")
+        self.assertEqual(output, "hello")
+        self.assertEqual(parse_stream_json_line.call_count, 2)
+
     def test_bounded_text_buffer_marks_truncation(self):
         buffer = bridge.BoundedTextBuffer(
             64,
@@ -265,12 +336,40 @@ class TestExecutor(unittest.TestCase):
         self.assertIn("...[truncated]...", rendered)
         self.assertTrue(rendered.startswith("HEAD-SECTION"))
 
+    def test_output_tail_slices_bytes_before_decoding(self):
+        self.assertEqual(bridge_stream_buffer.output_tail(b"x" * 50 + "\u00e9".encode("utf-8"), 4), "xx\u00e9")
+        self.assertEqual(bridge_stream_buffer.output_tail(b"\xff" + b"abc", 4), "\ufffdabc")
+        self.assertEqual(bridge_stream_buffer.output_tail("abcdef", 3), "def")
+        self.assertEqual(bridge_stream_buffer.output_tail(None, 3), "")
+
+    def test_spooled_output_tail_reads_only_the_end_of_the_file(self):
+        with tempfile.TemporaryFile() as handle:
+            self.assertEqual(bridge_stream_buffer.spooled_output_tail(handle, 4), "")
+            handle.write(b"progress " * 100 + b"failed")
+            self.assertEqual(bridge_stream_buffer.spooled_output_tail(handle, 6), "failed")
+            self.assertEqual(bridge_stream_buffer.spooled_output_tail(handle, 0), "")
+
     def test_to_telegram_chunks_uses_real_newline_prefix(self):
         chunks = bridge.to_telegram_chunks("x" * 5000)
         self.assertGreater(len(chunks), 1)
         self.assertTrue(chunks[0].startswith("[1/2]\n"))
         self.assertNotIn("\\n", chunks[0][:10])
 
+    def test_split_for_limit_prefers_newlines_and_drops_them_between_chunks(self):
+        self.assertEqual(
+            bridge_transport.split_for_limit("aaaa\n\nbbbbbbb", 5),
+            ["aaaa", "bbbbb", "bb"],
+        )
+        self.assertEqual(bridge_transport.split_for_limit("", 5), [""])
+
+    def test_split_for_limit_keeps_long_output_intact_within_limit(self):
+        text = "\n".join(f"line {index} " + "y" * (index % 97) for index in range(400))
+        chunks = bridge_transport.split_for_limit(text, bridge_transport.TELEGRAM_CHUNK_LIMIT)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= bridge_transport.TELEGRAM_CHUNK_LIMIT for chunk in chunks))
+        self.assertEqual("\n".join(chunks), text)
+
     def test_parse_stream_json_line_rejects_invalid_payloads(self):
         self.assertIsNone(bridge_executor.parse_stream_json_line("not-json"))
         self.assertIsNone(bridge_executor.parse_stream_json_line("[]"))
@@ -5,6 +5,8 @@ import stat
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -24,6 +26,7 @@ if str(BRIDGE_DIR) not in sys.path:
 sys.modules[spec.name] = executor
 spec.loader.exec_module(executor)
 import telegram_bridge.prompt_runtime as prompt_runtime
+import telegram_bridge.response_delivery as response_delivery
 from telegram_bridge.state_models import State
 
 
@@ -111,6 +114,36 @@ printf '%s\\n' '{"type":"item.completed","item":{"type":"agent_message","status"
             self.assertEqual(timing_calls[0]["channel_name"], "telegram")
             self.assertEqual(timing_calls[1]["duration_ms"], 1234)
 
+    def test_run_executor_multiplexes_pipes_without_helper_threads(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="executor-pipes-") as tmpdir:
+            tmp_path = Path(tmpdir)
+            fake_executor = tmp_path / "fake_executor.sh"
+            make_executable_script(
+                fake_executor,
+                """#!/usr/bin/env bash
+set -euo pipefail
+cat
+printf 'tail-without-newline' >&2
+""",
+            )
+            config = SimpleNamespace(
+                executor_cmd=[str(fake_executor)],
+                exec_timeout_seconds=5,
+            )
+            prompt = "x" * (256 * 1024)
+
+            with mock.patch.object(executor.threading, "Thread") as thread_cls:
+                result = executor.run_executor(
+                    config=config,
+                    prompt=prompt,
+                    thread_id=None,
+                )
+
+        thread_cls.assert_not_called()
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, prompt + "\n")
+        self.assertEqual(result.stderr, "tail-without-newline")
+
     def test_extract_executor_phase_timing_rejects_invalid_payload(self) -> None:
         self.assertIsNone(executor.extract_executor_phase_timing({}))
         self.assertIsNone(
@@ -156,6 +189,124 @@ printf '%s\\n' '{"type":"item.completed","item":{"type":"agent_message","status"
 
         self.assertEqual(executor.cached_executor_result_output(result), ("thread-123", "done"))
 
+    def _run_executor_output_script(self, output_script: str) -> tuple:
+        with tempfile.TemporaryDirectory(prefix="executor-output-cap-") as tmpdir:
+            fake_executor = Path(tmpdir) / "fake_executor.sh"
+            make_executable_script(
+                fake_executor,
+                "#!/usr/bin/env bash\nset -euo pipefail\ncat >/dev/null\necho THREAD_ID=thread-7\necho OUTPUT_BEGIN\n"
+                + output_script,
+            )
+            config = SimpleNamespace(
+                executor_cmd=[str(fake_executor)],
+                exec_timeout_seconds=10,
+                max_output_chars=500,
+            )
+
+            with mock.patch.object(executor, "emit_event"):
+                result = executor.run_executor(config=config, prompt="hello", thread_id=None)
+
+        self.assertEqual(result.returncode, 0)
+        return executor.parse_executor_output(result.stdout)
+
+    def test_run_executor_keeps_bounded_head_and_tail_of_long_output(self) -> None:
+        thread_id, output = self._run_executor_output_script(
+            "for i in $(seq 1 2000); do printf 'line %04d %s\\n' \"$i\" \"$(printf 'x%.0s' $(seq 1 40))\"; done\n"
+            "echo '[[media: /tmp/chart.png]]'\n"
+        )
+
+        self.assertEqual(thread_id, "thread-7")
+        self.assertTrue(output.startswith("line 0001 "))
+        self.assertIn(executor.EXECUTOR_STREAM_TRUNCATION_MARKER.strip(), output)
+        self.assertIn("line 2000 ", output)
+        self.assertLessEqual(len(output), 2000)
+        self.assertTrue(output.endswith("[[media: /tmp/chart.png]]"))
+        self.assertTrue(response_delivery.output_contains_control_directive(output))
+
+    def test_run_executor_keeps_structured_envelope_whole(self) -> None:
+        _, output = self._run_executor_output_script(
+            "echo '{\"telegram_outbound\": {\"text\": \"summary\",'\n"
+            "for i in $(seq 1 2000); do printf '\"k%04d\": \"%s\",\\n' \"$i\" \"$(printf 'x%.0s' $(seq 1 40))\"; done\n"
+            "echo '\"end\": true}}'\n"
+        )
+
+        payload = json.loads(output)
+        self.assertEqual(len(payload["telegram_outbound"]), 2002)
+
+    @unittest.skipUnless(Path("/proc/self").exists(), "needs /proc to inspect the spawned child")
+    def test_run_executor_timeout_kills_spawned_children(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="executor-timeout-") as tmpdir:
+            tmp_path = Path(tmpdir)
+            child_pid_path = tmp_path / "child.pid"
+            fake_executor = tmp_path / "fake_executor.sh"
+            make_executable_script(
+                fake_executor,
+                f"""#!/usr/bin/env bash
+cat >/dev/null
+sleep 30 &
+echo $! > {child_pid_path}
+wait
+""",
+            )
+            config = SimpleNamespace(
+                executor_cmd=[str(fake_executor)],
+                exec_timeout_seconds=1,
+            )
+
+            with mock.patch.object(executor, "emit_event"):
+                with self.assertRaises(subprocess.TimeoutExpired):
+                    executor.run_executor(config=config, prompt="hello", thread_id=None)
+
+            child_status = Path(f"/proc/{child_pid_path.read_text().strip()}/status")
+            for _ in range(50):
+                try:
+                    if "State:\tZ" in child_status.read_text():
+                        break
+                except FileNotFoundError:
+                    break
+                time.sleep(0.05)
+            else:
+                self.fail("executor child survived the timeout")
+
+    def test_pipe_line_decoder_joins_lines_split_across_reads(self) -> None:
+        lines = []
+        decoder = executor._PipeLineDecoder(lines.append)
+        payload = "first\r\n" + "x" * 50 + "\nthird\nfinal"
+        encoded = payload.encode(executor.EXECUTOR_STREAM_ENCODING)
+
+        for index in range(0, len(encoded), 7):
+            decoder.feed(encoded[index : index + 7])
+        decoder.feed(b"", final=True)
+
+        self.assertEqual(lines, ["first\n", "x" * 50 + "\n", "third\n", "final"])
+
+    def test_kill_active_executors_stops_running_executor(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="executor-kill-") as tmpdir:
+            fake_executor = Path(tmpdir) / "fake_executor.sh"
+            make_executable_script(fake_executor, "#!/usr/bin/env bash\ncat >/dev/null\nsleep 30\n")
+            config = SimpleNamespace(
+                executor_cmd=[str(fake_executor)],
+                exec_timeout_seconds=30,
+            )
+            results = []
+
+            def run() -> None:
+                results.append(executor.run_executor(config=config, prompt="hello", thread_id=None))
+
+            with mock.patch.object(executor, "emit_event"):
+                worker = threading.Thread(target=run)
+                worker.start()
+                for _ in range(100):
+                    if executor._ACTIVE_PROCESSES:
+                        break
+                    time.sleep(0.05)
+                self.assertEqual(executor.kill_active_executors(), 1)
+                worker.join(10)
+
+        self.assertFalse(worker.is_alive())
+        self.assertNotEqual(results[0].returncode, 0)
+        self.assertEqual(executor._ACTIVE_PROCESSES, set())
+
     def test_finalize_prompt_success_uses_cached_executor_output(self) -> None:
         state = State()
         state_repo = prompt_runtime.StateRepository(state)
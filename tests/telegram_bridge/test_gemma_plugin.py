@@ -1,5 +1,7 @@
 import os
+import subprocess
 import sys
+import threading
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -16,6 +18,7 @@ if str(SRC_ROOT) not in sys.path:
 
 import engine_adapter as bridge_engine_adapter
 import plugin_registry as bridge_plugin_registry
+from telegram_bridge.executor import ExecutorCancelledError
 
 
 class GemmaPluginTests(unittest.TestCase):
@@ -60,5 +63,32 @@ class GemmaPluginTests(unittest.TestCase):
         self.assertIn("OUTPUT_BEGIN", result.stdout)
         self.assertIn("hello from venice", result.stdout)
 
+    def test_communicate_with_cancel_feeds_input_and_honours_cancel(self):
+        script = "import sys, time; data = sys.stdin.read(); print(data.upper()); sys.stdout.flush(); time.sleep(float(data or 0))"
+
+        def _popen():
+            return subprocess.Popen(
+                [sys.executable, "-c", script],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+
+        with _popen() as process:
+            stdout, _ = bridge_engine_adapter._communicate_process_with_cancel(
+                process, timeout=10, cancel_event=None, cancel_message="cancelled", input_text="0.2"
+            )
+        self.assertEqual(stdout.strip(), "0.2")
+
+        cancel_event = threading.Event()
+        threading.Timer(0.3, cancel_event.set).start()
+        with _popen() as process:
+            with self.assertRaises(ExecutorCancelledError):
+                bridge_engine_adapter._communicate_process_with_cancel(
+                    process, timeout=10, cancel_event=cancel_event, cancel_message="cancelled", input_text="30"
+                )
+            self.assertIsNotNone(process.poll())
+
 if __name__ == "__main__":
     unittest.main()
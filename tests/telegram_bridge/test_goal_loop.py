@@ -1,3 +1,4 @@
+import subprocess
 import sys
 import tempfile
 import unittest
@@ -12,6 +13,7 @@ if str(SRC_ROOT) not in sys.path:
 from tests.telegram_bridge.helpers import FakeTelegramClient, make_config
 
 import telegram_bridge.goal_loop as goal_loop
+from telegram_bridge.executor import attach_cached_executor_result
 from telegram_bridge.state_store import State
 
 
@@ -335,6 +337,46 @@ class GoalLoopTests(unittest.TestCase):
             self.assertIn("did not explicitly say the goal is complete or blocked", reason)
             self.assertFalse(parse_failed)
 
+    def test_judge_reuses_output_parsed_during_streaming(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state = self._make_state(tmpdir)
+            client = FakeTelegramClient()
+            result = attach_cached_executor_result(
+                subprocess.CompletedProcess(args=["codex"], returncode=0, stdout="", stderr=""),
+                None,
+                '{"done": false, "reason": "keep going"}',
+            )
+
+            with mock.patch.object(
+                goal_loop,
+                "build_engine_runtime_config",
+                return_value=object(),
+            ), mock.patch.object(
+                goal_loop,
+                "parse_executor_output",
+                side_effect=AssertionError("stdout should not be re-parsed"),
+            ):
+                engine = mock.Mock()
+                engine.run.return_value = result
+                with mock.patch(
+                    "telegram_bridge.request_starts.resolve_engine_for_scope",
+                    return_value=engine,
+                ):
+                    verdict, reason, parse_failed = goal_loop._run_goal_judge(
+                        state=state,
+                        config=make_config(),
+                        client=client,
+                        scope_key="tg:-1003894351534:topic:1853",
+                        chat_id=-1003894351534,
+                        message_thread_id=1853,
+                        goal_state=goal_loop.GoalState(goal="build the thing"),
+                        last_response="Still working on it.",
+                    )
+
+            self.assertEqual(verdict, "continue")
+            self.assertEqual(reason, "keep going")
+            self.assertFalse(parse_failed)
+
     def test_judge_done_accepts_explicit_goal_complete_wording(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             state = self._make_state(tmpdir)
@@ -178,6 +178,49 @@ class HandlerProgressTests(unittest.TestCase):
         emit_event.assert_called_once()
         self.assertEqual(emit_event.call_args.args[0], "bridge.progress_edit_stats")
 
+    def test_mark_success_defers_its_edit_to_close(self):
+        client = FakeClient()
+        reporter = handler_progress.ProgressReporter(
+            client=client,
+            chat_id=1,
+            reply_to_message_id=5,
+            message_thread_id=None,
+            assistant_name="Architect",
+        )
+        reporter.progress_message_id = 202
+        reporter.last_rendered_text = "initial"
+
+        with mock.patch.object(handler_progress, "emit_event"):
+            reporter.mark_success()
+            self.assertEqual(client.edits, [])
+            with mock.patch.object(handler_progress.time, "time", return_value=reporter.started_at + 30):
+                reporter.close()
+
+        self.assertEqual(len(client.edits), 1)
+        self.assertIn("Finalizing response.", client.edits[0][2])
+
+    def test_mark_success_stops_a_running_heartbeat(self):
+        client = FakeClient()
+        client.send_message_get_id = mock.Mock(return_value=202)
+        reporter = handler_progress.ProgressReporter(
+            client=client,
+            chat_id=1,
+            reply_to_message_id=5,
+            message_thread_id=None,
+            assistant_name="Architect",
+        )
+
+        with mock.patch.object(handler_progress, "emit_event"):
+            reporter.start()
+            reporter.mark_success()
+            reporter._worker.join(timeout=0.5)
+            self.assertFalse(reporter._worker.is_alive())
+            self.assertEqual(client.edits, [])
+            reporter.close()
+
+        self.assertEqual(len(client.edits), 1)
+        self.assertIn("Finalizing response.", client.edits[0][2])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -103,6 +103,42 @@ class TestHandlers(unittest.TestCase):
         self.assertEqual(offset, 10)
         self.assertEqual(state_path, str(offset_path))
 
+    def test_compute_initial_update_offset_skips_queue_probe_without_saved_offset(self):
+        config = make_config(channel_plugin="whatsapp", state_dir=tempfile.mkdtemp())
+        client = mock.Mock()
+
+        offset, state_path = bridge.compute_initial_update_offset(config, client)
+
+        self.assertEqual(offset, 0)
+        self.assertEqual(state_path, str(Path(config.state_dir) / "whatsapp_update_offset.txt"))
+        client.get_updates.assert_not_called()
+
+    def test_drop_pending_updates_acknowledges_backlog_with_single_call(self):
+        class FakeClient:
+            def __init__(self):
+                self.offsets = []
+
+            def get_updates(self, offset, timeout_seconds=0):
+                self.offsets.append((offset, timeout_seconds))
+                return [{"update_id": 250, "message": {}}]
+
+        client = FakeClient()
+        self.assertEqual(bridge.drop_pending_updates(client), 251)
+        self.assertEqual(client.offsets, [(-1, 0)])
+
+    def test_drop_pending_updates_returns_zero_when_queue_empty(self):
+        class FakeClient:
+            def __init__(self):
+                self.calls = 0
+
+            def get_updates(self, offset, timeout_seconds=0):
+                self.calls += 1
+                return []
+
+        client = FakeClient()
+        self.assertEqual(bridge.drop_pending_updates(client), 0)
+        self.assertEqual(client.calls, 1)
+
     def test_load_config_reads_require_prefix_in_private_override(self):
         with mock.patch.dict(
             os.environ,
@@ -380,6 +416,32 @@ class TestHandlers(unittest.TestCase):
         self.assertTrue(client.messages)
         self.assertIn("Bridge status: online", client.messages[-1][1])
 
+    def test_handle_update_ignores_non_message_updates_before_building_flow(self):
+        state = bridge.State()
+        client = FakeTelegramClient()
+        config = make_config()
+        update = {
+            "update_id": 2,
+            "edited_message": {
+                "message_id": 11,
+                "chat": {"id": 1},
+                "text": "/status",
+            },
+        }
+
+        with mock.patch.object(
+            bridge_handlers,
+            "build_update_flow_dependencies",
+        ) as build_update_flow_dependencies, mock.patch.object(
+            bridge_handlers,
+            "handle_callback_query",
+        ) as handle_callback_query:
+            bridge_handlers.handle_update(state, config, client, update)
+
+        build_update_flow_dependencies.assert_not_called()
+        handle_callback_query.assert_not_called()
+        self.assertEqual(client.messages, [])
+
     def test_handle_update_routes_help_alias_with_bot_suffix(self):
         state = bridge.State()
         client = FakeTelegramClient()
@@ -487,6 +487,22 @@ class HandleUpdateHelperTests(unittest.TestCase):
             )
         )
 
+    def test_prepare_update_dispatch_request_queues_trimmed_warning_on_outbound_sender(self):
+        outbound_messages = mock.Mock()
+        flow = self._make_flow(
+            state=bridge.State(outbound_messages=outbound_messages),
+            config=make_config(max_input_chars=20),
+            prompt_input="short prompt",
+            telegram_context_prompt="telegram context",
+        )
+
+        dispatch = bridge_handlers.prepare_update_dispatch_request(flow, 12.0)
+
+        self.assertIsNotNone(dispatch)
+        self.assertEqual(flow.client.messages, [])
+        outbound_messages.send_message.assert_called_once()
+        self.assertIn("trimmed prompt context", outbound_messages.send_message.call_args.args[2])
+
     def test_prepare_update_dispatch_request_includes_current_sender_name(self):
         flow = self._make_flow(
             prompt_input="hello",
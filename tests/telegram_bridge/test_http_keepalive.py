@@ -0,0 +1,172 @@
+import socket
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_ROOT = ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+import telegram_bridge.http_keepalive as http_keepalive
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports = []
+    close_after_response = False
+    drop_without_response = False
+    status = 200
+    delay_seconds = 0.0
+
+    def do_GET(self):
+        type(self).client_ports.append(self.client_address[1])
+        if type(self).drop_without_response:
+            self.close_connection = True
+            return
+        if type(self).delay_seconds:
+            time.sleep(type(self).delay_seconds)
+        body = b"x" * 4096
+        try:
+            self.send_response(type(self).status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up first (read timeout test).
+            self.close_connection = True
+            return
+        if type(self).close_after_response:
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        return
+
+
+class TestHttpKeepAlive(unittest.TestCase):
+    def setUp(self):
+        _Handler.client_ports = []
+        _Handler.close_after_response = False
+        _Handler.drop_without_response = False
+        _Handler.status = 200
+        _Handler.delay_seconds = 0.0
+        http_keepalive.close_idle_connections()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/file"
+
+    def tearDown(self):
+        http_keepalive.close_idle_connections()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join(timeout=5)
+
+    def _fetch(self, read_size=None, timeout=5):
+        with http_keepalive.urlopen(Request(self.url, method="GET"), timeout=timeout) as response:
+            return response.read(read_size)
+
+    def test_reuses_connection_across_requests(self):
+        for _ in range(3):
+            self.assertEqual(len(self._fetch()), 4096)
+
+        self.assertEqual(len(_Handler.client_ports), 3)
+        self.assertEqual(len(set(_Handler.client_ports)), 1)
+
+    def test_close_idle_connections_forces_fresh_connection(self):
+        self.assertEqual(len(self._fetch()), 4096)
+
+        http_keepalive.close_idle_connections()
+        self.assertEqual(len(self._fetch()), 4096)
+        self.assertEqual(len(set(_Handler.client_ports)), 2)
+
+    def test_shares_idle_connection_across_threads(self):
+        self.assertEqual(len(self._fetch()), 4096)
+        worker = threading.Thread(target=self._fetch)
+        worker.start()
+        worker.join(timeout=5)
+
+        self.assertEqual(len(_Handler.client_ports), 2)
+        self.assertEqual(len(set(_Handler.client_ports)), 1)
+
+    def test_opens_separate_connections_for_concurrent_responses(self):
+        first = http_keepalive.urlopen(Request(self.url, method="GET"), timeout=5)
+        second = http_keepalive.urlopen(Request(self.url, method="GET"), timeout=5)
+        try:
+            self.assertEqual(len(second.read()), 4096)
+            self.assertEqual(len(first.read()), 4096)
+        finally:
+            first.close()
+            second.close()
+        self.assertEqual(len(self._fetch()), 4096)
+
+        self.assertEqual(len(set(_Handler.client_ports)), 2)
+
+    def test_reconnects_after_partially_read_response(self):
+        self.assertEqual(len(self._fetch(read_size=16)), 16)
+        self.assertEqual(len(self._fetch()), 4096)
+
+        self.assertEqual(len(set(_Handler.client_ports)), 2)
+
+    def test_pooled_sockets_enable_tcp_keepalive(self):
+        adapter = http_keepalive._SESSION.get_adapter("https://api.telegram.org")
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), options)
+
+    def test_readinto_streams_the_body(self):
+        buffer = bytearray(1024)
+        total = 0
+        with http_keepalive.urlopen(Request(self.url, method="GET"), timeout=5) as response:
+            self.assertEqual(response.headers["Content-Length"], "4096")
+            while True:
+                count = response.readinto(buffer)
+                if not count:
+                    break
+                total += count
+
+        self.assertEqual(total, 4096)
+
+    def test_replaces_idle_connection_closed_by_peer(self):
+        _Handler.close_after_response = True
+
+        for _ in range(3):
+            self.assertEqual(len(self._fetch()), 4096)
+            time.sleep(0.1)
+
+        self.assertEqual(len(_Handler.client_ports), 3)
+        self.assertEqual(len(set(_Handler.client_ports)), 3)
+
+    def test_does_not_resend_when_the_response_never_arrives(self):
+        self.assertEqual(len(self._fetch()), 4096)
+        _Handler.drop_without_response = True
+
+        with self.assertRaises(URLError):
+            self._fetch()
+
+        self.assertEqual(len(_Handler.client_ports), 2)
+
+    def test_error_status_raises_urllib_http_error_with_body(self):
+        _Handler.status = 502
+
+        with self.assertRaises(HTTPError) as caught:
+            self._fetch()
+
+        self.assertEqual(caught.exception.code, 502)
+        self.assertEqual(len(caught.exception.read()), 4096)
+
+    def test_read_timeout_surfaces_as_socket_timeout(self):
+        _Handler.delay_seconds = 0.5
+
+        with self.assertRaises(TimeoutError):
+            self._fetch(timeout=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_ROOT = ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+import telegram_bridge.json_codec as json_codec
+
+
+class TestJsonCodec(unittest.TestCase):
+    def _assert_round_trips(self):
+        value = {"tg:2": "привет", "tg:1": {"n": 1, "ok": True}}
+
+        compact = json_codec.dumps_compact(value, sort_keys=True)
+        pretty = json_codec.dumps_state(value)
+
+        self.assertEqual(compact, '{"tg:1":{"n":1,"ok":true},"tg:2":"привет"}')
+        self.assertEqual(pretty, json.dumps(value, ensure_ascii=False, indent=2, sort_keys=True) + "\n")
+        self.assertEqual(json_codec.dumps_state(value, pretty=False), compact)
+        self.assertEqual(json_codec.loads(compact.encode("utf-8")), value)
+        self.assertEqual(json_codec.loads(pretty), value)
+        with self.assertRaises(json.JSONDecodeError):
+            json_codec.loads('{"k":"to')
+
+    def test_round_trips_with_available_encoder(self):
+        self._assert_round_trips()
+
+    def test_round_trips_with_stdlib_fallback(self):
+        with mock.patch.object(json_codec, "orjson", None):
+            self._assert_round_trips()
+
+
+if __name__ == "__main__":
+    unittest.main()
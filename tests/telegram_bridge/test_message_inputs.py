@@ -25,6 +25,20 @@ class TestMessageInputs(unittest.TestCase):
         self.assertIsNone(voice_file_id)
         self.assertIsNone(document)
 
+    def test_pick_largest_photo_file_id_keeps_last_entry_on_size_ties(self):
+        self.assertEqual(
+            message_inputs.pick_largest_photo_file_id(
+                [
+                    {"file_id": "p-a"},
+                    "not-a-dict",
+                    {"file_id": "  "},
+                    {"file_id": " p-b ", "file_size": "big"},
+                ]
+            ),
+            "p-b",
+        )
+        self.assertIsNone(message_inputs.pick_largest_photo_file_id([{"file_size": 5}]))
+
     def test_extract_media_selection_returns_document_payload(self):
         photo_file_ids, voice_file_id, document = message_inputs._extract_media_selection(
             {
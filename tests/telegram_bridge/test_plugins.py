@@ -52,6 +52,10 @@ class TestPlugins(unittest.TestCase):
     def test_normalize_command_and_trim_output_helpers(self):
         self.assertEqual(bridge_handlers.normalize_command("/h@architect_bot now"), "/h")
         self.assertIsNone(bridge_handlers.normalize_command("hello"))
+        self.assertEqual(bridge_handlers.normalize_command("  /status  "), "/status")
+        self.assertEqual(bridge_handlers.normalize_command("@architect_bot  /new now"), "/new")
+        self.assertIsNone(bridge_handlers.normalize_command("@architect_bot hello"))
+        self.assertIsNone(bridge_handlers.normalize_command("  "))
         trimmed = bridge_handlers.trim_output("x" * 40, 20)
         self.assertTrue(trimmed.endswith("[output truncated]"))
         self.assertLessEqual(len(trimmed), 20)
@@ -723,6 +723,26 @@ class TestPrompt(unittest.TestCase):
             "The runtime has hit its usage limit. Try again after 2:00 PM.",
         )
 
+    def test_extract_executor_failure_message_skips_streams_without_known_failure(self):
+        with mock.patch.object(
+            bridge_handlers.response_delivery.json,
+            "loads",
+            side_effect=AssertionError("streams without a known failure should not be decoded"),
+        ):
+            self.assertIsNone(
+                bridge_handlers.response_delivery.extract_executor_failure_message(
+                    '{"type":"error","message":"boom"}\n',
+                    "Traceback (most recent call last):\n",
+                )
+            )
+        self.assertEqual(
+            bridge_handlers.response_delivery.extract_executor_failure_message(
+                '{"type":"error","message":"You\'ve hit your\\nusage limit."}\n',
+                "",
+            ),
+            "The runtime has hit its usage limit. Try again later.",
+        )
+
     def test_execute_prompt_with_retry_does_not_rerun_new_session_nonzero_exit(self):
         class NonzeroEngine:
             engine_name = "nonzero"
@@ -90,6 +90,31 @@ class TestPromptInputs(unittest.TestCase):
             self.assertEqual(len(client.messages), 1)
             self.assertIn("Voice transcript (confidence 0.91):", client.messages[0][1])
 
+    def test_transcribe_voice_for_chat_leaves_caller_temp_dir_cleanup_to_owner(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            voice_path = Path(tmpdir) / "voice.ogg"
+            voice_path.write_bytes(b"voice-bytes")
+            config = make_config(voice_transcribe_cmd=["/bin/echo"])
+
+            with mock.patch.object(prompt_inputs, "download_voice_to_temp", return_value=str(voice_path)) as download_voice_to_temp, mock.patch.object(
+                prompt_inputs,
+                "transcribe_voice",
+                return_value=("hello world", None),
+            ):
+                transcript = prompt_inputs.transcribe_voice_for_chat(
+                    state=bridge.State(),
+                    config=config,
+                    client=FakeTelegramClient(),
+                    chat_id=1,
+                    message_id=106,
+                    voice_file_id="voice-request-dir",
+                    temp_dir_fn=lambda: tmpdir,
+                )
+
+            self.assertEqual(transcript, "hello world")
+            self.assertEqual(download_voice_to_temp.call_args.kwargs["temp_dir"], tmpdir)
+            self.assertTrue(voice_path.exists())
+
     def test_transcribe_voice_for_chat_reuses_archived_voice_without_redownload(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             store = self._make_attachment_store(Path(tmpdir))
@@ -1,4 +1,8 @@
+import os
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -292,6 +296,240 @@ class TestPromptPreparation(unittest.TestCase):
             max_input_chars=10,
         )
 
+    def test_prepare_prompt_input_request_rechecks_length_after_voice_transcript(self):
+        state = bridge.State()
+        client = FakeTelegramClient()
+        config = make_config(max_input_chars=10)
+        progress = mock.Mock()
+        send_input_too_long = mock.Mock()
+        request = bridge_handlers.build_prompt_request(
+            state=state,
+            config=config,
+            client=client,
+            engine=None,
+            scope_key="tg:1",
+            chat_id=1,
+            message_thread_id=None,
+            message_id=105,
+            prompt="hello",
+            photo_file_id=None,
+            voice_file_id="voice-1",
+            document=None,
+            prompt_diagnostics={"final_length": 5, "length_validated": True},
+        )
+
+        prepared = prompt_preparation.prepare_prompt_input_request(
+            request,
+            progress,
+            transcribe_voice_for_chat_fn=mock.Mock(return_value="a long transcript"),
+            strip_required_prefix_fn=mock.Mock(),
+            is_whatsapp_channel_fn=mock.Mock(return_value=False),
+            send_input_too_long_fn=send_input_too_long,
+            emit_event_fn=mock.Mock(),
+            prefix_help_message="prefix help",
+        )
+
+        self.assertIsNone(prepared)
+        progress.mark_failure.assert_called_once_with("Input rejected as too long.")
+        send_input_too_long.assert_called_once()
+
+    def test_prepare_prompt_input_request_skips_length_check_only_when_flagged(self):
+        config = make_config(max_input_chars=10)
+
+        def prepare(prompt_diagnostics):
+            request = bridge_handlers.build_prompt_request(
+                state=bridge.State(),
+                config=config,
+                client=FakeTelegramClient(),
+                engine=None,
+                scope_key="tg:1",
+                chat_id=1,
+                message_thread_id=None,
+                message_id=105,
+                prompt="a prompt over ten chars",
+                photo_file_id=None,
+                voice_file_id=None,
+                document=None,
+                prompt_diagnostics=prompt_diagnostics,
+            )
+            return prompt_preparation.prepare_prompt_input_request(
+                request,
+                mock.Mock(),
+                transcribe_voice_for_chat_fn=mock.Mock(),
+                strip_required_prefix_fn=mock.Mock(),
+                is_whatsapp_channel_fn=mock.Mock(return_value=False),
+                send_input_too_long_fn=mock.Mock(),
+                emit_event_fn=mock.Mock(),
+                prefix_help_message="prefix help",
+            )
+
+        self.assertIsNotNone(prepare({"final_length": 23, "length_validated": True}))
+        self.assertIsNone(prepare({"final_length": 23}))
+
+    def test_prepare_prompt_input_request_downloads_into_request_temp_dir(self):
+        state = bridge.State()
+        client = FakeTelegramClient()
+        progress = mock.Mock()
+        request = bridge_handlers.build_prompt_request(
+            state=state,
+            config=make_config(),
+            client=client,
+            engine=None,
+            scope_key="tg:1",
+            chat_id=1,
+            message_thread_id=None,
+            message_id=106,
+            prompt="Describe this",
+            photo_file_id="photo-1",
+            voice_file_id=None,
+            document=None,
+        )
+
+        def fake_download(_client, _config, _file_id, temp_dir=None):
+            handle, path = tempfile.mkstemp(dir=temp_dir, suffix=".jpg")
+            os.close(handle)
+            return path
+
+        with mock.patch.object(
+            prompt_preparation.attachment_processing,
+            "download_photo_to_temp",
+            side_effect=fake_download,
+        ), mock.patch.object(
+            prompt_preparation.attachment_processing,
+            "archive_media_path",
+            return_value=None,
+        ):
+            prepared = prompt_preparation.prepare_prompt_input_request(
+                request,
+                progress,
+                transcribe_voice_for_chat_fn=mock.Mock(),
+                strip_required_prefix_fn=mock.Mock(),
+                is_whatsapp_channel_fn=mock.Mock(return_value=False),
+                send_input_too_long_fn=mock.Mock(),
+                emit_event_fn=mock.Mock(),
+                prefix_help_message="prefix help",
+            )
+
+        self.assertIsNotNone(prepared)
+        self.assertEqual(len(prepared.cleanup_dirs), 1)
+        self.addCleanup(bridge_handlers.cleanup_temp_dirs, prepared.cleanup_dirs)
+        self.assertEqual(os.path.dirname(prepared.image_path), prepared.cleanup_dirs[0])
+        self.assertEqual(prepared.cleanup_paths, [])
+
+    def test_prepare_prompt_input_request_downloads_album_photos_concurrently(self):
+        state = bridge.State()
+        client = FakeTelegramClient()
+        progress = mock.Mock()
+        request = bridge_handlers.build_prompt_request(
+            state=state,
+            config=make_config(),
+            client=client,
+            engine=None,
+            scope_key="tg:1",
+            chat_id=1,
+            message_thread_id=None,
+            message_id=107,
+            prompt="Compare these",
+            photo_file_id=None,
+            voice_file_id=None,
+            document=None,
+            photo_file_ids=["photo-1", "photo-2"],
+        )
+        both_started = threading.Barrier(2, timeout=5)
+
+        def fake_download(_client, _config, file_id, temp_dir=None):
+            both_started.wait()
+            path = os.path.join(temp_dir, f"{file_id}.jpg")
+            Path(path).write_bytes(b"jpg")
+            return path
+
+        with mock.patch.object(
+            prompt_preparation.attachment_processing,
+            "download_photo_to_temp",
+            side_effect=fake_download,
+        ), mock.patch.object(
+            prompt_preparation.attachment_processing,
+            "archive_media_path",
+            return_value=None,
+        ):
+            prepared = prompt_preparation.prepare_prompt_input_request(
+                request,
+                progress,
+                transcribe_voice_for_chat_fn=mock.Mock(),
+                strip_required_prefix_fn=mock.Mock(),
+                is_whatsapp_channel_fn=mock.Mock(return_value=False),
+                send_input_too_long_fn=mock.Mock(),
+                emit_event_fn=mock.Mock(),
+                prefix_help_message="prefix help",
+            )
+
+        self.assertIsNotNone(prepared)
+        self.addCleanup(bridge_handlers.cleanup_temp_dirs, prepared.cleanup_dirs)
+        self.assertEqual(
+            [os.path.basename(path) for path in prepared.image_paths],
+            ["photo-1.jpg", "photo-2.jpg"],
+        )
+        self.assertEqual(prepared.attachment_file_ids, ["photo-1", "photo-2"])
+
+
+    def test_prepare_prompt_input_request_cancels_queued_album_downloads_after_rejection(self):
+        state = bridge.State()
+        client = FakeTelegramClient()
+        progress = mock.Mock()
+        photo_file_ids = [f"photo-{index}" for index in range(1, 9)]
+        request = bridge_handlers.build_prompt_request(
+            state=state,
+            config=make_config(),
+            client=client,
+            engine=None,
+            scope_key="tg:1",
+            chat_id=1,
+            message_thread_id=None,
+            message_id=108,
+            prompt="Compare these",
+            photo_file_id=None,
+            voice_file_id=None,
+            document=None,
+            photo_file_ids=photo_file_ids,
+        )
+        rejected = threading.Event()
+        progress.mark_failure.side_effect = lambda *_args: rejected.set()
+        started = []
+
+        def fake_download(_client, _config, file_id, temp_dir=None):
+            started.append(file_id)
+            if file_id == "photo-1":
+                raise ValueError("Image too large.")
+            rejected.wait(timeout=5)
+            time.sleep(0.05)
+            path = os.path.join(temp_dir, f"{file_id}.jpg")
+            Path(path).write_bytes(b"jpg")
+            return path
+
+        with mock.patch.object(prompt_preparation, "PHOTO_DOWNLOAD_MAX_WORKERS", 1), mock.patch.object(
+            prompt_preparation.attachment_processing,
+            "download_photo_to_temp",
+            side_effect=fake_download,
+        ), mock.patch.object(
+            prompt_preparation.attachment_processing,
+            "archive_media_path",
+            return_value=None,
+        ):
+            prepared = prompt_preparation.prepare_prompt_input_request(
+                request,
+                progress,
+                transcribe_voice_for_chat_fn=mock.Mock(),
+                strip_required_prefix_fn=mock.Mock(),
+                is_whatsapp_channel_fn=mock.Mock(return_value=False),
+                send_input_too_long_fn=mock.Mock(),
+                emit_event_fn=mock.Mock(),
+                prefix_help_message="prefix help",
+            )
+
+        self.assertIsNone(prepared)
+        self.assertEqual(client.messages[-1][1], "Image too large.")
+        self.assertLessEqual(len(started), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -48,5 +48,17 @@ class TestRememberCommands(unittest.TestCase):
         self.assertFalse(changed)
 
 
+    def test_store_pending_proposal_drops_expired_proposals(self):
+        state = bridge_remember_commands.State()
+        state.pending_remember_proposals["old"] = bridge_remember_commands.PendingRememberProposal(
+            scope_key="tg:1",
+            text="stale",
+            created_at=0.0,
+        )
+
+        token = bridge_remember_commands._store_pending_proposal(state, "tg:1", "fresh")
+
+        self.assertEqual(list(state.pending_remember_proposals), [token])
+
 if __name__ == "__main__":
     unittest.main()
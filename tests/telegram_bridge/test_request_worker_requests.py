@@ -47,6 +47,32 @@ class TestRequestWorkerRequests(unittest.TestCase):
             request,
         )
 
+    def test_start_message_worker_submits_to_state_worker_pool(self):
+        worker_pool = mock.Mock()
+        request = mock.Mock(state=State(worker_pool=worker_pool))
+
+        with mock.patch.object(request_worker_requests, "start_background_worker") as start_background_worker:
+            request_worker_requests.start_message_worker(request)
+
+        start_background_worker.assert_not_called()
+        worker_pool.submit.assert_called_once_with(
+            request_worker_requests._process_message_worker_request,
+            request,
+        )
+
+    def test_start_message_worker_falls_back_when_worker_pool_is_shut_down(self):
+        worker_pool = mock.Mock()
+        worker_pool.submit.side_effect = RuntimeError("cannot schedule new futures after shutdown")
+        request = mock.Mock(state=State(worker_pool=worker_pool))
+
+        with mock.patch.object(request_worker_requests, "start_background_worker") as start_background_worker:
+            request_worker_requests.start_message_worker(request)
+
+        start_background_worker.assert_called_once_with(
+            request_worker_requests._process_message_worker_request,
+            request,
+        )
+
     def test_start_youtube_worker_uses_background_worker_helper(self):
         request = object()
 
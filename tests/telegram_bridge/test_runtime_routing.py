@@ -3,6 +3,7 @@ import sys
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
+from unittest import mock
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -132,6 +133,21 @@ class RuntimeRoutingTests(unittest.TestCase):
         self.assertIn("Server3 Runtime Observer priority mode is active.", result.prompt_input)
         self.assertIn("runtime_observer_ctl.sh", result.prompt_input)
 
+    def test_apply_priority_keyword_routing_skips_extractors_for_non_keyword_text(self) -> None:
+        config = SimpleNamespace(keyword_routing_enabled=True)
+
+        with mock.patch.object(runtime_routing, "extract_ha_keyword_request") as extract_ha:
+            result = runtime_routing.apply_priority_keyword_routing(
+                config=config,
+                prompt_input="/status please",
+                command="/status",
+                chat_id=1,
+            )
+
+        extract_ha.assert_not_called()
+        self.assertFalse(result.priority_keyword_mode)
+        self.assertEqual(result.command, "/status")
+
     def test_apply_priority_keyword_routing_routes_youtube_links(self) -> None:
         config = SimpleNamespace(keyword_routing_enabled=True)
 
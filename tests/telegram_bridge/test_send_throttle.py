@@ -0,0 +1,80 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_ROOT = ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from telegram_bridge.send_throttle import SendThrottle, TokenBucket, prune_full_buckets
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+class TestSendThrottle(unittest.TestCase):
+    def _throttle(self, clock):
+        return SendThrottle(2.0, 2.0, 1.0, 1.0, clock=clock, sleep=clock.sleep)
+
+    def test_sends_within_burst_do_not_sleep(self):
+        clock = _FakeClock()
+        throttle = self._throttle(clock)
+
+        self.assertEqual(throttle.acquire("chat-a"), 0.0)
+        self.assertEqual(throttle.acquire("chat-b"), 0.0)
+        self.assertEqual(clock.sleeps, [])
+
+    def test_global_and_per_chat_limits_queue_reservations(self):
+        clock = _FakeClock()
+        throttle = self._throttle(clock)
+
+        throttle.acquire("chat-a")
+        self.assertEqual(throttle.reserve("chat-a"), 1.0)
+        self.assertEqual(throttle.reserve("chat-b"), 0.5)
+
+        clock.now += 1.0
+        self.assertEqual(throttle.reserve(None), 0.0)
+        self.assertEqual(throttle.reserve(None), 0.5)
+
+    def test_idle_buckets_refill_to_burst(self):
+        clock = _FakeClock()
+        throttle = self._throttle(clock)
+
+        throttle.acquire("chat-a")
+        clock.now += 10.0
+
+        self.assertEqual(throttle.acquire("chat-a"), 0.0)
+        self.assertEqual(clock.sleeps, [])
+
+    def test_token_bucket_try_take_refuses_without_going_negative(self):
+        bucket = TokenBucket(2.0 / 60.0, 2, now=0.0)
+
+        self.assertTrue(bucket.try_take(0.0))
+        self.assertTrue(bucket.try_take(0.0))
+        self.assertFalse(bucket.try_take(10.0))
+        self.assertTrue(bucket.try_take(30.0))
+        self.assertFalse(bucket.try_take(30.0))
+
+    def test_prune_full_buckets_keeps_only_partially_drained_buckets(self):
+        idle = TokenBucket(1.0, 2, now=0.0)
+        busy = TokenBucket(1.0, 2, now=0.0)
+        busy.try_take(0.0)
+        buckets = {"idle": idle, "busy": busy}
+
+        prune_full_buckets(buckets, 0.5)
+
+        self.assertEqual(list(buckets), ["busy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -97,6 +97,69 @@ class TestSessions(unittest.TestCase):
         self.assertTrue(client.messages)
         self.assertIn("workers are currently in use", client.messages[-1][1])
 
+    def test_ensure_chat_worker_session_evicts_least_recently_used_idle_worker(self):
+        state = bridge.State(
+            worker_sessions={
+                "tg:2": bridge.WorkerSession(
+                    created_at=1.0,
+                    last_used_at=10.0,
+                    thread_id="thread-2",
+                    policy_fingerprint="fp",
+                ),
+                "tg:3": bridge.WorkerSession(
+                    created_at=1.0,
+                    last_used_at=20.0,
+                    thread_id="thread-3",
+                    policy_fingerprint="fp",
+                ),
+            },
+        )
+        bridge.StateRepository(state).set_thread_id("tg:2", "thread-2b")
+        client = FakeTelegramClient()
+        config = make_config(
+            persistent_workers_enabled=True,
+            persistent_workers_max=2,
+            persistent_workers_idle_timeout_seconds=3600,
+        )
+
+        allowed = bridge.ensure_chat_worker_session(state, config, client, chat_id=1, message_id=99)
+
+        self.assertTrue(allowed)
+        self.assertEqual(list(state.worker_sessions), ["tg:2", "tg:1"])
+        self.assertIn("session was closed", client.messages[0][1])
+
+    def test_ensure_chat_worker_session_prefers_evicting_low_hit_idle_worker(self):
+        state = bridge.State(
+            worker_sessions={
+                "tg:2": bridge.WorkerSession(
+                    created_at=1.0,
+                    last_used_at=10.0,
+                    thread_id="thread-2",
+                    policy_fingerprint="fp",
+                    hit_count=5,
+                ),
+                "tg:3": bridge.WorkerSession(
+                    created_at=1.0,
+                    last_used_at=20.0,
+                    thread_id="thread-3",
+                    policy_fingerprint="fp",
+                    hit_count=1,
+                ),
+            },
+        )
+        client = FakeTelegramClient()
+        config = make_config(
+            persistent_workers_enabled=True,
+            persistent_workers_max=2,
+            persistent_workers_idle_timeout_seconds=3600,
+        )
+
+        allowed = bridge.ensure_chat_worker_session(state, config, client, chat_id=1, message_id=99)
+
+        self.assertTrue(allowed)
+        self.assertEqual(list(state.worker_sessions), ["tg:2", "tg:1"])
+        self.assertEqual(state.worker_sessions["tg:1"].hit_count, 1)
+
     def test_build_canonical_sessions_from_legacy(self):
         worker = bridge.WorkerSession(
             created_at=1.0,
@@ -388,21 +451,69 @@ class TestSessions(unittest.TestCase):
 
         self.assertIn("tg:2", state.worker_sessions)
 
+    def test_expire_idle_worker_sessions_stops_at_first_fresh_legacy_worker(self):
+        state = bridge.State(
+            worker_sessions={
+                "tg:2": bridge.WorkerSession(
+                    created_at=1.0,
+                    last_used_at=10.0,
+                    thread_id="thread-2",
+                    policy_fingerprint="fp",
+                ),
+                "tg:3": bridge.WorkerSession(
+                    created_at=1.0,
+                    last_used_at=20.0,
+                    thread_id="thread-3",
+                    policy_fingerprint="fp",
+                ),
+                "tg:1": bridge.WorkerSession(
+                    created_at=1.0,
+                    last_used_at=90.0,
+                    thread_id="thread-1",
+                    policy_fingerprint="fp",
+                ),
+            },
+        )
+        state.busy_chats.add("tg:2")
+        client = FakeTelegramClient()
+        config = make_config(
+            persistent_workers_enabled=True,
+            persistent_workers_idle_timeout_seconds=60,
+        )
+
+        with mock.patch.object(bridge_session_manager.time, "time", return_value=100.0):
+            bridge.expire_idle_worker_sessions(state, config, client)
+
+        self.assertEqual(list(state.worker_sessions), ["tg:2", "tg:1"])
+
     def test_finalize_chat_work_clears_busy_when_inflight_clear_fails(self):
         state = bridge.State()
         state.busy_chats.add(1)
         client = FakeTelegramClient()
 
-        class FailingStateRepo:
-            def __init__(self, _state):
-                pass
+        with mock.patch.object(
+            bridge_session_manager,
+            "clear_in_flight_request_locked",
+            side_effect=RuntimeError("boom"),
+        ):
+            bridge_session_manager.finalize_chat_work(state, client, chat_id=1)
+        self.assertNotIn("tg:1", state.busy_chats)
 
-            def clear_in_flight_request(self, _chat_id):
-                raise RuntimeError("boom")
+    def test_finalize_chat_work_clears_in_flight_and_hands_off_queued_restart(self):
+        state = bridge.State(in_flight_requests={"tg:1": {"started_at": 1.0}})
+        state.busy_chats.add("tg:1")
+        state.restart_requested = True
+        state.restart_chat_id = 2
+        client = FakeTelegramClient()
 
-        with mock.patch.object(bridge_session_manager, "StateRepository", FailingStateRepo):
+        with mock.patch.object(bridge_session_manager, "trigger_restart_async") as trigger_restart:
             bridge_session_manager.finalize_chat_work(state, client, chat_id=1)
-        self.assertNotIn("tg:1", state.busy_chats)
+
+        self.assertEqual(state.in_flight_requests, {})
+        self.assertFalse(state.busy_chats)
+        self.assertTrue(state.restart_in_progress)
+        self.assertIn("Restarting bridge now", client.messages[-1][1])
+        trigger_restart.assert_called_once_with(state, client, 2, None, None)
 
 if __name__ == "__main__":
     unittest.main()
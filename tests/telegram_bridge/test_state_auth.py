@@ -39,6 +39,7 @@ import telegram_bridge.prompt_execution as bridge_prompt_execution
 import telegram_bridge.session_manager as bridge_session_manager
 import telegram_bridge.signal_channel as bridge_signal_channel
 import telegram_bridge.special_request_processing as bridge_special_request_processing
+import telegram_bridge.state_store as bridge_state_store
 import telegram_bridge.structured_logging as bridge_structured_logging
 import telegram_bridge.transport as bridge_transport
 import telegram_bridge.voice_alias_commands as bridge_voice_alias_commands
@@ -53,6 +54,19 @@ class TestStateAuth(unittest.TestCase):
                 "",
             )
         )
+        self.assertTrue(
+            bridge_executor.should_reset_thread_after_resume_failure(
+                "",
+                "Error: COULD NOT FIND THREAD abc",
+            )
+        )
+        noise = "x" * (bridge_executor.THREAD_RESET_SCAN_WINDOW_CHARS * 2)
+        self.assertTrue(
+            bridge_executor.should_reset_thread_after_resume_failure(f"{noise}\nsession not found", "")
+        )
+        self.assertFalse(
+            bridge_executor.should_reset_thread_after_resume_failure(f"{noise}session not found{noise}", "")
+        )
         self.assertFalse(
             bridge_executor.should_reset_thread_after_resume_failure(
                 "permission denied",
@@ -91,7 +105,7 @@ class TestStateAuth(unittest.TestCase):
             self.assertFalse(Path(state.in_flight_path).exists())
 
             repo.clear_thread_id(1)
-            threads_after = json.loads(Path(state.chat_thread_path).read_text(encoding="utf-8"))
+            threads_after = bridge_state_store.load_chat_threads(state.chat_thread_path)
             self.assertEqual(threads_after, {})
 
     def test_state_repository_concurrent_inflight_persistence_is_safe(self):
@@ -1,4 +1,5 @@
 import json
+import os
 import sys
 import tempfile
 import unittest
@@ -11,6 +12,7 @@ BRIDGE_DIR = ROOT / "src" / "telegram_bridge"
 if str(BRIDGE_DIR) not in sys.path:
     sys.path.insert(0, str(BRIDGE_DIR))
 
+import background_tasks
 import state_store
 import canonical_state_store
 import request_runtime_state_store
@@ -57,6 +59,220 @@ class StateStoreUnitTests(unittest.TestCase):
             loaded = scope_state_store.load_json_object(tilde_path, state_label="chat thread")
             self.assertEqual(loaded, {"tg:1": "thread-1"})
 
+    def test_load_json_object_treats_missing_file_as_empty_and_rejects_bad_json(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = Path(tmpdir) / "chat_threads.json"
+            self.assertEqual(scope_state_store.load_json_object(str(json_path), state_label="chat thread"), {})
+
+            json_path.write_text('{"tg:1": ', encoding="utf-8")
+            with self.assertRaisesRegex(ValueError, "Failed to parse chat thread state"):
+                scope_state_store.load_json_object(str(json_path), state_label="chat thread")
+
+    def test_persist_json_state_file_non_atomic_rewrites_in_place(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = Path(tmpdir) / "in_flight_requests.json"
+            json_path.write_text('{"tg:9": {"started_at": 9.0, "padding": "xxxxxxxx"}}', encoding="utf-8")
+
+            with mock.patch.object(scope_state_store.tempfile, "mkstemp") as mkstemp:
+                scope_state_store.persist_json_state_file(
+                    str(json_path),
+                    {"tg:1": {"started_at": 1.0}},
+                    fsync_file=False,
+                    pretty=False,
+                    atomic=False,
+                )
+
+            mkstemp.assert_not_called()
+            self.assertEqual(
+                json.loads(json_path.read_text(encoding="utf-8")),
+                {"tg:1": {"started_at": 1.0}},
+            )
+            self.assertEqual(list(Path(tmpdir).iterdir()), [json_path])
+
+    def test_thread_and_override_reads_do_not_take_the_state_lock(self):
+        state = state_store.State(chat_threads={"tg:1": "thread-1"}, chat_engines={"tg:1": "codex"})
+
+        with state.lock:
+            self.assertEqual(state_store.get_thread_id(state, "tg:1"), "thread-1")
+            self.assertEqual(scope_state_store.get_chat_engine(state, "tg:1"), "codex")
+
+    def test_chat_engine_override_writes_the_snapshot_taken_with_the_update(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            engine_path = Path(tmpdir) / "chat_engines.json"
+            state = scope_state_store.State(chat_engine_path=str(engine_path))
+
+            scope_state_store.set_chat_engine(state, "tg:1", " Codex ")
+            scope_state_store.set_chat_engine(state, "tg:2", "pi")
+            self.assertTrue(scope_state_store.clear_chat_engine(state, "tg:2"))
+            self.assertFalse(scope_state_store.clear_chat_engine(state, "tg:2"))
+
+            self.assertEqual(json.loads(engine_path.read_text(encoding="utf-8")), {"tg:1": "codex"})
+
+    def test_chat_thread_persist_requests_coalesce_until_flusher_closes(self):
+        flush = mock.Mock()
+        state = scope_state_store.State(
+            chat_thread_flusher=background_tasks.DebouncedFlusher(flush, delay_seconds=30.0),
+        )
+
+        with mock.patch.object(scope_state_store, "persist_chat_threads") as persist_chat_threads:
+            for _ in range(3):
+                scope_state_store.request_chat_threads_persist(state)
+            flush.assert_not_called()
+            state.chat_thread_flusher.close()
+            flush.assert_called_once_with()
+
+            scope_state_store.request_chat_threads_persist(state)
+
+        persist_chat_threads.assert_called_once_with(state)
+
+    def test_worker_session_persist_requests_use_flusher_when_open(self):
+        flusher = mock.Mock()
+        flusher.mark_dirty.side_effect = [True, False]
+        state = request_runtime_state_store.State(worker_session_flusher=flusher)
+
+        with mock.patch.object(request_runtime_state_store, "persist_worker_sessions") as persist_worker_sessions:
+            request_runtime_state_store.request_worker_sessions_persist(state)
+            persist_worker_sessions.assert_not_called()
+            request_runtime_state_store.request_worker_sessions_persist(state)
+
+        persist_worker_sessions.assert_called_once_with(state)
+
+    def test_journaled_state_file_appends_changes_and_compacts(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = Path(tmpdir) / "chat_threads.json"
+            journal_path = Path(scope_state_store.state_journal_path(str(json_path)))
+
+            self.assertEqual(
+                scope_state_store.load_journaled_json_object(str(json_path), state_label="chat thread"),
+                {},
+            )
+            scope_state_store.persist_journaled_state_file(
+                str(json_path),
+                {"tg:1": "thread-1", "tg:2": "thread-2"},
+                fsync_file=False,
+            )
+            scope_state_store.persist_journaled_state_file(
+                str(json_path),
+                {"tg:2": "thread-2b"},
+                fsync_file=False,
+            )
+
+            self.assertFalse(json_path.exists())
+            self.assertEqual(len(journal_path.read_text(encoding="utf-8").splitlines()), 4)
+            with journal_path.open("a", encoding="utf-8") as handle:
+                handle.write('{"k":"tg:3","v":"to')
+            self.assertEqual(
+                scope_state_store.load_journaled_json_object(str(json_path), state_label="chat thread"),
+                {"tg:2": "thread-2b"},
+            )
+
+            with mock.patch.object(scope_state_store, "STATE_JOURNAL_COMPACT_MIN_RECORDS", 4), mock.patch.object(
+                scope_state_store,
+                "STATE_JOURNAL_COMPACT_RATIO",
+                1,
+            ):
+                scope_state_store.persist_journaled_state_file(
+                    str(json_path),
+                    {"tg:2": "thread-2c"},
+                    fsync_file=False,
+                )
+
+            self.assertFalse(journal_path.exists())
+            self.assertEqual(
+                json.loads(json_path.read_text(encoding="utf-8")),
+                {"tg:2": "thread-2c"},
+            )
+
+    def test_journal_records_after_a_torn_tail_survive_reload(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = str(Path(tmpdir) / "chat_threads.json")
+            journal_path = Path(scope_state_store.state_journal_path(json_path))
+            scope_state_store.load_journaled_json_object(json_path, state_label="chat thread")
+            scope_state_store.persist_journaled_state_file(json_path, {"tg:1": "thread-1"}, fsync_file=False)
+            scope_state_store.close_state_journals()
+            with journal_path.open("a", encoding="utf-8") as handle:
+                handle.write('{"k":"tg:2","v":"to')
+
+            loaded = scope_state_store.load_journaled_json_object(json_path, state_label="chat thread")
+            scope_state_store.persist_journaled_state_file(
+                json_path,
+                {**loaded, "tg:3": "thread-3"},
+                fsync_file=False,
+            )
+            scope_state_store.close_state_journals()
+
+            self.assertEqual(
+                scope_state_store.load_journaled_json_object(json_path, state_label="chat thread"),
+                {"tg:1": "thread-1", "tg:3": "thread-3"},
+            )
+            scope_state_store.close_state_journals()
+
+    def test_journal_appends_reuse_one_handle_until_compaction(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = str(Path(tmpdir) / "chat_threads.json")
+            journal_path = scope_state_store.state_journal_path(json_path)
+            scope_state_store.load_journaled_json_object(json_path, state_label="chat thread")
+
+            with mock.patch.object(scope_state_store.os, "open", wraps=os.open) as os_open:
+                for index in range(3):
+                    scope_state_store.persist_journaled_state_file(
+                        json_path,
+                        {"tg:1": f"thread-{index}"},
+                        fsync_file=False,
+                    )
+
+            self.assertEqual(os_open.call_count, 1)
+            self.assertEqual(len(Path(journal_path).read_text(encoding="utf-8").splitlines()), 3)
+            scope_state_store._compact_state_journal_locked(json_path, {"tg:1": "thread-2"}, fsync_file=False)
+            self.assertNotIn(journal_path, scope_state_store._JOURNAL_FDS)
+
+    def test_close_state_journals_closes_open_journal_handles(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = str(Path(tmpdir) / "chat_threads.json")
+            journal_path = scope_state_store.state_journal_path(json_path)
+            scope_state_store.load_journaled_json_object(json_path, state_label="chat thread")
+            scope_state_store.persist_journaled_state_file(json_path, {"tg:1": "thread-1"}, fsync_file=False)
+            self.assertIn(journal_path, scope_state_store._JOURNAL_FDS)
+
+            scope_state_store.close_state_journals()
+
+            self.assertNotIn(journal_path, scope_state_store._JOURNAL_FDS)
+            scope_state_store.persist_journaled_state_file(json_path, {"tg:1": "thread-2"}, fsync_file=False)
+            self.assertEqual(len(Path(journal_path).read_text(encoding="utf-8").splitlines()), 2)
+            scope_state_store.close_state_journals()
+
+    def test_persist_skips_snapshot_older_than_the_last_write(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = Path(tmpdir) / "chat_goals.json"
+            older = scope_state_store.next_snapshot_sequence()
+            newer = scope_state_store.next_snapshot_sequence()
+
+            scope_state_store.persist_json_state_file(str(json_path), {"tg:1": "new"}, sequence=newer)
+            scope_state_store.persist_json_state_file(str(json_path), {"tg:1": "old"}, sequence=older)
+            self.assertEqual(json.loads(json_path.read_text(encoding="utf-8")), {"tg:1": "new"})
+
+            scope_state_store.persist_json_state_file(str(json_path), {"tg:1": "unsequenced"})
+            self.assertEqual(json.loads(json_path.read_text(encoding="utf-8")), {"tg:1": "unsequenced"})
+
+    def test_persist_worker_sessions_fsyncs_only_when_durable(self):
+        for durable in (False, True):
+            state = request_runtime_state_store.State(
+                worker_sessions_path="/tmp/worker_sessions.json",
+                persist_durable=durable,
+            )
+            with mock.patch.object(
+                request_runtime_state_store,
+                "persist_journaled_state_file",
+            ) as persist_journaled_state_file:
+                request_runtime_state_store.persist_worker_sessions(state)
+
+            persist_journaled_state_file.assert_called_once_with(
+                "/tmp/worker_sessions.json",
+                {},
+                fsync_file=durable,
+                sequence=mock.ANY,
+            )
+
     def test_persist_in_flight_snapshot_skips_per_write_fsync(self):
         with mock.patch.object(
             request_runtime_state_store,
@@ -73,6 +289,7 @@ class StateStoreUnitTests(unittest.TestCase):
             fsync_file=False,
             pretty=False,
             delete_when_empty=True,
+            atomic=False,
         )
 
     def test_persist_in_flight_snapshot_skips_idle_wait_when_uncontended(self):
@@ -95,6 +312,7 @@ class StateStoreUnitTests(unittest.TestCase):
             fsync_file=False,
             pretty=False,
             delete_when_empty=True,
+            atomic=False,
         )
 
     def test_persist_in_flight_snapshot_skips_rewriting_identical_snapshot(self):
@@ -118,6 +336,7 @@ class StateStoreUnitTests(unittest.TestCase):
             fsync_file=False,
             pretty=False,
             delete_when_empty=True,
+            atomic=False,
         )
 
     def test_persist_in_flight_snapshot_skips_idle_wait_after_deduped_contention(self):
@@ -125,12 +344,13 @@ class StateStoreUnitTests(unittest.TestCase):
         release_write = request_runtime_state_store.threading.Event()
         write_started = request_runtime_state_store.threading.Event()
 
-        def blocking_persist(path_value, serialized, *, fsync_file, pretty, delete_when_empty):
+        def blocking_persist(path_value, serialized, *, fsync_file, pretty, delete_when_empty, atomic):
             self.assertEqual(path_value, "/tmp/in_flight_requests.json")
             self.assertEqual(serialized, payload)
             self.assertFalse(fsync_file)
             self.assertFalse(pretty)
             self.assertTrue(delete_when_empty)
+            self.assertFalse(atomic)
             write_started.set()
             release_write.wait(timeout=5.0)
 
@@ -147,6 +147,9 @@ class TestTransport(unittest.TestCase):
             config = bridge.load_config()
         self.assertEqual(config.signal_bridge_api_base, "http://127.0.0.1:18797")
 
+    def test_channel_bridges_share_the_transport_connection_pool(self):
+        self.assertIs(bridge_http_channel.urlopen, bridge_transport.urlopen)
+
     def test_whatsapp_adapter_send_message_get_id_posts_json(self):
         class Response:
             def __enter__(self):
@@ -249,6 +252,69 @@ class TestTransport(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             adapter.edit_message(chat_id=1, message_id=2, text="ignored")
 
+    def test_transport_send_message_sends_chunks_in_order_with_shared_fields(self):
+        client = bridge.TelegramClient(make_config())
+        text = "a" * bridge_transport.TELEGRAM_CHUNK_LIMIT + "b" * 10
+        with mock.patch.object(client, "_request", return_value={"ok": True}) as request_mock:
+            client.send_message(
+                chat_id=1,
+                text=text,
+                reply_to_message_id=5,
+                reply_markup={"inline_keyboard": []},
+            )
+
+        payloads = [call.args[1] for call in request_mock.call_args_list]
+        self.assertEqual([payload["text"] for payload in payloads], bridge_transport.to_telegram_chunks(text))
+        self.assertEqual(payloads[1]["text"], "[2/2]\n" + "b" * 10)
+        for payload in payloads:
+            self.assertEqual(payload["chat_id"], 1)
+            self.assertEqual(payload["reply_to_message_id"], 5)
+            self.assertEqual(payload["disable_web_page_preview"], True)
+            self.assertEqual(payload["reply_markup"], {"inline_keyboard": []})
+
+    def test_transport_get_updates_treats_expired_long_poll_as_empty_tick(self):
+        config = make_config()
+        config.retry_sleep_seconds = 5.0
+        client = bridge.TelegramClient(config)
+        with (
+            mock.patch.object(bridge_transport, "urlopen", side_effect=TimeoutError("timed out")) as mocked,
+            mock.patch.object(bridge_transport.time, "sleep") as sleep_mock,
+        ):
+            self.assertEqual(client.get_updates(0, timeout_seconds=20), [])
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(mocked.call_args.kwargs["timeout"], 20 + bridge_transport.TELEGRAM_LONG_POLL_READ_SLACK_SECONDS)
+        sleep_mock.assert_not_called()
+
+    def test_transport_get_updates_raises_repeated_or_short_poll_timeouts(self):
+        client = bridge.TelegramClient(make_config())
+        limit = bridge_transport.TELEGRAM_LONG_POLL_TIMEOUT_STREAK_LIMIT
+        with mock.patch.object(bridge_transport, "urlopen", side_effect=TimeoutError("timed out")):
+            for _ in range(limit - 1):
+                self.assertEqual(client.get_updates(0, timeout_seconds=20), [])
+            with self.assertRaises(TimeoutError):
+                client.get_updates(0, timeout_seconds=20)
+            self.assertEqual(client.get_updates(0, timeout_seconds=20), [])
+            with self.assertRaises(TimeoutError):
+                client.get_updates(0, timeout_seconds=0)
+
+    def test_transport_get_updates_sends_allowed_updates_until_acknowledged(self):
+        client = bridge.TelegramClient(make_config())
+        with mock.patch.object(
+            client,
+            "_request",
+            side_effect=[RuntimeError("poll failed"), {"ok": True, "result": []}, {"ok": True, "result": []}],
+        ) as request_mock:
+            with self.assertRaises(RuntimeError):
+                client.get_updates(0, timeout_seconds=0)
+            client.get_updates(0, timeout_seconds=0)
+            client.get_updates(0, timeout_seconds=0)
+
+        payloads = [call.args[1] for call in request_mock.call_args_list]
+        self.assertEqual(payloads[0]["allowed_updates"], ["message", "callback_query"])
+        self.assertIn("allowed_updates", payloads[1])
+        self.assertNotIn("allowed_updates", payloads[2])
+
     def test_transport_send_media_remote_uses_request_payload(self):
         config = make_config()
         client = bridge.TelegramClient(config)
@@ -288,6 +354,18 @@ class TestTransport(unittest.TestCase):
         finally:
             Path(voice_path).unlink(missing_ok=True)
 
+    def test_transport_backoff_jitters_exponential_delay_but_honors_retry_after(self):
+        config = make_config()
+        config.retry_sleep_seconds = 1.0
+        client = bridge.TelegramClient(config)
+        transient = bridge_transport.URLError("down")
+
+        delays = {client._compute_backoff_seconds(transient, 2) for _ in range(20)}
+        self.assertTrue(all(3.2 <= delay <= 4.8 for delay in delays))
+        self.assertGreater(len(delays), 1)
+        retry_after = bridge_transport.TelegramApiError("sendMessage", "Too Many Requests", 429, 3.0)
+        self.assertEqual(client._compute_backoff_seconds(retry_after, 2), 3.0)
+
     def test_transport_retries_transient_http_error_then_succeeds(self):
         config = make_config()
         config.retry_sleep_seconds = 0.0
@@ -320,9 +398,96 @@ class TestTransport(unittest.TestCase):
             fp=io.BytesIO(transient_body),
         )
         with mock.patch.object(bridge_transport, "urlopen", side_effect=[transient_error, Response()]) as mocked:
-            client.send_message(chat_id=1, text="hello")
+            with mock.patch.object(client._send_throttle, "acquire") as acquire:
+                client.send_message(chat_id=1, text="hello")
 
         self.assertEqual(mocked.call_count, 2)
+        self.assertEqual(acquire.call_args_list, [mock.call(1), mock.call(1)])
+        request = mocked.call_args.args[0]
+        self.assertEqual(request.get_header("Content-type"), "application/json")
+        self.assertEqual(json.loads(request.data.decode("utf-8"))["text"], "hello")
+
+    def test_multipart_retry_resends_the_same_body(self):
+        config = make_config()
+        config.retry_sleep_seconds = 0.0
+        setattr(config, "api_max_attempts", 2)
+        client = bridge.TelegramClient(config)
+
+        class Response:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+            def read(self):
+                return b'{"ok": true, "result": {"message_id": 1}}'
+
+        transient_error = bridge_transport.HTTPError(
+            url="https://api.telegram.org",
+            code=503,
+            msg="Service Unavailable",
+            hdrs=None,
+            fp=io.BytesIO(b'{"ok": false, "error_code": 503, "description": "Service Unavailable"}'),
+        )
+        with mock.patch.object(bridge_transport, "urlopen", side_effect=[transient_error, Response()]) as mocked:
+            with mock.patch.object(client._send_throttle, "acquire"):
+                client._request_multipart(
+                    "sendDocument",
+                    {"chat_id": "1"},
+                    "document",
+                    "a.txt",
+                    b"payload",
+                    "text/plain",
+                )
+
+        first, second = (call.args[0] for call in mocked.call_args_list)
+        self.assertIs(first.data, second.data)
+        self.assertIn(b"payload", second.data)
+
+    def test_download_file_to_handle_rejects_declared_oversize_before_reading(self):
+        client = bridge.TelegramClient(make_config())
+
+        class Response:
+            headers = {"Content-Length": "4096"}
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+            def readinto(self, buffer):
+                raise AssertionError("body should not be read")
+
+        handle = io.BytesIO()
+        with mock.patch.object(bridge_transport, "urlopen", return_value=Response()):
+            with self.assertRaises(ValueError):
+                client.download_file_to_handle("files/a.bin", handle, 1024)
+        self.assertEqual(handle.getvalue(), b"")
+
+    def test_download_file_to_handle_reads_at_most_one_byte_past_cap(self):
+        client = bridge.TelegramClient(make_config())
+        body = io.BytesIO(b"x" * 5000)
+        requested = []
+
+        class Response:
+            headers = {}
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+            def readinto(self, buffer):
+                requested.append(len(buffer))
+                return body.readinto(buffer)
+
+        with mock.patch.object(bridge_transport, "urlopen", return_value=Response()):
+            with self.assertRaises(ValueError):
+                client.download_file_to_handle("files/a.bin", io.BytesIO(), 1024)
+        self.assertEqual(requested, [1025])
 
     def test_transport_does_not_retry_non_transient_http_error(self):
         config = make_config()
@@ -468,3 +633,44 @@ class TestTransport(unittest.TestCase):
         with self.assertRaises(ValueError):
             bridge.download_telegram_file_to_temp(client, spec)
         self.assertEqual(client.download_calls, 0)
+
+    def test_download_helper_trims_preallocation_to_streamed_size(self):
+        client = FakeDownloadClient({"file_path": "files/example.pdf", "file_size": 4096})
+        spec = bridge.TelegramFileDownloadSpec(
+            file_id="abc",
+            max_bytes=8192,
+            size_label="File",
+            temp_prefix="telegram-bridge-document-",
+            default_suffix=".bin",
+            too_large_label="File",
+        )
+        tmp_path, reported_size = bridge.download_telegram_file_to_temp(client, spec)
+        try:
+            self.assertEqual(reported_size, 4096)
+            self.assertEqual(Path(tmp_path).read_bytes(), b"x")
+        finally:
+            os.remove(tmp_path)
+
+    def test_download_helper_leaves_no_file_when_stream_fails(self):
+        client = FakeDownloadClient({"file_path": "files/example.jpg", "file_size": 4096})
+        client.download_file_to_handle = mock.Mock(side_effect=ValueError("Image too large"))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spec = bridge.TelegramFileDownloadSpec(
+                file_id="abc",
+                max_bytes=8192,
+                size_label="Image",
+                temp_prefix="telegram-bridge-photo-",
+                default_suffix=".jpg",
+                too_large_label="Image",
+                temp_dir=temp_dir,
+            )
+            with self.assertRaises(ValueError):
+                bridge.download_telegram_file_to_temp(client, spec)
+            self.assertEqual(os.listdir(temp_dir), [])
+
+            client.download_file_to_handle = FakeDownloadClient({}).download_file_to_handle
+            tmp_path, _ = bridge.download_telegram_file_to_temp(client, spec)
+            self.assertEqual(os.path.dirname(tmp_path), temp_dir)
+            self.assertTrue(os.path.basename(tmp_path).startswith("telegram-bridge-photo-"))
+            self.assertTrue(tmp_path.endswith(".jpg"))
+            self.assertEqual(Path(tmp_path).read_bytes(), b"x")